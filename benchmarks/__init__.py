@@ -0,0 +1,11 @@
+"""
+Benchmarks headless de rootFramework (pilotes SDL « dummy »).
+
+Utilisation, depuis la racine du dépôt :
+
+    python -m benchmarks                      # tous les scénarios, comparés à benchmarks/baseline.json
+    python -m benchmarks physics timers       # scénarios choisis
+    python -m benchmarks --update-baseline    # enregistre les résultats comme nouvelle référence
+
+Sans référence, le code de sortie est 1 (sauf avec --allow-missing-baseline).
+"""
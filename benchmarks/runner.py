@@ -0,0 +1,145 @@
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+from concurrent.futures import ProcessPoolExecutor
+
+from .scenarios import SCENARIOS, measure_startup, run_scenario
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Mesures comparées à la référence : une hausse au-delà du seuil est une régression
+COMPARED_METRICS = ("mean_ms", "p95_ms", "peak_memory_kb")
+
+# Budget absolu de démarrage (médianes, ms) : import de rootFramework hors pygame,
+# rf.init(subsystems=["font"]) et création d'un Manager
+STARTUP_BUDGET_MS = {"import_ms": 25.0, "init_ms": 150.0, "manager_ms": 25.0}
+
+def run_isolated(name: str, iterations: int, warmup: int, scale: float) -> dict[str, float]:
+    """Exécute un scénario dans un processus neuf (singletons, caches et mémoire non partagés)."""
+    with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return executor.submit(run_scenario, name, iterations, warmup, scale).result()
+
+
+def compare(results: dict, baseline: dict, threshold: float, thresholds: dict[str, float]) -> list[str]:
+    """Retourne la liste des régressions par rapport à la référence."""
+    regressions = []
+    for name, metrics in results.items():
+        reference = baseline.get("scenarios", {}).get(name)
+        if reference is None:
+            continue
+        for metric in COMPARED_METRICS:
+            if metric not in metrics or not reference.get(metric):
+                continue
+            limit = thresholds.get(metric, threshold)
+            change = metrics[metric] / reference[metric] - 1.0
+            if change > limit:
+                regressions.append(
+                    f"{name}.{metric}: {reference[metric]:.3f} -> {metrics[metric]:.3f} "
+                    f"(+{change:.0%}, seuil {limit:.0%})"
+                )
+    return regressions
+
+
+def check_startup_budget(metrics: dict[str, float], budget: dict[str, float]) -> list[str]:
+    """Retourne les dépassements du budget de démarrage."""
+    return [
+        f"startup.{metric}: {metrics[metric]:.3f} ms > budget {limit:.3f} ms"
+        for metric, limit in budget.items()
+        if metrics.get(metric, 0.0) > limit
+    ]
+
+
+def print_results(results: dict, baseline: dict) -> None:
+    for name, metrics in results.items():
+        reference = baseline.get("scenarios", {}).get(name, {})
+        print(f"{name}")
+        for metric, value in metrics.items():
+            line = f"  {metric:<16}{value:>12.3f}"
+            if reference.get(metric):
+                line += f"   ({value / reference[metric] - 1.0:+.1%} vs référence)"
+            print(line)
+
+
+def parse_thresholds(values: list[str]) -> dict[str, float]:
+    """Analyse les seuils par mesure (« p95_ms=0.25 »)."""
+    thresholds = {}
+    for value in values:
+        metric, _, limit = value.partition("=")
+        thresholds[metric] = float(limit)
+    return thresholds
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmarks headless de rootFramework.")
+    parser.add_argument("scenarios", nargs="*", metavar="SCÉNARIO",
+                        help=f"scénarios à exécuter parmi startup, {', '.join(SCENARIOS)} (tous par défaut)")
+    parser.add_argument("--iterations", type=int, default=300, help="itérations mesurées par scénario")
+    parser.add_argument("--warmup", type=int, default=30, help="itérations d'échauffement (non mesurées)")
+    parser.add_argument("--scale", type=float, default=1.0, help="facteur appliqué au nombre d'objets")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="fichier JSON de référence")
+    parser.add_argument("--threshold", type=float, default=0.15, help="hausse tolérée (0.15 = +15 %%)")
+    parser.add_argument("--metric-threshold", action="append", default=[], metavar="MESURE=SEUIL",
+                        help="seuil propre à une mesure, ex. p95_ms=0.25")
+    parser.add_argument("--update-baseline", action="store_true", help="enregistre les résultats comme référence")
+    parser.add_argument("--allow-missing-baseline", action="store_true",
+                        help="réussit sans référence (sinon l'absence de référence est un échec)")
+    parser.add_argument("--startup-runs", type=int, default=15, help="démarrages mesurés pour le scénario startup")
+    parser.add_argument("--output", help="écrit aussi les résultats dans ce fichier JSON")
+    args = parser.parse_args(argv)
+
+    names = args.scenarios or ["startup", *SCENARIOS]
+    unknown = [name for name in names if name != "startup" and name not in SCENARIOS]
+    if unknown:
+        parser.error(f"scénario(s) inconnu(s) : {', '.join(unknown)}")
+    results = {}
+    for name in names:
+        if name == "startup":
+            results[name] = measure_startup(args.startup_runs)
+        else:
+            results[name] = run_isolated(name, args.iterations, args.warmup, args.scale)
+    budget_overruns = check_startup_budget(results["startup"], STARTUP_BUDGET_MS) if "startup" in results else []
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        if baseline.get("scale") != args.scale:
+            print(f"Référence mesurée avec --scale {baseline.get('scale')} : comparaison ignorée.")
+            baseline = {}
+
+    print_results(results, baseline)
+    report = {
+        "scale": args.scale,
+        "iterations": args.iterations,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scenarios": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+    if args.update_baseline:
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as file:
+                previous = json.load(file)
+            if previous.get("scale") == args.scale:
+                # Les scénarios non exécutés conservent leur référence
+                report["scenarios"] = {**previous.get("scenarios", {}), **results}
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        print(f"Référence enregistrée dans {args.baseline}.")
+
+    for overrun in budget_overruns:
+        print(f"BUDGET DÉPASSÉ {overrun}")
+    if args.update_baseline:
+        return 1 if budget_overruns else 0
+    if not baseline:
+        print("Aucune référence : lancer avec --update-baseline pour en créer une.")
+        return 1 if budget_overruns or not args.allow_missing_baseline else 0
+    regressions = compare(results, baseline, args.threshold, parse_thresholds(args.metric_threshold))
+    for regression in regressions:
+        print(f"RÉGRESSION {regression}")
+    return 1 if regressions or budget_overruns else 0
@@ -0,0 +1,210 @@
+import os
+import sys
+
+# Pilotes SDL factices : les benchmarks tournent sans fenêtre ni carte son
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+try:
+    import rootFramework as rf
+except ImportError:
+    # Exécution depuis le dépôt sans installation (pip install -e .)
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+    import rootFramework as rf
+
+import contextlib
+import io
+import json
+import pygame
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from typing import Callable
+
+SCREEN_SIZE = (640, 480)
+FRAME_DT = 1.0 / 60
+
+class BenchmarkScene(rf.Scene):
+    """Scène minimale : dessine ses entités dessinables du monde et du HUD."""
+
+    def update(self, dt: float) -> None:
+        pass
+
+    def draw(self) -> None:
+        self.screen.fill((0, 0, 0))
+        for entity in self.world_entities:
+            entity.draw(self.screen)
+        for entity in self.hud_entities:
+            entity.draw(self.screen)
+
+
+def create_manager(*entities: "rf.Entity") -> "rf.Manager":
+    """Crée un Manager avec une scène contenant les entités données."""
+    scene = BenchmarkScene("benchmark")
+    manager = rf.Manager(pygame.display.get_surface(), scene)
+    scene.add_world_entity(*entities)
+    return manager
+
+
+# ----------------------
+# Scénarios : chacun prépare son état et retourne la fonction d'une itération ;
+# les ressources à libérer en fin de mesure sont confiées à la pile cleanup
+# ----------------------
+def physics_scenario(scale: float, cleanup: contextlib.ExitStack) -> Callable[[], None]:
+    """PhysicalEntity soumises à la gravité (espacées : aucune collision effective)."""
+    count = max(1, int(300 * scale))
+    entities = []
+    for index in range(count):
+        entity = rf.PhysicalEntity()
+        entity.rect.size = (16, 16)
+        entity.set_position((index % 30) * 20, (index // 30) * 40)
+        entities.append(entity)
+    manager = create_manager(*entities)
+    return lambda: manager.step(FRAME_DT, render=False)
+
+
+def sprites_scenario(scale: float, cleanup: contextlib.ExitStack) -> Callable[[], None]:
+    """AnimatedSprite animés et dessinés à chaque frame."""
+    count = max(1, int(1000 * scale))
+    frames = []
+    for index in range(4):
+        frame = pygame.Surface((32, 32), pygame.SRCALPHA)
+        frame.fill((60 * index, 255 - 60 * index, 128, 255))
+        frames.append(frame)
+    sprites = []
+    for index in range(count):
+        sprite = rf.AnimatedSprite(default_frame_duration=0.05 + (index % 5) * 0.02)
+        sprite.add_animation_from_surfaces("idle", frames)
+        sprite.set_position((index * 13) % SCREEN_SIZE[0], (index * 7) % SCREEN_SIZE[1])
+        sprites.append(sprite)
+    manager = create_manager(*sprites)
+    return lambda: manager.step(FRAME_DT, render=True)
+
+
+def timers_scenario(scale: float, cleanup: contextlib.ExitStack) -> Callable[[], None]:
+    """Timer en boucle de durées variées (échéancier de Time)."""
+    count = max(1, int(10000 * scale))
+    fired = [0]
+
+    def on_end():
+        fired[0] += 1
+
+    for index in range(count):
+        rf.Timer(f"benchmark_{index}", 50 + (index * 37) % 950, loop=True, end_callback=on_end).start()
+    manager = create_manager()
+    return lambda: manager.step(FRAME_DT, render=False)
+
+
+def loading_scenario(scale: float, cleanup: contextlib.ExitStack) -> Callable[[], None]:
+    """ResourceManager.load_from_dir sur des images générées (caches vidés à chaque itération)."""
+    count = max(1, int(100 * scale))
+    directory = cleanup.enter_context(tempfile.TemporaryDirectory(prefix="rootframework_benchmark_"))
+    for index in range(count):
+        image = pygame.Surface((64, 64), pygame.SRCALPHA)
+        image.fill(((index * 7) % 256, (index * 13) % 256, (index * 29) % 256, 200))
+        pygame.image.save(image, os.path.join(directory, f"image_{index}.png"))
+    resource_manager = rf.ResourceManager()
+
+    def load():
+        resource_manager.clear_cache()
+        resource_manager.load_from_dir(directory)
+
+    return load
+
+
+SCENARIOS: dict[str, Callable[[float, contextlib.ExitStack], Callable[[], None]]] = {
+    "physics": physics_scenario,
+    "sprites": sprites_scenario,
+    "timers": timers_scenario,
+    "loading": loading_scenario,
+}
+
+
+# ----------------------
+# Démarrage : import du paquet et init(), mesurés dans des interpréteurs neufs
+# ----------------------
+STARTUP_CODE = """
+import json, sys, time
+sys.path[:0] = {paths!r}
+import pygame
+start = time.perf_counter()
+import rootFramework as rf
+imported = time.perf_counter()
+rf.init((320, 240), subsystems={subsystems!r})
+initialized = time.perf_counter()
+rf.Manager(pygame.display.get_surface())
+ready = time.perf_counter()
+print(json.dumps([imported - start, initialized - imported, ready - initialized]))
+"""
+
+def measure_startup(runs: int = 15, subsystems: tuple[str, ...] | None = ("font",)) -> dict[str, float]:
+    """
+    Mesure (médiane et max, en ms) l'import de rootFramework (hors pygame), rf.init
+    avec les sous-systèmes donnés (None = pygame.init) et la création d'un Manager.
+    """
+    paths = [os.path.dirname(os.path.dirname(rf.__file__))]
+    code = STARTUP_CODE.format(paths=paths, subsystems=subsystems)
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+
+    metrics = {}
+    for index, name in enumerate(("import", "init", "manager")):
+        values = sorted(sample[index] for sample in samples)
+        metrics[f"{name}_ms"] = percentile(values, 0.5) * 1000
+        metrics[f"{name}_max_ms"] = values[-1] * 1000
+    return metrics
+
+
+# ----------------------
+# Mesure
+# ----------------------
+def percentile(values: list[float], fraction: float) -> float:
+    """Percentile (0.0 à 1.0) d'une liste triée, par rang le plus proche."""
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def run_scenario(name: str, iterations: int = 300, warmup: int = 30, scale: float = 1.0) -> dict[str, float]:
+    """
+    Exécute un scénario et retourne ses mesures :
+    durée par itération (moyenne, percentiles, max, en ms), itérations par seconde,
+    mémoire allouée par la préparation et pic pendant l'échauffement (Kio, tracemalloc).
+    Prévu pour tourner dans un processus dédié (voir runner).
+    """
+    pygame.init()
+    pygame.display.set_mode(SCREEN_SIZE)
+    # Modules chargés avant la mesure : leur import ne compte pas dans la mémoire du scénario
+    for attribute in rf.LAZY_ATTRIBUTES:
+        getattr(rf, attribute)
+    # Les messages du framework (transitions, collisions...) faussent les mesures
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.ExitStack() as cleanup:
+        tracemalloc.start()
+        iterate = SCENARIOS[name](scale, cleanup)
+        allocated, _ = tracemalloc.get_traced_memory()
+        for _ in range(warmup):
+            iterate()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        durations = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            iterate()
+            durations.append(time.perf_counter() - start)
+    pygame.quit()
+
+    durations.sort()
+    total = sum(durations)
+    return {
+        "mean_ms": total * 1000 / len(durations),
+        "p50_ms": percentile(durations, 0.50) * 1000,
+        "p95_ms": percentile(durations, 0.95) * 1000,
+        "p99_ms": percentile(durations, 0.99) * 1000,
+        "max_ms": durations[-1] * 1000,
+        "fps": len(durations) / total if total else 0.0,
+        "memory_kb": allocated / 1024,
+        "peak_memory_kb": peak / 1024,
+    }
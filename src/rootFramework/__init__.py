@@ -1,13 +1,35 @@
 import pygame
-from .resourceManager import ResourceManager
+import importlib
+from .constants import PYGAME_CONSTANTS, PYGAME_CONSTANT_NAMES
 
 initialized = False
 
-def init(resolution: tuple[int, int], resource_path: str = ".", caption: str = "Root Framework Project") -> None:
-    """Initialise les modules rootFramework."""
+# Sous-systèmes pygame initialisables séparément (voir init)
+SUBSYSTEMS = {
+    "display": pygame.display.init,
+    "font": pygame.font.init,
+    "mixer": pygame.mixer.init,
+    "joystick": pygame.joystick.init,
+}
+
+def init(resolution: tuple[int, int], resource_path: str = ".", caption: str = "Root Framework Project",
+         subsystems: list[str] | None = None) -> None:
+    """
+    Initialise les modules rootFramework.
+    subsystems : sous-systèmes pygame à initialiser (parmi SUBSYSTEMS) ; None = tous (pygame.init).
+    L'affichage est toujours initialisé.
+    """
     global initialized
-    pygame.init()
+    if subsystems is None:
+        pygame.init()
+    else:
+        for name in dict.fromkeys(["display", *subsystems]):
+            if name not in SUBSYSTEMS:
+                print(f"Sous-système pygame inconnu : '{name}'.")
+                continue
+            SUBSYSTEMS[name]()
     print("Pygame initialized successfully.")
+    from .resourceManager import ResourceManager
     ResourceManager().set_resource_path(resource_path)
     pygame.display.set_caption(caption)
     pygame.display.set_mode(resolution)
@@ -18,16 +40,53 @@ def init(resolution: tuple[int, int], resource_path: str = ".", caption: str = "
     print("Display set up with caption and size.")
     return screen
 
-from .scene import Scene
-from .sceneManager import SceneManager
-from .manager import Manager
-from .constants import *  # Import all constants
-from .utils import Singleton
-from .time import Time, Timer
-from .entity import Entity
-from .drawable import Drawable
-from .sprite import Sprite
-from .animatedSprite import AnimatedSprite
-from .physicalEntity import PhysicalEntity
-from .movableEntity import MovableEntity
-from .camera import Camera
+# Les modules ne sont importés qu'au premier accès à l'un de leurs noms (PEP 562) :
+# { nom public: module }
+LAZY_ATTRIBUTES = {
+    "ResourceManager": "resourceManager",
+    "EventBus": "eventBus",
+    "Scene": "scene",
+    "Transition": "transition", "FadeTransition": "transition", "CrossFadeTransition": "transition",
+    "SceneManager": "sceneManager",
+    "FramePacer": "framePacer",
+    "ReplayRecorder": "replay", "ReplayPlayer": "replay",
+    "Manager": "manager",
+    "Constants": "constants",
+    "Singleton": "utils",
+    "Profiler": "profiler",
+    "Tween": "tween", "TweenEngine": "tween", "EASINGS": "tween",
+    "Time": "time", "Timer": "time", "Coroutine": "time", "WaitFrames": "time", "WaitUntil": "time",
+    "Input": "input", "InputSnapshot": "input", "ActionMap": "input", "ActionState": "input",
+    "Entity": "entity",
+    "EntityPool": "entityPool",
+    "Drawable": "drawable",
+    "Sprite": "sprite",
+    "AnimatedSprite": "animatedSprite",
+    "Text": "text", "GlyphCache": "text",
+    "ParticleEmitter": "particleEmitter",
+    "PhysicalEntity": "physicalEntity",
+    "MovableEntity": "movableEntity",
+    "Camera": "camera",
+    "NavGrid": "pathfinding", "PathFinder": "pathfinding", "PathRequest": "pathfinding", "FlowField": "pathfinding",
+    "World": "ecs", "Archetype": "ecs", "ComponentSpec": "ecs", "EcsEntity": "ecs",
+}
+SUBMODULES = frozenset(LAZY_ATTRIBUTES.values())
+
+__all__ = ["init", *LAZY_ATTRIBUTES, *PYGAME_CONSTANTS]
+
+def __getattr__(name: str):
+    """Importe le module d'un nom public au premier accès (les constantes pygame viennent de constants)."""
+    module_name = LAZY_ATTRIBUTES.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    elif name in SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in PYGAME_CONSTANT_NAMES:
+        value = getattr(pygame, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -8,6 +8,11 @@ class AnimatedSprite(rf.Sprite):
     avec vitesse spécifique par animation, lecture en boucle ou ping-pong,
     et possibilité de contrôle manuel des frames.
     """
+    __slots__ = (
+        "animations", "animation_speeds", "animation_paths", "current_animation",
+        "default_frame_duration", "loop", "pingpong",
+        "current_time", "current_frame_index", "direction", "manual_mode",
+    )
     
     def __init__(self, 
                  default_frame_duration: float = 0.1,  # Durée par frame par défaut
@@ -21,6 +26,9 @@ class AnimatedSprite(rf.Sprite):
         
         # Vitesse par animation : { nom: frame_duration }
         self.animation_speeds: dict[str, float] = {}
+
+        # Chemins sources des frames chargées depuis des fichiers : { nom: [chemin complet] }
+        self.animation_paths: dict[str, list[str]] = {}
         
         # Nom de l’animation en cours
         self.current_animation: str | None = None
@@ -76,6 +84,7 @@ class AnimatedSprite(rf.Sprite):
         frame_duration : durée par frame
         """
         surfaces = []
+        loaded_paths = []
         resource_manager = rf.ResourceManager()
         for path in paths:
             try:
@@ -84,11 +93,38 @@ class AnimatedSprite(rf.Sprite):
                 surf = resource_manager.get_image(path)
                 if surf:
                     surfaces.append(surf)
+                    loaded_paths.append(resource_manager.get_path(path))
                 else:
                     print(f"Impossible de charger l'image: {path}")
             except pygame.error as e:
                 print(f"Erreur lors du chargement de '{path}': {e}")
-        return self.add_animation_from_surfaces(name, surfaces, frame_duration)
+        self.add_animation_from_surfaces(name, surfaces, frame_duration)
+        if surfaces:
+            self.animation_paths[name] = loaded_paths
+            if resource_manager.hot_reload:
+                for path in set(loaded_paths):
+                    resource_manager.add_reload_listener(path, self._on_frame_reloaded)
+        return self
+
+    def _on_frame_reloaded(self, path: str) -> None:
+        """Remplace en place les frames issues d'une image rechargée à chaud."""
+        if self.released:
+            return  # En hibernation : do_wake reconstruira les frames depuis les images rechargées
+        surface = rf.ResourceManager().get_image(path)
+        if surface is None:
+            return
+        for name, paths in self.animation_paths.items():
+            frames = self.animations.get(name)
+            if not frames:
+                continue
+            base_size = frames[0].get_size()
+            for index, frame_path in enumerate(paths):
+                if frame_path == path:
+                    frames[index] = pygame.transform.scale(surface.convert_alpha(), base_size)
+        if self.current_animation in self.animations:
+            frames = self.animations[self.current_animation]
+            self.surface.fill((0, 0, 0, 0))
+            self.surface.blit(frames[self.current_frame_index], (0, 0))
 
     # ----------------------
     # Contrôle d'animations
@@ -103,6 +139,8 @@ class AnimatedSprite(rf.Sprite):
         if name not in self.animations:
             print(f"Animation '{name}' introuvable.")
             return self
+        if self.released:
+            self.do_wake()  # En hibernation : les frames sont rechargées à la demande
         
         self.current_animation = name
         frames = self.animations[name]
@@ -129,6 +167,8 @@ class AnimatedSprite(rf.Sprite):
         """
         if not self.current_animation:
             return self
+        if self.released:
+            self.do_wake()
         
         frames = self.animations[self.current_animation]
         self.manual_mode = True
@@ -139,6 +179,56 @@ class AnimatedSprite(rf.Sprite):
         self.surface.blit(frames[self.current_frame_index], (0, 0))
         return self
     
+    # ----------------------
+    # Hibernation
+    # ----------------------
+    def do_hibernate(self) -> None:
+        """Libère les frames chargées depuis des fichiers et la surface courante."""
+        if self.current_animation is None:
+            super().do_hibernate()
+            return
+        if self.released:
+            return
+        for name in self.animation_paths:
+            self.animations[name] = []
+        self.original_surface = None
+        self.surface = None
+        self.released = True
+
+    def do_wake(self) -> None:
+        """Reconstruit les frames depuis le cache du ResourceManager puis la surface courante."""
+        if self.current_animation is None:
+            super().do_wake()
+            return
+        if not self.released:
+            return
+        self.released = False
+        resource_manager = rf.ResourceManager()
+        for name, paths in self.animation_paths.items():
+            if self.animations.get(name):
+                continue
+            images = []
+            for path in paths:
+                resource_manager.load_image(path)
+                images.append(resource_manager.get_image(path))
+            base_size = images[0].get_size()
+            self.animations[name] = [pygame.transform.scale(image, base_size) for image in images]
+        self.original_surface = self.animations[self.current_animation][self.current_frame_index]
+        self.build_surface()
+
+    def get_memory_usage(self) -> int:
+        usage = rf.Drawable.get_memory_usage(self)
+        for frames in self.animations.values():
+            usage += sum(self.get_surface_bytes(frame) for frame in frames)
+        return usage
+
+    def reset(self) -> None:
+        """Réinitialise l'animation courante (les animations chargées sont conservées)."""
+        super().reset()
+        self.manual_mode = False
+        if self.current_animation is not None:
+            self.set_animation(self.current_animation)
+
     def resume_animation(self):
         """
         Réactive l'animation automatique après un set_frame().
@@ -159,7 +249,7 @@ class AnimatedSprite(rf.Sprite):
             return
         
         frames = self.animations[self.current_animation]
-        if not frames:
+        if not frames or self.released:
             return
         
         # Durée de frame spécifique ou par défaut
@@ -1,596 +1,137 @@
 """
 Constants module that maps custom constants to pygame constants.
+The pygame constants are resolved lazily on first access (PEP 562).
 """
 import pygame
 
-ACTIVEEVENT = pygame.ACTIVEEVENT
-ANYFORMAT = pygame.ANYFORMAT
-APPACTIVE = pygame.APPACTIVE
-APPINPUTFOCUS = pygame.APPINPUTFOCUS
-APPMOUSEFOCUS = pygame.APPMOUSEFOCUS
-APP_DIDENTERBACKGROUND = pygame.APP_DIDENTERBACKGROUND
-APP_DIDENTERFOREGROUND = pygame.APP_DIDENTERFOREGROUND
-APP_LOWMEMORY = pygame.APP_LOWMEMORY
-APP_TERMINATING = pygame.APP_TERMINATING
-APP_WILLENTERBACKGROUND = pygame.APP_WILLENTERBACKGROUND
-APP_WILLENTERFOREGROUND = pygame.APP_WILLENTERFOREGROUND
-ASYNCBLIT = pygame.ASYNCBLIT
-AUDIODEVICEADDED = pygame.AUDIODEVICEADDED
-AUDIODEVICEREMOVED = pygame.AUDIODEVICEREMOVED
-AUDIO_ALLOW_ANY_CHANGE = pygame.AUDIO_ALLOW_ANY_CHANGE
-AUDIO_ALLOW_CHANNELS_CHANGE = pygame.AUDIO_ALLOW_CHANNELS_CHANGE
-AUDIO_ALLOW_FORMAT_CHANGE = pygame.AUDIO_ALLOW_FORMAT_CHANGE
-AUDIO_ALLOW_FREQUENCY_CHANGE = pygame.AUDIO_ALLOW_FREQUENCY_CHANGE
-AUDIO_S16 = pygame.AUDIO_S16
-AUDIO_S16LSB = pygame.AUDIO_S16LSB
-AUDIO_S16MSB = pygame.AUDIO_S16MSB
-AUDIO_S16SYS = pygame.AUDIO_S16SYS
-AUDIO_S8 = pygame.AUDIO_S8
-AUDIO_U16 = pygame.AUDIO_U16
-AUDIO_U16LSB = pygame.AUDIO_U16LSB
-AUDIO_U16MSB = pygame.AUDIO_U16MSB
-AUDIO_U16SYS = pygame.AUDIO_U16SYS
-AUDIO_U8 = pygame.AUDIO_U8
-BIG_ENDIAN = pygame.BIG_ENDIAN
-BLENDFACTOR_DST_ALPHA = pygame.BLENDFACTOR_DST_ALPHA
-BLENDFACTOR_DST_COLOR = pygame.BLENDFACTOR_DST_COLOR
-BLENDFACTOR_ONE = pygame.BLENDFACTOR_ONE
-BLENDFACTOR_ONE_MINUS_DST_ALPHA = pygame.BLENDFACTOR_ONE_MINUS_DST_ALPHA
-BLENDFACTOR_ONE_MINUS_DST_COLOR = pygame.BLENDFACTOR_ONE_MINUS_DST_COLOR
-BLENDFACTOR_ONE_MINUS_SRC_ALPHA = pygame.BLENDFACTOR_ONE_MINUS_SRC_ALPHA
-BLENDFACTOR_ONE_MINUS_SRC_COLOR = pygame.BLENDFACTOR_ONE_MINUS_SRC_COLOR
-BLENDFACTOR_SRC_ALPHA = pygame.BLENDFACTOR_SRC_ALPHA
-BLENDFACTOR_SRC_COLOR = pygame.BLENDFACTOR_SRC_COLOR
-BLENDFACTOR_ZERO = pygame.BLENDFACTOR_ZERO
-BLENDMODE_ADD = pygame.BLENDMODE_ADD
-BLENDMODE_BLEND = pygame.BLENDMODE_BLEND
-BLENDMODE_MOD = pygame.BLENDMODE_MOD
-BLENDMODE_MUL = pygame.BLENDMODE_MUL
-BLENDMODE_NONE = pygame.BLENDMODE_NONE
-BLENDOPERATION_ADD = pygame.BLENDOPERATION_ADD
-BLENDOPERATION_MAXIMUM = pygame.BLENDOPERATION_MAXIMUM
-BLENDOPERATION_MINIMUM = pygame.BLENDOPERATION_MINIMUM
-BLENDOPERATION_REV_SUBTRACT = pygame.BLENDOPERATION_REV_SUBTRACT
-BLENDOPERATION_SUBTRACT = pygame.BLENDOPERATION_SUBTRACT
-BLEND_ADD = pygame.BLEND_ADD
-BLEND_ALPHA_SDL2 = pygame.BLEND_ALPHA_SDL2
-BLEND_MAX = pygame.BLEND_MAX
-BLEND_MIN = pygame.BLEND_MIN
-BLEND_MULT = pygame.BLEND_MULT
-BLEND_PREMULTIPLIED = pygame.BLEND_PREMULTIPLIED
-BLEND_RGBA_ADD = pygame.BLEND_RGBA_ADD
-BLEND_RGBA_MAX = pygame.BLEND_RGBA_MAX
-BLEND_RGBA_MIN = pygame.BLEND_RGBA_MIN
-BLEND_RGBA_MULT = pygame.BLEND_RGBA_MULT
-BLEND_RGBA_SUB = pygame.BLEND_RGBA_SUB
-BLEND_RGB_ADD = pygame.BLEND_RGB_ADD
-BLEND_RGB_MAX = pygame.BLEND_RGB_MAX
-BLEND_RGB_MIN = pygame.BLEND_RGB_MIN
-BLEND_RGB_MULT = pygame.BLEND_RGB_MULT
-BLEND_RGB_SUB = pygame.BLEND_RGB_SUB
-BLEND_SUB = pygame.BLEND_SUB
-BUTTON_LEFT = pygame.BUTTON_LEFT
-BUTTON_MIDDLE = pygame.BUTTON_MIDDLE
-BUTTON_RIGHT = pygame.BUTTON_RIGHT
-BUTTON_WHEELDOWN = pygame.BUTTON_WHEELDOWN
-BUTTON_WHEELUP = pygame.BUTTON_WHEELUP
-BUTTON_X1 = pygame.BUTTON_X1
-BUTTON_X2 = pygame.BUTTON_X2
-CLIPBOARDUPDATE = pygame.CLIPBOARDUPDATE
-CONTROLLERAXISMOTION = pygame.CONTROLLERAXISMOTION
-CONTROLLERBUTTONDOWN = pygame.CONTROLLERBUTTONDOWN
-CONTROLLERBUTTONUP = pygame.CONTROLLERBUTTONUP
-CONTROLLERDEVICEADDED = pygame.CONTROLLERDEVICEADDED
-CONTROLLERDEVICEREMAPPED = pygame.CONTROLLERDEVICEREMAPPED
-CONTROLLERDEVICEREMOVED = pygame.CONTROLLERDEVICEREMOVED
-CONTROLLERSENSORUPDATE = pygame.CONTROLLERSENSORUPDATE
-CONTROLLERTOUCHPADDOWN = pygame.CONTROLLERTOUCHPADDOWN
-CONTROLLERTOUCHPADMOTION = pygame.CONTROLLERTOUCHPADMOTION
-CONTROLLERTOUCHPADUP = pygame.CONTROLLERTOUCHPADUP
-CONTROLLER_AXIS_INVALID = pygame.CONTROLLER_AXIS_INVALID
-CONTROLLER_AXIS_LEFTX = pygame.CONTROLLER_AXIS_LEFTX
-CONTROLLER_AXIS_LEFTY = pygame.CONTROLLER_AXIS_LEFTY
-CONTROLLER_AXIS_MAX = pygame.CONTROLLER_AXIS_MAX
-CONTROLLER_AXIS_RIGHTX = pygame.CONTROLLER_AXIS_RIGHTX
-CONTROLLER_AXIS_RIGHTY = pygame.CONTROLLER_AXIS_RIGHTY
-CONTROLLER_AXIS_TRIGGERLEFT = pygame.CONTROLLER_AXIS_TRIGGERLEFT
-CONTROLLER_AXIS_TRIGGERRIGHT = pygame.CONTROLLER_AXIS_TRIGGERRIGHT
-CONTROLLER_BUTTON_A = pygame.CONTROLLER_BUTTON_A
-CONTROLLER_BUTTON_B = pygame.CONTROLLER_BUTTON_B
-CONTROLLER_BUTTON_BACK = pygame.CONTROLLER_BUTTON_BACK
-CONTROLLER_BUTTON_DPAD_DOWN = pygame.CONTROLLER_BUTTON_DPAD_DOWN
-CONTROLLER_BUTTON_DPAD_LEFT = pygame.CONTROLLER_BUTTON_DPAD_LEFT
-CONTROLLER_BUTTON_DPAD_RIGHT = pygame.CONTROLLER_BUTTON_DPAD_RIGHT
-CONTROLLER_BUTTON_DPAD_UP = pygame.CONTROLLER_BUTTON_DPAD_UP
-CONTROLLER_BUTTON_GUIDE = pygame.CONTROLLER_BUTTON_GUIDE
-CONTROLLER_BUTTON_INVALID = pygame.CONTROLLER_BUTTON_INVALID
-CONTROLLER_BUTTON_LEFTSHOULDER = pygame.CONTROLLER_BUTTON_LEFTSHOULDER
-CONTROLLER_BUTTON_LEFTSTICK = pygame.CONTROLLER_BUTTON_LEFTSTICK
-CONTROLLER_BUTTON_MAX = pygame.CONTROLLER_BUTTON_MAX
-CONTROLLER_BUTTON_RIGHTSHOULDER = pygame.CONTROLLER_BUTTON_RIGHTSHOULDER
-CONTROLLER_BUTTON_RIGHTSTICK = pygame.CONTROLLER_BUTTON_RIGHTSTICK
-CONTROLLER_BUTTON_START = pygame.CONTROLLER_BUTTON_START
-CONTROLLER_BUTTON_X = pygame.CONTROLLER_BUTTON_X
-CONTROLLER_BUTTON_Y = pygame.CONTROLLER_BUTTON_Y
-DIRECTION_BTT = pygame.DIRECTION_BTT
-DIRECTION_LTR = pygame.DIRECTION_LTR
-DIRECTION_RTL = pygame.DIRECTION_RTL
-DIRECTION_TTB = pygame.DIRECTION_TTB
-DOUBLEBUF = pygame.DOUBLEBUF
-DROPBEGIN = pygame.DROPBEGIN
-DROPCOMPLETE = pygame.DROPCOMPLETE
-DROPFILE = pygame.DROPFILE
-DROPTEXT = pygame.DROPTEXT
-FINGERDOWN = pygame.FINGERDOWN
-FINGERMOTION = pygame.FINGERMOTION
-FINGERUP = pygame.FINGERUP
-FLASH_BRIEFLY = pygame.FLASH_BRIEFLY
-FLASH_CANCEL = pygame.FLASH_CANCEL
-FLASH_UNTIL_FOCUSED = pygame.FLASH_UNTIL_FOCUSED
-FONT_CENTER = pygame.FONT_CENTER
-FONT_LEFT = pygame.FONT_LEFT
-FONT_RIGHT = pygame.FONT_RIGHT
-FULLSCREEN = pygame.FULLSCREEN
-GL_ACCELERATED_VISUAL = pygame.GL_ACCELERATED_VISUAL
-GL_ACCUM_ALPHA_SIZE = pygame.GL_ACCUM_ALPHA_SIZE
-GL_ACCUM_BLUE_SIZE = pygame.GL_ACCUM_BLUE_SIZE
-GL_ACCUM_GREEN_SIZE = pygame.GL_ACCUM_GREEN_SIZE
-GL_ACCUM_RED_SIZE = pygame.GL_ACCUM_RED_SIZE
-GL_ALPHA_SIZE = pygame.GL_ALPHA_SIZE
-GL_BLUE_SIZE = pygame.GL_BLUE_SIZE
-GL_BUFFER_SIZE = pygame.GL_BUFFER_SIZE
-GL_CONTEXT_DEBUG_FLAG = pygame.GL_CONTEXT_DEBUG_FLAG
-GL_CONTEXT_FLAGS = pygame.GL_CONTEXT_FLAGS
-GL_CONTEXT_FORWARD_COMPATIBLE_FLAG = pygame.GL_CONTEXT_FORWARD_COMPATIBLE_FLAG
-GL_CONTEXT_MAJOR_VERSION = pygame.GL_CONTEXT_MAJOR_VERSION
-GL_CONTEXT_MINOR_VERSION = pygame.GL_CONTEXT_MINOR_VERSION
-GL_CONTEXT_PROFILE_COMPATIBILITY = pygame.GL_CONTEXT_PROFILE_COMPATIBILITY
-GL_CONTEXT_PROFILE_CORE = pygame.GL_CONTEXT_PROFILE_CORE
-GL_CONTEXT_PROFILE_ES = pygame.GL_CONTEXT_PROFILE_ES
-GL_CONTEXT_PROFILE_MASK = pygame.GL_CONTEXT_PROFILE_MASK
-GL_CONTEXT_RELEASE_BEHAVIOR = pygame.GL_CONTEXT_RELEASE_BEHAVIOR
-GL_CONTEXT_RELEASE_BEHAVIOR_FLUSH = pygame.GL_CONTEXT_RELEASE_BEHAVIOR_FLUSH
-GL_CONTEXT_RELEASE_BEHAVIOR_NONE = pygame.GL_CONTEXT_RELEASE_BEHAVIOR_NONE
-GL_CONTEXT_RESET_ISOLATION_FLAG = pygame.GL_CONTEXT_RESET_ISOLATION_FLAG
-GL_CONTEXT_ROBUST_ACCESS_FLAG = pygame.GL_CONTEXT_ROBUST_ACCESS_FLAG
-GL_DEPTH_SIZE = pygame.GL_DEPTH_SIZE
-GL_DOUBLEBUFFER = pygame.GL_DOUBLEBUFFER
-GL_FRAMEBUFFER_SRGB_CAPABLE = pygame.GL_FRAMEBUFFER_SRGB_CAPABLE
-GL_GREEN_SIZE = pygame.GL_GREEN_SIZE
-GL_MULTISAMPLEBUFFERS = pygame.GL_MULTISAMPLEBUFFERS
-GL_MULTISAMPLESAMPLES = pygame.GL_MULTISAMPLESAMPLES
-GL_RED_SIZE = pygame.GL_RED_SIZE
-GL_SHARE_WITH_CURRENT_CONTEXT = pygame.GL_SHARE_WITH_CURRENT_CONTEXT
-GL_STENCIL_SIZE = pygame.GL_STENCIL_SIZE
-GL_STEREO = pygame.GL_STEREO
-GL_SWAP_CONTROL = pygame.GL_SWAP_CONTROL
-HAT_CENTERED = pygame.HAT_CENTERED
-HAT_DOWN = pygame.HAT_DOWN
-HAT_LEFT = pygame.HAT_LEFT
-HAT_LEFTDOWN = pygame.HAT_LEFTDOWN
-HAT_LEFTUP = pygame.HAT_LEFTUP
-HAT_RIGHT = pygame.HAT_RIGHT
-HAT_RIGHTDOWN = pygame.HAT_RIGHTDOWN
-HAT_RIGHTUP = pygame.HAT_RIGHTUP
-HAT_UP = pygame.HAT_UP
-HIDDEN = pygame.HIDDEN
-HWACCEL = pygame.HWACCEL
-HWPALETTE = pygame.HWPALETTE
-HWSURFACE = pygame.HWSURFACE
-IS_CE = pygame.IS_CE
-JOYAXISMOTION = pygame.JOYAXISMOTION
-JOYBALLMOTION = pygame.JOYBALLMOTION
-JOYBUTTONDOWN = pygame.JOYBUTTONDOWN
-JOYBUTTONUP = pygame.JOYBUTTONUP
-JOYDEVICEADDED = pygame.JOYDEVICEADDED
-JOYDEVICEREMOVED = pygame.JOYDEVICEREMOVED
-JOYHATMOTION = pygame.JOYHATMOTION
-KEYDOWN = pygame.KEYDOWN
-KEYMAPCHANGED = pygame.KEYMAPCHANGED
-KEYUP = pygame.KEYUP
-KMOD_ALT = pygame.KMOD_ALT
-KMOD_CAPS = pygame.KMOD_CAPS
-KMOD_CTRL = pygame.KMOD_CTRL
-KMOD_GUI = pygame.KMOD_GUI
-KMOD_LALT = pygame.KMOD_LALT
-KMOD_LCTRL = pygame.KMOD_LCTRL
-KMOD_LGUI = pygame.KMOD_LGUI
-KMOD_LMETA = pygame.KMOD_LMETA
-KMOD_LSHIFT = pygame.KMOD_LSHIFT
-KMOD_META = pygame.KMOD_META
-KMOD_MODE = pygame.KMOD_MODE
-KMOD_NONE = pygame.KMOD_NONE
-KMOD_NUM = pygame.KMOD_NUM
-KMOD_RALT = pygame.KMOD_RALT
-KMOD_RCTRL = pygame.KMOD_RCTRL
-KMOD_RGUI = pygame.KMOD_RGUI
-KMOD_RMETA = pygame.KMOD_RMETA
-KMOD_RSHIFT = pygame.KMOD_RSHIFT
-KMOD_SHIFT = pygame.KMOD_SHIFT
-KSCAN_0 = pygame.KSCAN_0
-KSCAN_1 = pygame.KSCAN_1
-KSCAN_2 = pygame.KSCAN_2
-KSCAN_3 = pygame.KSCAN_3
-KSCAN_4 = pygame.KSCAN_4
-KSCAN_5 = pygame.KSCAN_5
-KSCAN_6 = pygame.KSCAN_6
-KSCAN_7 = pygame.KSCAN_7
-KSCAN_8 = pygame.KSCAN_8
-KSCAN_9 = pygame.KSCAN_9
-KSCAN_A = pygame.KSCAN_A
-KSCAN_AC_BACK = pygame.KSCAN_AC_BACK
-KSCAN_APOSTROPHE = pygame.KSCAN_APOSTROPHE
-KSCAN_B = pygame.KSCAN_B
-KSCAN_BACKSLASH = pygame.KSCAN_BACKSLASH
-KSCAN_BACKSPACE = pygame.KSCAN_BACKSPACE
-KSCAN_BREAK = pygame.KSCAN_BREAK
-KSCAN_C = pygame.KSCAN_C
-KSCAN_CAPSLOCK = pygame.KSCAN_CAPSLOCK
-KSCAN_CLEAR = pygame.KSCAN_CLEAR
-KSCAN_COMMA = pygame.KSCAN_COMMA
-KSCAN_CURRENCYSUBUNIT = pygame.KSCAN_CURRENCYSUBUNIT
-KSCAN_CURRENCYUNIT = pygame.KSCAN_CURRENCYUNIT
-KSCAN_D = pygame.KSCAN_D
-KSCAN_DELETE = pygame.KSCAN_DELETE
-KSCAN_DOWN = pygame.KSCAN_DOWN
-KSCAN_E = pygame.KSCAN_E
-KSCAN_END = pygame.KSCAN_END
-KSCAN_EQUALS = pygame.KSCAN_EQUALS
-KSCAN_ESCAPE = pygame.KSCAN_ESCAPE
-KSCAN_EURO = pygame.KSCAN_EURO
-KSCAN_F = pygame.KSCAN_F
-KSCAN_F1 = pygame.KSCAN_F1
-KSCAN_F10 = pygame.KSCAN_F10
-KSCAN_F11 = pygame.KSCAN_F11
-KSCAN_F12 = pygame.KSCAN_F12
-KSCAN_F13 = pygame.KSCAN_F13
-KSCAN_F14 = pygame.KSCAN_F14
-KSCAN_F15 = pygame.KSCAN_F15
-KSCAN_F2 = pygame.KSCAN_F2
-KSCAN_F3 = pygame.KSCAN_F3
-KSCAN_F4 = pygame.KSCAN_F4
-KSCAN_F5 = pygame.KSCAN_F5
-KSCAN_F6 = pygame.KSCAN_F6
-KSCAN_F7 = pygame.KSCAN_F7
-KSCAN_F8 = pygame.KSCAN_F8
-KSCAN_F9 = pygame.KSCAN_F9
-KSCAN_G = pygame.KSCAN_G
-KSCAN_GRAVE = pygame.KSCAN_GRAVE
-KSCAN_H = pygame.KSCAN_H
-KSCAN_HELP = pygame.KSCAN_HELP
-KSCAN_HOME = pygame.KSCAN_HOME
-KSCAN_I = pygame.KSCAN_I
-KSCAN_INSERT = pygame.KSCAN_INSERT
-KSCAN_INTERNATIONAL1 = pygame.KSCAN_INTERNATIONAL1
-KSCAN_INTERNATIONAL2 = pygame.KSCAN_INTERNATIONAL2
-KSCAN_INTERNATIONAL3 = pygame.KSCAN_INTERNATIONAL3
-KSCAN_INTERNATIONAL4 = pygame.KSCAN_INTERNATIONAL4
-KSCAN_INTERNATIONAL5 = pygame.KSCAN_INTERNATIONAL5
-KSCAN_INTERNATIONAL6 = pygame.KSCAN_INTERNATIONAL6
-KSCAN_INTERNATIONAL7 = pygame.KSCAN_INTERNATIONAL7
-KSCAN_INTERNATIONAL8 = pygame.KSCAN_INTERNATIONAL8
-KSCAN_INTERNATIONAL9 = pygame.KSCAN_INTERNATIONAL9
-KSCAN_J = pygame.KSCAN_J
-KSCAN_K = pygame.KSCAN_K
-KSCAN_KP0 = pygame.KSCAN_KP0
-KSCAN_KP1 = pygame.KSCAN_KP1
-KSCAN_KP2 = pygame.KSCAN_KP2
-KSCAN_KP3 = pygame.KSCAN_KP3
-KSCAN_KP4 = pygame.KSCAN_KP4
-KSCAN_KP5 = pygame.KSCAN_KP5
-KSCAN_KP6 = pygame.KSCAN_KP6
-KSCAN_KP7 = pygame.KSCAN_KP7
-KSCAN_KP8 = pygame.KSCAN_KP8
-KSCAN_KP9 = pygame.KSCAN_KP9
-KSCAN_KP_0 = pygame.KSCAN_KP_0
-KSCAN_KP_1 = pygame.KSCAN_KP_1
-KSCAN_KP_2 = pygame.KSCAN_KP_2
-KSCAN_KP_3 = pygame.KSCAN_KP_3
-KSCAN_KP_4 = pygame.KSCAN_KP_4
-KSCAN_KP_5 = pygame.KSCAN_KP_5
-KSCAN_KP_6 = pygame.KSCAN_KP_6
-KSCAN_KP_7 = pygame.KSCAN_KP_7
-KSCAN_KP_8 = pygame.KSCAN_KP_8
-KSCAN_KP_9 = pygame.KSCAN_KP_9
-KSCAN_KP_DIVIDE = pygame.KSCAN_KP_DIVIDE
-KSCAN_KP_ENTER = pygame.KSCAN_KP_ENTER
-KSCAN_KP_EQUALS = pygame.KSCAN_KP_EQUALS
-KSCAN_KP_MINUS = pygame.KSCAN_KP_MINUS
-KSCAN_KP_MULTIPLY = pygame.KSCAN_KP_MULTIPLY
-KSCAN_KP_PERIOD = pygame.KSCAN_KP_PERIOD
-KSCAN_KP_PLUS = pygame.KSCAN_KP_PLUS
-KSCAN_L = pygame.KSCAN_L
-KSCAN_LALT = pygame.KSCAN_LALT
-KSCAN_LANG1 = pygame.KSCAN_LANG1
-KSCAN_LANG2 = pygame.KSCAN_LANG2
-KSCAN_LANG3 = pygame.KSCAN_LANG3
-KSCAN_LANG4 = pygame.KSCAN_LANG4
-KSCAN_LANG5 = pygame.KSCAN_LANG5
-KSCAN_LANG6 = pygame.KSCAN_LANG6
-KSCAN_LANG7 = pygame.KSCAN_LANG7
-KSCAN_LANG8 = pygame.KSCAN_LANG8
-KSCAN_LANG9 = pygame.KSCAN_LANG9
-KSCAN_LCTRL = pygame.KSCAN_LCTRL
-KSCAN_LEFT = pygame.KSCAN_LEFT
-KSCAN_LEFTBRACKET = pygame.KSCAN_LEFTBRACKET
-KSCAN_LGUI = pygame.KSCAN_LGUI
-KSCAN_LMETA = pygame.KSCAN_LMETA
-KSCAN_LSHIFT = pygame.KSCAN_LSHIFT
-KSCAN_LSUPER = pygame.KSCAN_LSUPER
-KSCAN_M = pygame.KSCAN_M
-KSCAN_MENU = pygame.KSCAN_MENU
-KSCAN_MINUS = pygame.KSCAN_MINUS
-KSCAN_MODE = pygame.KSCAN_MODE
-KSCAN_N = pygame.KSCAN_N
-KSCAN_NONUSBACKSLASH = pygame.KSCAN_NONUSBACKSLASH
-KSCAN_NONUSHASH = pygame.KSCAN_NONUSHASH
-KSCAN_NUMLOCK = pygame.KSCAN_NUMLOCK
-KSCAN_NUMLOCKCLEAR = pygame.KSCAN_NUMLOCKCLEAR
-KSCAN_O = pygame.KSCAN_O
-KSCAN_P = pygame.KSCAN_P
-KSCAN_PAGEDOWN = pygame.KSCAN_PAGEDOWN
-KSCAN_PAGEUP = pygame.KSCAN_PAGEUP
-KSCAN_PAUSE = pygame.KSCAN_PAUSE
-KSCAN_PERIOD = pygame.KSCAN_PERIOD
-KSCAN_POWER = pygame.KSCAN_POWER
-KSCAN_PRINT = pygame.KSCAN_PRINT
-KSCAN_PRINTSCREEN = pygame.KSCAN_PRINTSCREEN
-KSCAN_Q = pygame.KSCAN_Q
-KSCAN_R = pygame.KSCAN_R
-KSCAN_RALT = pygame.KSCAN_RALT
-KSCAN_RCTRL = pygame.KSCAN_RCTRL
-KSCAN_RETURN = pygame.KSCAN_RETURN
-KSCAN_RGUI = pygame.KSCAN_RGUI
-KSCAN_RIGHT = pygame.KSCAN_RIGHT
-KSCAN_RIGHTBRACKET = pygame.KSCAN_RIGHTBRACKET
-KSCAN_RMETA = pygame.KSCAN_RMETA
-KSCAN_RSHIFT = pygame.KSCAN_RSHIFT
-KSCAN_RSUPER = pygame.KSCAN_RSUPER
-KSCAN_S = pygame.KSCAN_S
-KSCAN_SCROLLLOCK = pygame.KSCAN_SCROLLLOCK
-KSCAN_SCROLLOCK = pygame.KSCAN_SCROLLOCK
-KSCAN_SEMICOLON = pygame.KSCAN_SEMICOLON
-KSCAN_SLASH = pygame.KSCAN_SLASH
-KSCAN_SPACE = pygame.KSCAN_SPACE
-KSCAN_SYSREQ = pygame.KSCAN_SYSREQ
-KSCAN_T = pygame.KSCAN_T
-KSCAN_TAB = pygame.KSCAN_TAB
-KSCAN_U = pygame.KSCAN_U
-KSCAN_UNKNOWN = pygame.KSCAN_UNKNOWN
-KSCAN_UP = pygame.KSCAN_UP
-KSCAN_V = pygame.KSCAN_V
-KSCAN_W = pygame.KSCAN_W
-KSCAN_X = pygame.KSCAN_X
-KSCAN_Y = pygame.KSCAN_Y
-KSCAN_Z = pygame.KSCAN_Z
-K_0 = pygame.K_0
-K_1 = pygame.K_1
-K_2 = pygame.K_2
-K_3 = pygame.K_3
-K_4 = pygame.K_4
-K_5 = pygame.K_5
-K_6 = pygame.K_6
-K_7 = pygame.K_7
-K_8 = pygame.K_8
-K_9 = pygame.K_9
-K_AC_BACK = pygame.K_AC_BACK
-K_AMPERSAND = pygame.K_AMPERSAND
-K_ASTERISK = pygame.K_ASTERISK
-K_AT = pygame.K_AT
-K_BACKQUOTE = pygame.K_BACKQUOTE
-K_BACKSLASH = pygame.K_BACKSLASH
-K_BACKSPACE = pygame.K_BACKSPACE
-K_BREAK = pygame.K_BREAK
-K_CAPSLOCK = pygame.K_CAPSLOCK
-K_CARET = pygame.K_CARET
-K_CLEAR = pygame.K_CLEAR
-K_COLON = pygame.K_COLON
-K_COMMA = pygame.K_COMMA
-K_CURRENCYSUBUNIT = pygame.K_CURRENCYSUBUNIT
-K_CURRENCYUNIT = pygame.K_CURRENCYUNIT
-K_DELETE = pygame.K_DELETE
-K_DOLLAR = pygame.K_DOLLAR
-K_DOWN = pygame.K_DOWN
-K_END = pygame.K_END
-K_EQUALS = pygame.K_EQUALS
-K_ESCAPE = pygame.K_ESCAPE
-K_EURO = pygame.K_EURO
-K_EXCLAIM = pygame.K_EXCLAIM
-K_F1 = pygame.K_F1
-K_F10 = pygame.K_F10
-K_F11 = pygame.K_F11
-K_F12 = pygame.K_F12
-K_F13 = pygame.K_F13
-K_F14 = pygame.K_F14
-K_F15 = pygame.K_F15
-K_F2 = pygame.K_F2
-K_F3 = pygame.K_F3
-K_F4 = pygame.K_F4
-K_F5 = pygame.K_F5
-K_F6 = pygame.K_F6
-K_F7 = pygame.K_F7
-K_F8 = pygame.K_F8
-K_F9 = pygame.K_F9
-K_GREATER = pygame.K_GREATER
-K_HASH = pygame.K_HASH
-K_HELP = pygame.K_HELP
-K_HOME = pygame.K_HOME
-K_INSERT = pygame.K_INSERT
-K_KP0 = pygame.K_KP0
-K_KP1 = pygame.K_KP1
-K_KP2 = pygame.K_KP2
-K_KP3 = pygame.K_KP3
-K_KP4 = pygame.K_KP4
-K_KP5 = pygame.K_KP5
-K_KP6 = pygame.K_KP6
-K_KP7 = pygame.K_KP7
-K_KP8 = pygame.K_KP8
-K_KP9 = pygame.K_KP9
-K_KP_0 = pygame.K_KP_0
-K_KP_1 = pygame.K_KP_1
-K_KP_2 = pygame.K_KP_2
-K_KP_3 = pygame.K_KP_3
-K_KP_4 = pygame.K_KP_4
-K_KP_5 = pygame.K_KP_5
-K_KP_6 = pygame.K_KP_6
-K_KP_7 = pygame.K_KP_7
-K_KP_8 = pygame.K_KP_8
-K_KP_9 = pygame.K_KP_9
-K_KP_DIVIDE = pygame.K_KP_DIVIDE
-K_KP_ENTER = pygame.K_KP_ENTER
-K_KP_EQUALS = pygame.K_KP_EQUALS
-K_KP_MINUS = pygame.K_KP_MINUS
-K_KP_MULTIPLY = pygame.K_KP_MULTIPLY
-K_KP_PERIOD = pygame.K_KP_PERIOD
-K_KP_PLUS = pygame.K_KP_PLUS
-K_LALT = pygame.K_LALT
-K_LCTRL = pygame.K_LCTRL
-K_LEFT = pygame.K_LEFT
-K_LEFTBRACKET = pygame.K_LEFTBRACKET
-K_LEFTPAREN = pygame.K_LEFTPAREN
-K_LESS = pygame.K_LESS
-K_LGUI = pygame.K_LGUI
-K_LMETA = pygame.K_LMETA
-K_LSHIFT = pygame.K_LSHIFT
-K_LSUPER = pygame.K_LSUPER
-K_MENU = pygame.K_MENU
-K_MINUS = pygame.K_MINUS
-K_MODE = pygame.K_MODE
-K_NUMLOCK = pygame.K_NUMLOCK
-K_NUMLOCKCLEAR = pygame.K_NUMLOCKCLEAR
-K_PAGEDOWN = pygame.K_PAGEDOWN
-K_PAGEUP = pygame.K_PAGEUP
-K_PAUSE = pygame.K_PAUSE
-K_PERCENT = pygame.K_PERCENT
-K_PERIOD = pygame.K_PERIOD
-K_PLUS = pygame.K_PLUS
-K_POWER = pygame.K_POWER
-K_PRINT = pygame.K_PRINT
-K_PRINTSCREEN = pygame.K_PRINTSCREEN
-K_QUESTION = pygame.K_QUESTION
-K_QUOTE = pygame.K_QUOTE
-K_QUOTEDBL = pygame.K_QUOTEDBL
-K_RALT = pygame.K_RALT
-K_RCTRL = pygame.K_RCTRL
-K_RETURN = pygame.K_RETURN
-K_RGUI = pygame.K_RGUI
-K_RIGHT = pygame.K_RIGHT
-K_RIGHTBRACKET = pygame.K_RIGHTBRACKET
-K_RIGHTPAREN = pygame.K_RIGHTPAREN
-K_RMETA = pygame.K_RMETA
-K_RSHIFT = pygame.K_RSHIFT
-K_RSUPER = pygame.K_RSUPER
-K_SCROLLLOCK = pygame.K_SCROLLLOCK
-K_SCROLLOCK = pygame.K_SCROLLOCK
-K_SEMICOLON = pygame.K_SEMICOLON
-K_SLASH = pygame.K_SLASH
-K_SPACE = pygame.K_SPACE
-K_SYSREQ = pygame.K_SYSREQ
-K_TAB = pygame.K_TAB
-K_UNDERSCORE = pygame.K_UNDERSCORE
-K_UNKNOWN = pygame.K_UNKNOWN
-K_UP = pygame.K_UP
-K_a = pygame.K_a
-K_b = pygame.K_b
-K_c = pygame.K_c
-K_d = pygame.K_d
-K_e = pygame.K_e
-K_f = pygame.K_f
-K_g = pygame.K_g
-K_h = pygame.K_h
-K_i = pygame.K_i
-K_j = pygame.K_j
-K_k = pygame.K_k
-K_l = pygame.K_l
-K_m = pygame.K_m
-K_n = pygame.K_n
-K_o = pygame.K_o
-K_p = pygame.K_p
-K_q = pygame.K_q
-K_r = pygame.K_r
-K_s = pygame.K_s
-K_t = pygame.K_t
-K_u = pygame.K_u
-K_v = pygame.K_v
-K_w = pygame.K_w
-K_x = pygame.K_x
-K_y = pygame.K_y
-K_z = pygame.K_z
-LIL_ENDIAN = pygame.LIL_ENDIAN
-LOCALECHANGED = pygame.LOCALECHANGED
-MIDIIN = pygame.MIDIIN
-MIDIOUT = pygame.MIDIOUT
-MOUSEBUTTONDOWN = pygame.MOUSEBUTTONDOWN
-MOUSEBUTTONUP = pygame.MOUSEBUTTONUP
-MOUSEMOTION = pygame.MOUSEMOTION
-MOUSEWHEEL = pygame.MOUSEWHEEL
-MULTIGESTURE = pygame.MULTIGESTURE
-NOEVENT = pygame.NOEVENT
-NOFRAME = pygame.NOFRAME
-NULL_VIDEODRIVER = pygame.NULL_VIDEODRIVER
-NUMEVENTS = pygame.NUMEVENTS
-OPENGL = pygame.OPENGL
-OPENGLBLIT = pygame.OPENGLBLIT
-PREALLOC = pygame.PREALLOC
-QUIT = pygame.QUIT
-RENDER_DEVICE_RESET = pygame.RENDER_DEVICE_RESET
-RENDER_TARGETS_RESET = pygame.RENDER_TARGETS_RESET
-RESIZABLE = pygame.RESIZABLE
-RLEACCEL = pygame.RLEACCEL
-RLEACCELOK = pygame.RLEACCELOK
-SCALED = pygame.SCALED
-SCRAP_BMP = pygame.SCRAP_BMP
-SCRAP_CLIPBOARD = pygame.SCRAP_CLIPBOARD
-SCRAP_PBM = pygame.SCRAP_PBM
-SCRAP_PPM = pygame.SCRAP_PPM
-SCRAP_SELECTION = pygame.SCRAP_SELECTION
-SCRAP_TEXT = pygame.SCRAP_TEXT
-SCROLL_ERASE = pygame.SCROLL_ERASE
-SCROLL_REPEAT = pygame.SCROLL_REPEAT
-SHOWN = pygame.SHOWN
-SRCALPHA = pygame.SRCALPHA
-SRCCOLORKEY = pygame.SRCCOLORKEY
-SWSURFACE = pygame.SWSURFACE
-SYSTEM_CURSOR_ARROW = pygame.SYSTEM_CURSOR_ARROW
-SYSTEM_CURSOR_CROSSHAIR = pygame.SYSTEM_CURSOR_CROSSHAIR
-SYSTEM_CURSOR_HAND = pygame.SYSTEM_CURSOR_HAND
-SYSTEM_CURSOR_IBEAM = pygame.SYSTEM_CURSOR_IBEAM
-SYSTEM_CURSOR_NO = pygame.SYSTEM_CURSOR_NO
-SYSTEM_CURSOR_SIZEALL = pygame.SYSTEM_CURSOR_SIZEALL
-SYSTEM_CURSOR_SIZENESW = pygame.SYSTEM_CURSOR_SIZENESW
-SYSTEM_CURSOR_SIZENS = pygame.SYSTEM_CURSOR_SIZENS
-SYSTEM_CURSOR_SIZENWSE = pygame.SYSTEM_CURSOR_SIZENWSE
-SYSTEM_CURSOR_SIZEWE = pygame.SYSTEM_CURSOR_SIZEWE
-SYSTEM_CURSOR_WAIT = pygame.SYSTEM_CURSOR_WAIT
-SYSTEM_CURSOR_WAITARROW = pygame.SYSTEM_CURSOR_WAITARROW
-SYSWMEVENT = pygame.SYSWMEVENT
-TEXTEDITING = pygame.TEXTEDITING
-TEXTINPUT = pygame.TEXTINPUT
-TIMER_RESOLUTION = pygame.TIMER_RESOLUTION
-USEREVENT = pygame.USEREVENT
-USEREVENT_DROPFILE = pygame.USEREVENT_DROPFILE
-VIDEOEXPOSE = pygame.VIDEOEXPOSE
-VIDEORESIZE = pygame.VIDEORESIZE
-WINDOWCLOSE = pygame.WINDOWCLOSE
-WINDOWDISPLAYCHANGED = pygame.WINDOWDISPLAYCHANGED
-WINDOWENTER = pygame.WINDOWENTER
-WINDOWEXPOSED = pygame.WINDOWEXPOSED
-WINDOWFOCUSGAINED = pygame.WINDOWFOCUSGAINED
-WINDOWFOCUSLOST = pygame.WINDOWFOCUSLOST
-WINDOWHIDDEN = pygame.WINDOWHIDDEN
-WINDOWHITTEST = pygame.WINDOWHITTEST
-WINDOWICCPROFCHANGED = pygame.WINDOWICCPROFCHANGED
-WINDOWLEAVE = pygame.WINDOWLEAVE
-WINDOWMAXIMIZED = pygame.WINDOWMAXIMIZED
-WINDOWMINIMIZED = pygame.WINDOWMINIMIZED
-WINDOWMOVED = pygame.WINDOWMOVED
-WINDOWPOS_CENTERED = pygame.WINDOWPOS_CENTERED
-WINDOWPOS_UNDEFINED = pygame.WINDOWPOS_UNDEFINED
-WINDOWRESIZED = pygame.WINDOWRESIZED
-WINDOWRESTORED = pygame.WINDOWRESTORED
-WINDOWSHOWN = pygame.WINDOWSHOWN
-WINDOWSIZECHANGED = pygame.WINDOWSIZECHANGED
-WINDOWTAKEFOCUS = pygame.WINDOWTAKEFOCUS
+PYGAME_CONSTANTS: tuple[str, ...] = (
+    "ACTIVEEVENT", "ANYFORMAT", "APPACTIVE", "APPINPUTFOCUS", "APPMOUSEFOCUS",
+    "APP_DIDENTERBACKGROUND", "APP_DIDENTERFOREGROUND", "APP_LOWMEMORY", "APP_TERMINATING",
+    "APP_WILLENTERBACKGROUND", "APP_WILLENTERFOREGROUND", "ASYNCBLIT", "AUDIODEVICEADDED",
+    "AUDIODEVICEREMOVED", "AUDIO_ALLOW_ANY_CHANGE", "AUDIO_ALLOW_CHANNELS_CHANGE",
+    "AUDIO_ALLOW_FORMAT_CHANGE", "AUDIO_ALLOW_FREQUENCY_CHANGE", "AUDIO_S16", "AUDIO_S16LSB",
+    "AUDIO_S16MSB", "AUDIO_S16SYS", "AUDIO_S8", "AUDIO_U16", "AUDIO_U16LSB", "AUDIO_U16MSB",
+    "AUDIO_U16SYS", "AUDIO_U8", "BIG_ENDIAN", "BLENDFACTOR_DST_ALPHA", "BLENDFACTOR_DST_COLOR",
+    "BLENDFACTOR_ONE", "BLENDFACTOR_ONE_MINUS_DST_ALPHA", "BLENDFACTOR_ONE_MINUS_DST_COLOR",
+    "BLENDFACTOR_ONE_MINUS_SRC_ALPHA", "BLENDFACTOR_ONE_MINUS_SRC_COLOR",
+    "BLENDFACTOR_SRC_ALPHA", "BLENDFACTOR_SRC_COLOR", "BLENDFACTOR_ZERO", "BLENDMODE_ADD",
+    "BLENDMODE_BLEND", "BLENDMODE_MOD", "BLENDMODE_MUL", "BLENDMODE_NONE", "BLENDOPERATION_ADD",
+    "BLENDOPERATION_MAXIMUM", "BLENDOPERATION_MINIMUM", "BLENDOPERATION_REV_SUBTRACT",
+    "BLENDOPERATION_SUBTRACT", "BLEND_ADD", "BLEND_ALPHA_SDL2", "BLEND_MAX", "BLEND_MIN",
+    "BLEND_MULT", "BLEND_PREMULTIPLIED", "BLEND_RGBA_ADD", "BLEND_RGBA_MAX", "BLEND_RGBA_MIN",
+    "BLEND_RGBA_MULT", "BLEND_RGBA_SUB", "BLEND_RGB_ADD", "BLEND_RGB_MAX", "BLEND_RGB_MIN",
+    "BLEND_RGB_MULT", "BLEND_RGB_SUB", "BLEND_SUB", "BUTTON_LEFT", "BUTTON_MIDDLE",
+    "BUTTON_RIGHT", "BUTTON_WHEELDOWN", "BUTTON_WHEELUP", "BUTTON_X1", "BUTTON_X2",
+    "CLIPBOARDUPDATE", "CONTROLLERAXISMOTION", "CONTROLLERBUTTONDOWN", "CONTROLLERBUTTONUP",
+    "CONTROLLERDEVICEADDED", "CONTROLLERDEVICEREMAPPED", "CONTROLLERDEVICEREMOVED",
+    "CONTROLLERSENSORUPDATE", "CONTROLLERTOUCHPADDOWN", "CONTROLLERTOUCHPADMOTION",
+    "CONTROLLERTOUCHPADUP", "CONTROLLER_AXIS_INVALID", "CONTROLLER_AXIS_LEFTX",
+    "CONTROLLER_AXIS_LEFTY", "CONTROLLER_AXIS_MAX", "CONTROLLER_AXIS_RIGHTX",
+    "CONTROLLER_AXIS_RIGHTY", "CONTROLLER_AXIS_TRIGGERLEFT", "CONTROLLER_AXIS_TRIGGERRIGHT",
+    "CONTROLLER_BUTTON_A", "CONTROLLER_BUTTON_B", "CONTROLLER_BUTTON_BACK",
+    "CONTROLLER_BUTTON_DPAD_DOWN", "CONTROLLER_BUTTON_DPAD_LEFT",
+    "CONTROLLER_BUTTON_DPAD_RIGHT", "CONTROLLER_BUTTON_DPAD_UP", "CONTROLLER_BUTTON_GUIDE",
+    "CONTROLLER_BUTTON_INVALID", "CONTROLLER_BUTTON_LEFTSHOULDER",
+    "CONTROLLER_BUTTON_LEFTSTICK", "CONTROLLER_BUTTON_MAX", "CONTROLLER_BUTTON_RIGHTSHOULDER",
+    "CONTROLLER_BUTTON_RIGHTSTICK", "CONTROLLER_BUTTON_START", "CONTROLLER_BUTTON_X",
+    "CONTROLLER_BUTTON_Y", "DIRECTION_BTT", "DIRECTION_LTR", "DIRECTION_RTL", "DIRECTION_TTB",
+    "DOUBLEBUF", "DROPBEGIN", "DROPCOMPLETE", "DROPFILE", "DROPTEXT", "FINGERDOWN",
+    "FINGERMOTION", "FINGERUP", "FLASH_BRIEFLY", "FLASH_CANCEL", "FLASH_UNTIL_FOCUSED",
+    "FONT_CENTER", "FONT_LEFT", "FONT_RIGHT", "FULLSCREEN", "GL_ACCELERATED_VISUAL",
+    "GL_ACCUM_ALPHA_SIZE", "GL_ACCUM_BLUE_SIZE", "GL_ACCUM_GREEN_SIZE", "GL_ACCUM_RED_SIZE",
+    "GL_ALPHA_SIZE", "GL_BLUE_SIZE", "GL_BUFFER_SIZE", "GL_CONTEXT_DEBUG_FLAG",
+    "GL_CONTEXT_FLAGS", "GL_CONTEXT_FORWARD_COMPATIBLE_FLAG", "GL_CONTEXT_MAJOR_VERSION",
+    "GL_CONTEXT_MINOR_VERSION", "GL_CONTEXT_PROFILE_COMPATIBILITY", "GL_CONTEXT_PROFILE_CORE",
+    "GL_CONTEXT_PROFILE_ES", "GL_CONTEXT_PROFILE_MASK", "GL_CONTEXT_RELEASE_BEHAVIOR",
+    "GL_CONTEXT_RELEASE_BEHAVIOR_FLUSH", "GL_CONTEXT_RELEASE_BEHAVIOR_NONE",
+    "GL_CONTEXT_RESET_ISOLATION_FLAG", "GL_CONTEXT_ROBUST_ACCESS_FLAG", "GL_DEPTH_SIZE",
+    "GL_DOUBLEBUFFER", "GL_FRAMEBUFFER_SRGB_CAPABLE", "GL_GREEN_SIZE", "GL_MULTISAMPLEBUFFERS",
+    "GL_MULTISAMPLESAMPLES", "GL_RED_SIZE", "GL_SHARE_WITH_CURRENT_CONTEXT", "GL_STENCIL_SIZE",
+    "GL_STEREO", "GL_SWAP_CONTROL", "HAT_CENTERED", "HAT_DOWN", "HAT_LEFT", "HAT_LEFTDOWN",
+    "HAT_LEFTUP", "HAT_RIGHT", "HAT_RIGHTDOWN", "HAT_RIGHTUP", "HAT_UP", "HIDDEN", "HWACCEL",
+    "HWPALETTE", "HWSURFACE", "IS_CE", "JOYAXISMOTION", "JOYBALLMOTION", "JOYBUTTONDOWN",
+    "JOYBUTTONUP", "JOYDEVICEADDED", "JOYDEVICEREMOVED", "JOYHATMOTION", "KEYDOWN",
+    "KEYMAPCHANGED", "KEYUP", "KMOD_ALT", "KMOD_CAPS", "KMOD_CTRL", "KMOD_GUI", "KMOD_LALT",
+    "KMOD_LCTRL", "KMOD_LGUI", "KMOD_LMETA", "KMOD_LSHIFT", "KMOD_META", "KMOD_MODE",
+    "KMOD_NONE", "KMOD_NUM", "KMOD_RALT", "KMOD_RCTRL", "KMOD_RGUI", "KMOD_RMETA",
+    "KMOD_RSHIFT", "KMOD_SHIFT", "KSCAN_0", "KSCAN_1", "KSCAN_2", "KSCAN_3", "KSCAN_4",
+    "KSCAN_5", "KSCAN_6", "KSCAN_7", "KSCAN_8", "KSCAN_9", "KSCAN_A", "KSCAN_AC_BACK",
+    "KSCAN_APOSTROPHE", "KSCAN_B", "KSCAN_BACKSLASH", "KSCAN_BACKSPACE", "KSCAN_BREAK",
+    "KSCAN_C", "KSCAN_CAPSLOCK", "KSCAN_CLEAR", "KSCAN_COMMA", "KSCAN_CURRENCYSUBUNIT",
+    "KSCAN_CURRENCYUNIT", "KSCAN_D", "KSCAN_DELETE", "KSCAN_DOWN", "KSCAN_E", "KSCAN_END",
+    "KSCAN_EQUALS", "KSCAN_ESCAPE", "KSCAN_EURO", "KSCAN_F", "KSCAN_F1", "KSCAN_F10",
+    "KSCAN_F11", "KSCAN_F12", "KSCAN_F13", "KSCAN_F14", "KSCAN_F15", "KSCAN_F2", "KSCAN_F3",
+    "KSCAN_F4", "KSCAN_F5", "KSCAN_F6", "KSCAN_F7", "KSCAN_F8", "KSCAN_F9", "KSCAN_G",
+    "KSCAN_GRAVE", "KSCAN_H", "KSCAN_HELP", "KSCAN_HOME", "KSCAN_I", "KSCAN_INSERT",
+    "KSCAN_INTERNATIONAL1", "KSCAN_INTERNATIONAL2", "KSCAN_INTERNATIONAL3",
+    "KSCAN_INTERNATIONAL4", "KSCAN_INTERNATIONAL5", "KSCAN_INTERNATIONAL6",
+    "KSCAN_INTERNATIONAL7", "KSCAN_INTERNATIONAL8", "KSCAN_INTERNATIONAL9", "KSCAN_J",
+    "KSCAN_K", "KSCAN_KP0", "KSCAN_KP1", "KSCAN_KP2", "KSCAN_KP3", "KSCAN_KP4", "KSCAN_KP5",
+    "KSCAN_KP6", "KSCAN_KP7", "KSCAN_KP8", "KSCAN_KP9", "KSCAN_KP_0", "KSCAN_KP_1",
+    "KSCAN_KP_2", "KSCAN_KP_3", "KSCAN_KP_4", "KSCAN_KP_5", "KSCAN_KP_6", "KSCAN_KP_7",
+    "KSCAN_KP_8", "KSCAN_KP_9", "KSCAN_KP_DIVIDE", "KSCAN_KP_ENTER", "KSCAN_KP_EQUALS",
+    "KSCAN_KP_MINUS", "KSCAN_KP_MULTIPLY", "KSCAN_KP_PERIOD", "KSCAN_KP_PLUS", "KSCAN_L",
+    "KSCAN_LALT", "KSCAN_LANG1", "KSCAN_LANG2", "KSCAN_LANG3", "KSCAN_LANG4", "KSCAN_LANG5",
+    "KSCAN_LANG6", "KSCAN_LANG7", "KSCAN_LANG8", "KSCAN_LANG9", "KSCAN_LCTRL", "KSCAN_LEFT",
+    "KSCAN_LEFTBRACKET", "KSCAN_LGUI", "KSCAN_LMETA", "KSCAN_LSHIFT", "KSCAN_LSUPER", "KSCAN_M",
+    "KSCAN_MENU", "KSCAN_MINUS", "KSCAN_MODE", "KSCAN_N", "KSCAN_NONUSBACKSLASH",
+    "KSCAN_NONUSHASH", "KSCAN_NUMLOCK", "KSCAN_NUMLOCKCLEAR", "KSCAN_O", "KSCAN_P",
+    "KSCAN_PAGEDOWN", "KSCAN_PAGEUP", "KSCAN_PAUSE", "KSCAN_PERIOD", "KSCAN_POWER",
+    "KSCAN_PRINT", "KSCAN_PRINTSCREEN", "KSCAN_Q", "KSCAN_R", "KSCAN_RALT", "KSCAN_RCTRL",
+    "KSCAN_RETURN", "KSCAN_RGUI", "KSCAN_RIGHT", "KSCAN_RIGHTBRACKET", "KSCAN_RMETA",
+    "KSCAN_RSHIFT", "KSCAN_RSUPER", "KSCAN_S", "KSCAN_SCROLLLOCK", "KSCAN_SCROLLOCK",
+    "KSCAN_SEMICOLON", "KSCAN_SLASH", "KSCAN_SPACE", "KSCAN_SYSREQ", "KSCAN_T", "KSCAN_TAB",
+    "KSCAN_U", "KSCAN_UNKNOWN", "KSCAN_UP", "KSCAN_V", "KSCAN_W", "KSCAN_X", "KSCAN_Y",
+    "KSCAN_Z", "K_0", "K_1", "K_2", "K_3", "K_4", "K_5", "K_6", "K_7", "K_8", "K_9",
+    "K_AC_BACK", "K_AMPERSAND", "K_ASTERISK", "K_AT", "K_BACKQUOTE", "K_BACKSLASH",
+    "K_BACKSPACE", "K_BREAK", "K_CAPSLOCK", "K_CARET", "K_CLEAR", "K_COLON", "K_COMMA",
+    "K_CURRENCYSUBUNIT", "K_CURRENCYUNIT", "K_DELETE", "K_DOLLAR", "K_DOWN", "K_END",
+    "K_EQUALS", "K_ESCAPE", "K_EURO", "K_EXCLAIM", "K_F1", "K_F10", "K_F11", "K_F12", "K_F13",
+    "K_F14", "K_F15", "K_F2", "K_F3", "K_F4", "K_F5", "K_F6", "K_F7", "K_F8", "K_F9",
+    "K_GREATER", "K_HASH", "K_HELP", "K_HOME", "K_INSERT", "K_KP0", "K_KP1", "K_KP2", "K_KP3",
+    "K_KP4", "K_KP5", "K_KP6", "K_KP7", "K_KP8", "K_KP9", "K_KP_0", "K_KP_1", "K_KP_2",
+    "K_KP_3", "K_KP_4", "K_KP_5", "K_KP_6", "K_KP_7", "K_KP_8", "K_KP_9", "K_KP_DIVIDE",
+    "K_KP_ENTER", "K_KP_EQUALS", "K_KP_MINUS", "K_KP_MULTIPLY", "K_KP_PERIOD", "K_KP_PLUS",
+    "K_LALT", "K_LCTRL", "K_LEFT", "K_LEFTBRACKET", "K_LEFTPAREN", "K_LESS", "K_LGUI",
+    "K_LMETA", "K_LSHIFT", "K_LSUPER", "K_MENU", "K_MINUS", "K_MODE", "K_NUMLOCK",
+    "K_NUMLOCKCLEAR", "K_PAGEDOWN", "K_PAGEUP", "K_PAUSE", "K_PERCENT", "K_PERIOD", "K_PLUS",
+    "K_POWER", "K_PRINT", "K_PRINTSCREEN", "K_QUESTION", "K_QUOTE", "K_QUOTEDBL", "K_RALT",
+    "K_RCTRL", "K_RETURN", "K_RGUI", "K_RIGHT", "K_RIGHTBRACKET", "K_RIGHTPAREN", "K_RMETA",
+    "K_RSHIFT", "K_RSUPER", "K_SCROLLLOCK", "K_SCROLLOCK", "K_SEMICOLON", "K_SLASH", "K_SPACE",
+    "K_SYSREQ", "K_TAB", "K_UNDERSCORE", "K_UNKNOWN", "K_UP", "K_a", "K_b", "K_c", "K_d", "K_e",
+    "K_f", "K_g", "K_h", "K_i", "K_j", "K_k", "K_l", "K_m", "K_n", "K_o", "K_p", "K_q", "K_r",
+    "K_s", "K_t", "K_u", "K_v", "K_w", "K_x", "K_y", "K_z", "LIL_ENDIAN", "LOCALECHANGED",
+    "MIDIIN", "MIDIOUT", "MOUSEBUTTONDOWN", "MOUSEBUTTONUP", "MOUSEMOTION", "MOUSEWHEEL",
+    "MULTIGESTURE", "NOEVENT", "NOFRAME", "NULL_VIDEODRIVER", "NUMEVENTS", "OPENGL",
+    "OPENGLBLIT", "PREALLOC", "QUIT", "RENDER_DEVICE_RESET", "RENDER_TARGETS_RESET",
+    "RESIZABLE", "RLEACCEL", "RLEACCELOK", "SCALED", "SCRAP_BMP", "SCRAP_CLIPBOARD",
+    "SCRAP_PBM", "SCRAP_PPM", "SCRAP_SELECTION", "SCRAP_TEXT", "SCROLL_ERASE", "SCROLL_REPEAT",
+    "SHOWN", "SRCALPHA", "SRCCOLORKEY", "SWSURFACE", "SYSTEM_CURSOR_ARROW",
+    "SYSTEM_CURSOR_CROSSHAIR", "SYSTEM_CURSOR_HAND", "SYSTEM_CURSOR_IBEAM", "SYSTEM_CURSOR_NO",
+    "SYSTEM_CURSOR_SIZEALL", "SYSTEM_CURSOR_SIZENESW", "SYSTEM_CURSOR_SIZENS",
+    "SYSTEM_CURSOR_SIZENWSE", "SYSTEM_CURSOR_SIZEWE", "SYSTEM_CURSOR_WAIT",
+    "SYSTEM_CURSOR_WAITARROW", "SYSWMEVENT", "TEXTEDITING", "TEXTINPUT", "TIMER_RESOLUTION",
+    "USEREVENT", "USEREVENT_DROPFILE", "VIDEOEXPOSE", "VIDEORESIZE", "WINDOWCLOSE",
+    "WINDOWDISPLAYCHANGED", "WINDOWENTER", "WINDOWEXPOSED", "WINDOWFOCUSGAINED",
+    "WINDOWFOCUSLOST", "WINDOWHIDDEN", "WINDOWHITTEST", "WINDOWICCPROFCHANGED", "WINDOWLEAVE",
+    "WINDOWMAXIMIZED", "WINDOWMINIMIZED", "WINDOWMOVED", "WINDOWPOS_CENTERED",
+    "WINDOWPOS_UNDEFINED", "WINDOWRESIZED", "WINDOWRESTORED", "WINDOWSHOWN",
+    "WINDOWSIZECHANGED", "WINDOWTAKEFOCUS",
+)
+PYGAME_CONSTANT_NAMES: frozenset[str] = frozenset(PYGAME_CONSTANTS)
+
+__all__ = [*PYGAME_CONSTANTS, "Constants"]
+
+def __getattr__(name: str):
+    """Résout une constante pygame au premier accès, puis la met en cache dans le module."""
+    if name in PYGAME_CONSTANT_NAMES:
+        value = getattr(pygame, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | PYGAME_CONSTANT_NAMES)
 
 class Constants:
 
@@ -5,6 +5,8 @@ from abc import abstractmethod
 
 class Drawable(rf.Entity):
     """Classe de base pour les entités dessinables."""
+    __slots__ = ("visible", "convert_alpha", "surface_flags", "surface")
+
     def __init__(
             self, 
             size: tuple[int, int] | None = None, 
@@ -29,4 +31,19 @@ class Drawable(rf.Entity):
     def draw(self, surface: pygame.Surface) -> None:
         """Dessine l'entité sur la surface donnée."""
         if self.visible:
-            surface.blit(self.surface, self.rect.topleft)
\ No newline at end of file
+            surface.blit(self.surface, self.rect.topleft)
+
+    @staticmethod
+    def get_surface_bytes(surface: pygame.Surface | None) -> int:
+        """Retourne la taille en mémoire des pixels d'une surface."""
+        if surface is None:
+            return 0
+        return surface.get_pitch() * surface.get_height()
+
+    def get_memory_usage(self) -> int:
+        return self.get_surface_bytes(self.surface)
+
+    def reset(self) -> None:
+        """Réinitialise l'entité (la surface est conservée)."""
+        super().reset()
+        self.visible = True
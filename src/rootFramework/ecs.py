@@ -0,0 +1,378 @@
+import rootFramework as rf
+import numpy as np
+import pygame
+from typing import Any, Callable
+
+class ComponentSpec:
+    """Description d'un composant : type NumPy (None = objet Python), forme et valeur par défaut."""
+
+    def __init__(self, name: str, dtype: Any = np.float32, shape: tuple[int, ...] = (), default: Any = 0):
+        self.name: str = name
+        self.dtype = None if dtype is None else np.dtype(dtype)
+        self.shape: tuple[int, ...] = shape
+        self.default = default
+
+    def allocate(self, capacity: int) -> np.ndarray | list:
+        """Crée une colonne vide pour ce composant."""
+        if self.dtype is None:
+            return [None] * capacity
+        return np.zeros((capacity, *self.shape), dtype=self.dtype)
+
+
+class Archetype:
+    """
+    Table stockant toutes les entités ECS qui ont exactement le même ensemble de composants.
+    Chaque composant est une colonne (tableau NumPy pour les données numériques).
+    """
+
+    def __init__(self, signature: frozenset[str], specs: dict[str, ComponentSpec], capacity: int = 64):
+        self.signature: frozenset[str] = signature
+        self.specs: dict[str, ComponentSpec] = {name: specs[name] for name in signature}
+        self.capacity: int = capacity
+        self.count: int = 0
+        self.entities: list[int] = []
+        self.columns: dict[str, np.ndarray | list] = {
+            name: spec.allocate(capacity) for name, spec in self.specs.items()
+        }
+
+    def __len__(self) -> int:
+        return self.count
+
+    def view(self, name: str) -> np.ndarray | list:
+        """Retourne la partie utilisée d'une colonne (vue modifiable pour NumPy)."""
+        return self.columns[name][:self.count]
+
+    def _grow(self) -> None:
+        """Double la capacité de la table."""
+        self.capacity *= 2
+        for name, spec in self.specs.items():
+            column = self.columns[name]
+            if spec.dtype is None:
+                column.extend([None] * (self.capacity - len(column)))
+            else:
+                grown = spec.allocate(self.capacity)
+                grown[:self.count] = column[:self.count]
+                self.columns[name] = grown
+
+    def append(self, entity: int, values: dict[str, Any]) -> int:
+        """Ajoute une ligne et retourne son index."""
+        if self.count == self.capacity:
+            self._grow()
+        row = self.count
+        for name, spec in self.specs.items():
+            self.columns[name][row] = values.get(name, spec.default)
+        self.entities.append(entity)
+        self.count += 1
+        return row
+
+    def read(self, row: int) -> dict[str, Any]:
+        """Retourne les valeurs d'une ligne."""
+        values = {}
+        for name, spec in self.specs.items():
+            value = self.columns[name][row]
+            values[name] = value.copy() if spec.dtype is not None and spec.shape else value
+        return values
+
+    def remove(self, row: int) -> int | None:
+        """Retire une ligne en y déplaçant la dernière. Retourne l'entité déplacée (ou None)."""
+        last = self.count - 1
+        moved = None
+        if row != last:
+            for name in self.specs:
+                column = self.columns[name]
+                column[row] = column[last]
+            moved = self.entities[last]
+            self.entities[row] = moved
+        for name, spec in self.specs.items():
+            if spec.dtype is None:
+                self.columns[name][last] = None
+        self.entities.pop()
+        self.count -= 1
+        return moved
+
+
+class World:
+    """
+    Monde ECS optionnel : les entités sont des identifiants, leurs composants sont
+    rangés dans des tables par archétype et les systèmes traitent des tables entières.
+    """
+
+    def __init__(self):
+        self.components: dict[str, ComponentSpec] = {}
+        self.archetypes: dict[frozenset[str], Archetype] = {}
+        self.locations: dict[int, tuple[Archetype, int]] = {}
+        self.next_entity: int = 0
+        self.query_cache: dict[frozenset[str], list[Archetype]] = {}
+        self.update_systems: list[Callable[["World", float], None]] = []
+        self.draw_systems: list[Callable[["World", pygame.Surface, "rf.Camera | None"], None]] = []
+        self.pending_destroy: list[int] = []
+        self.updating: bool = False
+        register_default_components(self)
+
+    # ----------------------
+    # Composants et entités
+    # ----------------------
+    def register_component(self, name: str, dtype: Any = np.float32,
+                           shape: tuple[int, ...] = (), default: Any = 0) -> None:
+        """Déclare un composant (dtype=None pour stocker des objets Python)."""
+        self.components[name] = ComponentSpec(name, dtype, shape, default)
+
+    def _get_archetype(self, signature: frozenset[str]) -> Archetype:
+        """Retourne (ou crée) la table correspondant à un ensemble de composants."""
+        archetype = self.archetypes.get(signature)
+        if archetype is None:
+            unknown = signature - self.components.keys()
+            if unknown:
+                raise KeyError(f"Unknown components: {sorted(unknown)}")
+            archetype = Archetype(signature, self.components)
+            self.archetypes[signature] = archetype
+            self.query_cache.clear()
+        return archetype
+
+    def create(self, **components: Any) -> int:
+        """Crée une entité ECS avec les composants donnés et retourne son identifiant."""
+        entity = self.next_entity
+        self.next_entity += 1
+        archetype = self._get_archetype(frozenset(components))
+        self.locations[entity] = (archetype, archetype.append(entity, components))
+        return entity
+
+    def destroy(self, entity: int) -> None:
+        """Détruit une entité ECS (différé si les systèmes sont en cours d'exécution)."""
+        if self.updating:
+            self.pending_destroy.append(entity)
+            return
+        location = self.locations.pop(entity, None)
+        if location is None:
+            return
+        archetype, row = location
+        moved = archetype.remove(row)
+        if moved is not None:
+            self.locations[moved] = (archetype, row)
+
+    def read(self, entity: int) -> dict[str, Any]:
+        """Retourne une copie des composants d'une entité."""
+        archetype, row = self.locations[entity]
+        return archetype.read(row)
+
+    def exists(self, entity: int) -> bool:
+        """Vérifie si une entité ECS existe."""
+        return entity in self.locations
+
+    def has(self, entity: int, name: str) -> bool:
+        """Vérifie si une entité possède un composant."""
+        return name in self.locations[entity][0].signature
+
+    def get(self, entity: int, name: str) -> Any:
+        """Retourne la valeur d'un composant (vue modifiable pour les composants vectoriels)."""
+        archetype, row = self.locations[entity]
+        return archetype.columns[name][row]
+
+    def set(self, entity: int, name: str, value: Any) -> None:
+        """Modifie la valeur d'un composant existant."""
+        archetype, row = self.locations[entity]
+        archetype.columns[name][row] = value
+
+    def add_component(self, entity: int, name: str, value: Any = None) -> None:
+        """Ajoute (ou remplace) un composant : l'entité change d'archétype si nécessaire."""
+        archetype, row = self.locations[entity]
+        if name in archetype.signature:
+            archetype.columns[name][row] = value
+            return
+        values = archetype.read(row)
+        values[name] = self.components[name].default if value is None else value
+        self._move(entity, values)
+
+    def remove_component(self, entity: int, name: str) -> None:
+        """Retire un composant : l'entité change d'archétype."""
+        archetype, row = self.locations[entity]
+        if name not in archetype.signature:
+            return
+        values = archetype.read(row)
+        del values[name]
+        self._move(entity, values)
+
+    def _move(self, entity: int, values: dict[str, Any]) -> None:
+        """Déplace une entité vers l'archétype correspondant à ses nouvelles valeurs."""
+        archetype, row = self.locations[entity]
+        moved = archetype.remove(row)
+        if moved is not None:
+            self.locations[moved] = (archetype, row)
+        target = self._get_archetype(frozenset(values))
+        self.locations[entity] = (target, target.append(entity, values))
+
+    def query(self, *names: str) -> list[Archetype]:
+        """Retourne les archétypes (non vides) possédant tous les composants demandés."""
+        key = frozenset(names)
+        archetypes = self.query_cache.get(key)
+        if archetypes is None:
+            archetypes = [a for sig, a in self.archetypes.items() if key <= sig]
+            self.query_cache[key] = archetypes
+        return [a for a in archetypes if a.count]
+
+    # ----------------------
+    # Systèmes
+    # ----------------------
+    def add_system(self, system: Callable, draw: bool = False) -> None:
+        """Ajoute un système de mise à jour (world, dt) ou de rendu (world, surface, camera)."""
+        (self.draw_systems if draw else self.update_systems).append(system)
+
+    def update(self, dt: float) -> None:
+        """Exécute les systèmes de mise à jour puis applique les destructions différées."""
+        self.updating = True
+        try:
+            for system in self.update_systems:
+                system(self, dt)
+        finally:
+            self.updating = False
+        pending, self.pending_destroy = self.pending_destroy, []
+        for entity in pending:
+            self.destroy(entity)
+
+    def draw(self, surface: pygame.Surface, camera: "rf.Camera | None" = None) -> None:
+        """Exécute les systèmes de rendu."""
+        for system in self.draw_systems:
+            system(self, surface, camera)
+
+
+def register_default_components(world: World) -> None:
+    """Déclare les composants utilisés par les systèmes intégrés."""
+    world.register_component("position", np.float32, (2,))
+    world.register_component("velocity", np.float32, (2,))
+    world.register_component("gravity", np.float32, default=1500.0)
+    world.register_component("friction", np.float32, default=0.95)
+    world.register_component("max_speed", np.float32, default=400.0)
+    world.register_component("sprite", None, default=None)         # pygame.Surface courante
+    world.register_component("frames", None, default=None)         # liste de pygame.Surface
+    world.register_component("frame_duration", np.float32, default=0.1)
+    world.register_component("frame_time", np.float32)
+    world.register_component("frame_index", np.int32)
+
+
+def physics_system(world: World, dt: float) -> None:
+    """Intègre gravité, frottement, vitesse maximale et déplacement pour toutes les tables."""
+    for archetype in world.query("position", "velocity"):
+        velocity = archetype.view("velocity")
+        if "gravity" in archetype.signature:
+            velocity[:, 1] += archetype.view("gravity") * dt
+        if "max_speed" in archetype.signature:
+            speed = np.hypot(velocity[:, 0], velocity[:, 1])
+            max_speed = archetype.view("max_speed")
+            scale = np.where(speed > max_speed, max_speed / np.maximum(speed, 1e-9), 1.0)
+            velocity *= scale[:, None]
+        if "friction" in archetype.signature:
+            velocity[:, 0] *= archetype.view("friction")
+        archetype.view("position")[:] += velocity * dt
+
+
+def animation_system(world: World, dt: float) -> None:
+    """Fait avancer les animations et ne remplace la surface que des lignes dont la frame change."""
+    for archetype in world.query("frames", "frame_duration", "frame_time", "frame_index", "sprite"):
+        frame_time = archetype.view("frame_time")
+        frame_time += dt
+        duration = np.maximum(archetype.view("frame_duration"), 1e-6)
+        steps = np.floor(frame_time / duration).astype(np.int32)
+        changed = np.flatnonzero(steps)
+        if not len(changed):
+            continue
+        frame_time -= steps * duration
+        frame_index = archetype.view("frame_index")
+        frames = archetype.columns["frames"]
+        sprites = archetype.columns["sprite"]
+        for row in changed.tolist():
+            clip = frames[row]
+            if clip:
+                index = (int(frame_index[row]) + int(steps[row])) % len(clip)
+                frame_index[row] = index
+                sprites[row] = clip[index]
+
+
+def render_system(world: World, surface: pygame.Surface, camera: "rf.Camera | None" = None) -> None:
+    """Dessine toutes les entités ayant une position et une surface en un appel Surface.blits par table."""
+    for archetype in world.query("position", "sprite"):
+        positions = archetype.view("position")
+        if camera is not None:
+            positions = (positions - (camera.pos.x, camera.pos.y)) * camera.zoom
+        sprites = archetype.view("sprite")
+        surface.blits(
+            [(sprite, position) for sprite, position in zip(sprites, positions.tolist()) if sprite is not None],
+            doreturn=False,
+        )
+
+
+def default_world() -> World:
+    """Crée un monde avec les systèmes intégrés (physique, animation, rendu)."""
+    world = World()
+    world.add_system(physics_system)
+    world.add_system(animation_system)
+    world.add_system(render_system, draw=True)
+    return world
+
+
+class EcsEntity(rf.Entity):
+    """
+    Adaptateur permettant à une entité ECS de cohabiter avec les entités classiques
+    d'une scène (tags, UID, collisions via rect...). Le rect suit le composant position.
+    Hors de sa scène, l'entité ECS est détruite et ses composants conservés dans l'adaptateur ;
+    elle est recréée lorsque l'adaptateur est de nouveau ajouté à une scène.
+    """
+    __slots__ = ("world", "entity", "detached")
+
+    def __init__(self, world: World, size: tuple[int, int] = (0, 0), **components: Any):
+        super().__init__()
+        self.world: World = world
+        self.entity: int = world.create(**components)
+        self.detached: dict[str, Any] | None = None  # Composants conservés pendant que la ligne ECS est détruite
+        self.rect.size = size
+        self.sync_rect()
+
+    def has(self, name: str) -> bool:
+        """Vérifie si l'entité possède un composant."""
+        if self.detached is not None:
+            return name in self.detached
+        return self.world.has(self.entity, name)
+
+    def get(self, name: str) -> Any:
+        """Retourne la valeur d'un composant."""
+        if self.detached is not None:
+            return self.detached[name]
+        return self.world.get(self.entity, name)
+
+    def set(self, name: str, value: Any) -> None:
+        """Modifie la valeur d'un composant."""
+        if self.detached is None:
+            self.world.set(self.entity, name, value)
+        elif name in self.detached:
+            self.detached[name] = value
+        else:
+            raise KeyError(name)
+
+    def sync_rect(self) -> None:
+        """Recopie la position ECS dans le rect."""
+        if self.has("position"):
+            self.rect.topleft = tuple(float(value) for value in self.get("position"))
+
+    def set_position(self, x: float, y: float):
+        """Définit la position (dans le rect et dans le composant position)."""
+        super().set_position(x, y)
+        if self.has("position"):
+            self.set("position", (x, y))
+        return self
+
+    def do_when_added(self) -> None:
+        """Recrée l'entité ECS si l'adaptateur avait quitté une scène."""
+        if self.detached is None:
+            return
+        self.entity = self.world.create(**self.detached)
+        self.detached = None
+
+    def do_when_removed(self) -> None:
+        """Détruit l'entité ECS quand l'adaptateur quitte sa scène (ses composants sont conservés)."""
+        if not self.world.exists(self.entity):
+            return
+        self.detached = self.world.read(self.entity)
+        self.world.destroy(self.entity)
+
+    def update(self, dt: float):
+        """Synchronise le rect (les données sont mises à jour par les systèmes du monde)."""
+        self.sync_rect()
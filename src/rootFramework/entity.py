@@ -1,29 +1,110 @@
 import pygame
 import rootFramework as rf
+import weakref
 from typing import Self
 from abc import ABC, abstractmethod
 
 class Entity(ABC):
-    count = 0
-    available_uids: set[int] = set()
+    # Attributs fixes : pas de __dict__ par instance (les sous-classes sans __slots__ en retrouvent un)
+    __slots__ = (
+        "uid", "rect", "tags", "parent_scene", "debug_color", "pool",
+        "update_mode", "update_interval", "update_phase", "skipped_dt", "__weakref__",
+    )
+
+    # Politiques de mise à jour (voir Scene.set_update_lod)
+    UPDATE_AUTO = "auto"            # choisie par la scène selon la distance à la caméra
+    UPDATE_ALWAYS = "always"        # à chaque frame
+    UPDATE_THROTTLED = "throttled"  # toutes les update_interval frames, avec le dt cumulé
+    UPDATE_FROZEN = "frozen"        # jamais
+
+    # Registre global des UID : un UID encode un emplacement et une génération.
+    # Quand un emplacement est libéré, sa génération augmente : les anciens UID
+    # ne retrouvent alors plus aucune entité au lieu de désigner la suivante.
+    UID_INDEX_BITS = 32
+    UID_INDEX_MASK = (1 << UID_INDEX_BITS) - 1
+    uid_slots: list[weakref.ref | None] = []
+    uid_generations: list[int] = []
+    free_uid_slots: list[int] = []
 
     def __init__(self, *args, **kwargs):
         """Initialise l'entité avec des arguments et des mots-clés."""
-
-        if Entity.available_uids:
-            self.uid = Entity.available_uids.pop()
-        else:
-            self.uid = Entity.count
-            Entity.count += 1
+        self.uid: int | None = None
+        self.acquire_uid()
 
         self.rect = pygame.FRect(0, 0, 0, 0)
         self.tags: list[str] = []
         self.parent_scene: rf.Scene | None = None
         self.debug_color: tuple = (255, 0, 0)
+        self.pool: "rf.EntityPool | None" = None  # Réserve d'origine si l'entité est recyclée
+
+        self.update_mode: str = Entity.UPDATE_AUTO
+        self.update_interval: int = 4
+        self.update_phase: int = 0     # Décalage pour répartir les entités ralenties sur les frames
+        self.skipped_dt: float = 0.0   # Temps cumulé depuis la dernière mise à jour
+
+    def acquire_uid(self) -> int:
+        """Attribue un nouvel UID à l'entité (si elle n'en a pas déjà un)."""
+        if self.uid is not None:
+            return self.uid
+        if Entity.free_uid_slots:
+            index = Entity.free_uid_slots.pop()
+        else:
+            index = len(Entity.uid_slots)
+            Entity.uid_slots.append(None)
+            Entity.uid_generations.append(0)
+        Entity.uid_slots[index] = weakref.ref(self, lambda ref, index=index: Entity._release_slot(index, ref))
+        self.uid = index | (Entity.uid_generations[index] << Entity.UID_INDEX_BITS)
+        return self.uid
 
-    def __del__(self):
-        """Nettoyage de l'entité."""
-        Entity.available_uids.add(self.uid)
+    def release_uid(self) -> None:
+        """Libère l'UID de l'entité : les recherches avec cet UID échoueront désormais."""
+        if self.uid is None:
+            return
+        index = self.uid & Entity.UID_INDEX_MASK
+        Entity._release_slot(index, Entity.uid_slots[index])
+        self.uid = None
+
+    @staticmethod
+    def _release_slot(index: int, ref: weakref.ref | None) -> None:
+        """Libère un emplacement du registre s'il correspond toujours à la référence donnée."""
+        if ref is None or Entity.uid_slots[index] is not ref:
+            return
+        Entity.uid_slots[index] = None
+        Entity.uid_generations[index] += 1
+        Entity.free_uid_slots.append(index)
+
+    @staticmethod
+    def get_entity(uid: int) -> "Entity | None":
+        """Retourne l'entité vivante correspondant à un UID, ou None si l'UID est périmé."""
+        index = uid & Entity.UID_INDEX_MASK
+        if index >= len(Entity.uid_slots):
+            return None
+        if Entity.uid_generations[index] != uid >> Entity.UID_INDEX_BITS:
+            return None
+        ref = Entity.uid_slots[index]
+        return ref() if ref is not None else None
+
+    def renew_uid(self) -> int:
+        """Change la génération de l'UID en conservant son emplacement (réutilisation par une réserve)."""
+        if self.uid is None:
+            return self.acquire_uid()
+        index = self.uid & Entity.UID_INDEX_MASK
+        Entity.uid_generations[index] += 1
+        self.uid = index | (Entity.uid_generations[index] << Entity.UID_INDEX_BITS)
+        return self.uid
+
+    def reset(self) -> None:
+        """Réinitialise l'entité avant sa réutilisation par une EntityPool. À surcharger au besoin."""
+        self.rect.topleft = (0, 0)
+        self.tags.clear()
+        self.skipped_dt = 0.0
+
+    def set_update_mode(self, mode: str, interval: int | None = None) -> Self:
+        """Définit la politique de mise à jour de l'entité (UPDATE_AUTO, UPDATE_ALWAYS, ...)."""
+        self.update_mode = mode
+        if interval is not None:
+            self.update_interval = max(1, interval)
+        return self
 
     def set_position(self, x: float, y: float) -> Self:
         """Définit la position de l'entité par rapport au coin supérieur gauche."""
@@ -54,17 +135,37 @@ class Entity(ABC):
         """Actions à effectuer lorsque l'entité est retirée d'une scène."""
         pass
 
+    def do_hibernate(self) -> None:
+        """Libère les données reconstructibles (surfaces) lorsque la scène hiberne. À surcharger au besoin."""
+        pass
+
+    def do_wake(self) -> None:
+        """Reconstruit les données libérées par do_hibernate. À surcharger au besoin."""
+        pass
+
+    def get_memory_usage(self) -> int:
+        """Retourne la mémoire (en octets) des surfaces et tableaux propres à l'entité."""
+        return 0
+
     def add_tags(self, *tags: str) -> Self:
-        """Ajoute des tags à l'entité."""
-        for tag in tags:
-            if tag not in self.tags:
-                self.tags.append(tag)
+        """Ajoute des tags à l'entité (et met à jour l'index de la scène parente)."""
+        added = [tag for tag in dict.fromkeys(tags) if tag not in self.tags]
+        if not added:
+            return self
+        self.tags.extend(added)
         self.tags.sort()
+        if self.parent_scene is not None:
+            self.parent_scene.index_tags(self, added)
         return self
 
     def remove_tags(self, *tags: str):
-        """Retire des tags de l'entité."""
+        """Retire des tags de l'entité (et met à jour l'index de la scène parente)."""
+        removed = [tag for tag in self.tags if tag in tags]
+        if not removed:
+            return
         self.tags = [tag for tag in self.tags if tag not in tags]
+        if self.parent_scene is not None:
+            self.parent_scene.unindex_tags(self, removed)
 
     def has_tags(self, *tags: str) -> bool:
         """Vérifie si l'entité a tous les tags spécifiés."""
@@ -74,16 +175,34 @@ class Entity(ABC):
         """Retourne la liste des tags de l'entité."""
         return self.tags
     
+    def listen(self, event_type: int, callback, code: int | None = None) -> Self:
+        """
+        Abonne une méthode de l'entité au bus d'événements de sa scène parente
+        (ex. dans do_when_added). L'abonnement est retiré avec l'entité.
+
+        event_type : type pygame (ex. pygame.KEYDOWN)
+        callback   : fonction appelée avec l'événement
+        code       : touche ou bouton ciblé (ex. pygame.K_SPACE) ; None = tous
+        """
+        if self.parent_scene is None:
+            print(f"Impossible d'écouter l'événement {pygame.event.event_name(event_type)} : l'entité n'a pas de scène.")
+            return self
+        self.parent_scene.event_bus.subscribe(event_type, callback, code, owner=self)
+        return self
+
     def process_event(self, event: pygame.Event):
-        self.do_process_actions(event)
         self.do_handle_event(event)
 
-    def do_process_actions(self, event: pygame.Event) -> None:
-        """Actions à effectuer lors du traitement d'un événement."""
+    def handles_actions(self) -> bool:
+        """Vérifie si l'entité surcharge do_process_actions (elle reçoit alors les actions à chaque frame)."""
+        return type(self).do_process_actions is not Entity.do_process_actions
+
+    def do_process_actions(self, actions: "rf.ActionState") -> None:
+        """Réagit aux actions résolues de la frame (une fois par frame, avant la mise à jour)."""
         pass
 
     def do_reset_actions(self) -> None:
-        """Réinitialise les actions de l'entité."""
+        """Réinitialise les actions de l'entité (la scène ne reçoit plus les entrées)."""
         pass
 
     def do_handle_event(self, event: pygame.Event) -> None:
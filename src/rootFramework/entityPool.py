@@ -0,0 +1,61 @@
+import rootFramework as rf
+from typing import Callable
+
+class EntityPool:
+    """
+    Réserve d'entités pré-allouées pour les objets à courte durée de vie (projectiles, effets...).
+    Une entité obtenue par acquire() retourne automatiquement dans la réserve lorsqu'elle
+    est retirée de sa scène ; son emplacement d'UID et sa surface sont réutilisés.
+    """
+
+    def __init__(self, factory: Callable[[], "rf.Entity"], size: int = 0, max_size: int | None = None):
+        """
+        factory  : fonction créant une nouvelle entité
+        size     : nombre d'entités pré-allouées
+        max_size : nombre maximal d'entités conservées dans la réserve (None = illimité)
+        """
+        self.factory = factory
+        self.max_size: int | None = max_size
+        self.available: list[rf.Entity] = []
+        self.prefill(size)
+
+    def __len__(self) -> int:
+        return len(self.available)
+
+    def prefill(self, count: int) -> None:
+        """Pré-alloue des entités dans la réserve."""
+        for _ in range(count):
+            if self.max_size is not None and len(self.available) >= self.max_size:
+                break
+            entity = self.factory()
+            entity.pool = self
+            self.available.append(entity)
+
+    def acquire(self) -> "rf.Entity":
+        """
+        Retourne une entité de la réserve (ou en crée une), réinitialisée par reset().
+        L'appelant la configure ensuite (position, vitesse...) avant de l'ajouter à une scène.
+        """
+        if self.available:
+            entity = self.available.pop()
+        else:
+            entity = self.factory()
+            entity.pool = self
+        entity.reset()
+        return entity
+
+    def release(self, entity: "rf.Entity") -> None:
+        """Rend une entité à la réserve (appelé par la scène lors de son retrait)."""
+        scene = entity.parent_scene
+        if scene is not None:
+            # Le retrait de la scène rappellera release()
+            scene.remove_world_entity(entity)
+            scene.remove_hud_entity(entity)
+            return
+        if self.max_size is not None and len(self.available) >= self.max_size:
+            entity.pool = None
+            entity.release_uid()
+            return
+        # Nouvelle génération : les anciens UID de cette entité deviennent périmés
+        entity.renew_uid()
+        self.available.append(entity)
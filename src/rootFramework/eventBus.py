@@ -0,0 +1,131 @@
+import rootFramework as rf
+import pygame
+from typing import Callable, Hashable, Self
+
+# Types d'événements dont le code (touche, bouton) permet un abonnement ciblé
+KEY_EVENTS = (pygame.KEYDOWN, pygame.KEYUP)
+BUTTON_EVENTS = (
+    pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+    pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP,
+    pygame.CONTROLLERBUTTONDOWN, pygame.CONTROLLERBUTTONUP,
+)
+
+class EventBus:
+    """
+    Bus d'événements indexé par type.
+    Les abonnés s'inscrivent à un type d'événement pygame, éventuellement restreint
+    à une touche (KEYDOWN/KEYUP) ou à un bouton (souris, manette) : un événement
+    n'est transmis qu'aux abonnés concernés, au lieu de parcourir toutes les entités.
+    """
+
+    def __init__(self):
+        # { type ou (type, code): [(callback, propriétaire)] } ; les listes sont remplacées
+        # (jamais modifiées) pour pouvoir s'abonner/se désabonner pendant un dispatch
+        self.subscribers: dict[Hashable, list[tuple[Callable[[pygame.Event], None], object]]] = {}
+        # { propriétaire: clés auxquelles il est abonné } (voir unsubscribe_all)
+        self.owner_keys: dict[object, set[Hashable]] = {}
+
+    @staticmethod
+    def get_key(event_type: int, code: int | None = None) -> Hashable:
+        """Retourne la clé d'abonnement d'un type d'événement (et d'un code de touche/bouton)."""
+        return event_type if code is None else (event_type, code)
+
+    @staticmethod
+    def get_event_code(event: pygame.Event) -> int | None:
+        """Retourne le code de touche ou de bouton d'un événement (None si sans objet)."""
+        if event.type in KEY_EVENTS:
+            return event.key
+        if event.type in BUTTON_EVENTS:
+            return event.button
+        return None
+
+    def subscribe(self, event_type: int, callback: Callable[[pygame.Event], None],
+                  code: int | None = None, owner: object = None) -> Self:
+        """
+        Abonne une fonction à un type d'événement.
+
+        event_type : type pygame (ex. pygame.KEYDOWN)
+        callback   : fonction appelée avec l'événement
+        code       : touche ou bouton ciblé (ex. pygame.K_SPACE) ; None = tous
+        owner      : propriétaire de l'abonnement, pour unsubscribe_all
+        """
+        key = self.get_key(event_type, code)
+        self.subscribers[key] = self.subscribers.get(key, []) + [(callback, owner)]
+        if owner is not None:
+            self.owner_keys.setdefault(owner, set()).add(key)
+        return self
+
+    def unsubscribe(self, event_type: int, callback: Callable[[pygame.Event], None],
+                    code: int | None = None) -> Self:
+        """Désabonne une fonction d'un type d'événement."""
+        key = self.get_key(event_type, code)
+        subscribers = self.subscribers.get(key)
+        if subscribers is None:
+            return self
+        remaining = [entry for entry in subscribers if entry[0] != callback]
+        if remaining:
+            self.subscribers[key] = remaining
+        else:
+            del self.subscribers[key]
+        return self
+
+    def unsubscribe_all(self, owner: object) -> Self:
+        """Retire tous les abonnements d'un propriétaire (ex. entité retirée de sa scène)."""
+        for key in self.owner_keys.pop(owner, ()):
+            remaining = [entry for entry in self.subscribers.get(key, ()) if entry[1] is not owner]
+            if remaining:
+                self.subscribers[key] = remaining
+            else:
+                self.subscribers.pop(key, None)
+        return self
+
+    def has_subscribers(self, event_type: int, code: int | None = None) -> bool:
+        """Vérifie si un type d'événement (ou un code précis) a des abonnés."""
+        return self.get_key(event_type, code) in self.subscribers
+
+    def dispatch(self, event: pygame.Event) -> None:
+        """Transmet un événement aux abonnés de son type, puis à ceux de son code."""
+        subscribers = self.subscribers.get(event.type)
+        if subscribers:
+            for callback, _ in subscribers:
+                callback(event)
+        code = self.get_event_code(event)
+        if code is not None:
+            subscribers = self.subscribers.get((event.type, code))
+            if subscribers:
+                for callback, _ in subscribers:
+                    callback(event)
+
+    def clear(self) -> None:
+        """Retire tous les abonnements."""
+        self.subscribers.clear()
+        self.owner_keys.clear()
+
+
+def coalesce_events(events: list[pygame.Event], event_types: set[int]) -> list[pygame.Event]:
+    """
+    Ne conserve que le dernier événement de chaque type donné (ex. MOUSEMOTION),
+    à sa position dans la file. Les déplacements relatifs (rel) sont cumulés.
+    """
+    latest: dict[int, int] = {}
+    rel: dict[int, tuple[int, int]] = {}
+    for index, event in enumerate(events):
+        if event.type in event_types:
+            latest[event.type] = index
+            if hasattr(event, "rel"):
+                dx, dy = rel.get(event.type, (0, 0))
+                rel[event.type] = (dx + event.rel[0], dy + event.rel[1])
+    if not latest:
+        return events
+
+    coalesced = []
+    for index, event in enumerate(events):
+        if event.type not in latest:
+            coalesced.append(event)
+        elif latest[event.type] == index:
+            if event.type in rel:
+                attributes = event.dict.copy()
+                attributes["rel"] = rel[event.type]
+                event = pygame.event.Event(event.type, attributes)
+            coalesced.append(event)
+    return coalesced
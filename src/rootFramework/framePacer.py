@@ -0,0 +1,131 @@
+import rootFramework as rf
+import pygame
+import time
+from collections import deque
+
+class FramePacer:
+    """
+    Politique de cadencement de la boucle principale.
+
+    UNCAPPED : aucune attente, aussi vite que possible
+    CAPPED   : limité à fps (attente passive, précision de l'ordonnanceur)
+    BUSY     : limité à fps avec Clock.tick_busy_loop (précis, mais occupe un cœur)
+    ADAPTIVE : limité à fps, ou à unfocused_fps si la fenêtre n'a pas le focus ;
+               le rendu est sauté quand la frame précédente a dépassé son budget
+               (la simulation reste en temps réel) ou quand la fenêtre est réduite
+    """
+    UNCAPPED = "uncapped"
+    CAPPED = "capped"
+    BUSY = "busy"
+    ADAPTIVE = "adaptive"
+
+    def __init__(self,
+                 mode: str = CAPPED,
+                 fps: int | None = None,          # par défaut, Constants.FPS
+                 unfocused_fps: int = 15,
+                 max_frame_skip: int = 2,         # rendus sautés consécutifs au maximum
+                 max_dt: float = 0.25,            # dt maximal rendu (évite la spirale après un gel)
+                 history: int = 240):             # nombre de frames conservées pour les statistiques
+        self.clock = pygame.time.Clock()
+        self.mode = mode
+        self.fps = fps if fps is not None else rf.Constants.FPS
+        self.unfocused_fps = unfocused_fps
+        self.max_frame_skip = max_frame_skip
+        self.max_dt = max_dt
+
+        self.focused = True
+        self.minimized = False
+        self.last_tick = time.perf_counter()
+        self.last_work = 0.0
+        self.skipped_in_row = 0
+
+        # Statistiques : marge (budget - travail, négative en cas de dépassement) par frame
+        self.slack_history: deque[float] = deque(maxlen=history)
+        self.frame_count = 0
+        self.overrun_count = 0
+        self.skipped_renders = 0
+
+    def set_mode(self, mode: str, fps: int | None = None) -> None:
+        """Change la politique de cadencement (et éventuellement la cible)."""
+        if mode not in (self.UNCAPPED, self.CAPPED, self.BUSY, self.ADAPTIVE):
+            raise ValueError(f"Unknown frame pacing mode '{mode}'.")
+        self.mode = mode
+        if fps is not None:
+            self.fps = fps
+
+    def get_target_fps(self) -> int:
+        """Retourne la cible de la frame courante (0 = sans limite)."""
+        if self.mode == self.UNCAPPED:
+            return 0
+        if self.mode == self.ADAPTIVE and (not self.focused or self.minimized):
+            return self.unfocused_fps
+        return self.fps
+
+    def _poll_window_state(self) -> None:
+        if pygame.display.get_init() and pygame.display.get_surface() is not None:
+            self.minimized = not pygame.display.get_active()
+            self.focused = pygame.key.get_focused()
+
+    def reset(self) -> None:
+        """Repart d'une frame neuve (à appeler avant d'entrer dans la boucle)."""
+        self.clock.tick()
+        self.last_tick = time.perf_counter()
+        self.skipped_in_row = 0
+
+    def tick(self) -> float:
+        """
+        Termine la frame : mesure le travail effectué, attend selon la politique,
+        puis retourne le temps réel écoulé depuis le tick précédent (s, borné à max_dt).
+        """
+        start = time.perf_counter()
+        self.last_work = start - self.last_tick
+
+        if self.mode == self.ADAPTIVE:
+            self._poll_window_state()
+        target = self.get_target_fps()
+        if target:
+            slack = 1.0 / target - self.last_work
+            self.slack_history.append(slack)
+            if slack < 0:
+                self.overrun_count += 1
+        self.frame_count += 1
+
+        if self.mode == self.BUSY:
+            self.clock.tick_busy_loop(target)
+        else:
+            self.clock.tick(target)
+
+        now = time.perf_counter()
+        dt = now - self.last_tick
+        self.last_tick = now
+        return min(dt, self.max_dt)
+
+    def should_render(self) -> bool:
+        """Indique si la frame courante doit être dessinée."""
+        if self.mode != self.ADAPTIVE:
+            return True
+        if self.minimized:
+            return False
+        target = self.get_target_fps()
+        if target and self.last_work > 1.0 / target and self.skipped_in_row < self.max_frame_skip:
+            self.skipped_in_row += 1
+            self.skipped_renders += 1
+            return False
+        self.skipped_in_row = 0
+        return True
+
+    def get_stats(self) -> dict[str, float]:
+        """
+        Retourne les statistiques de cadencement :
+        marge moyenne et minimale (s) sur l'historique, nombre de dépassements et de rendus sautés.
+        """
+        history = self.slack_history
+        return {
+            "fps": self.clock.get_fps(),
+            "frames": self.frame_count,
+            "average_slack": sum(history) / len(history) if history else 0.0,
+            "min_slack": min(history) if history else 0.0,
+            "overruns": self.overrun_count,
+            "overrun_ratio": self.overrun_count / self.frame_count if self.frame_count else 0.0,
+            "skipped_renders": self.skipped_renders,
+        }
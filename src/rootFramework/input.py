@@ -0,0 +1,256 @@
+import rootFramework as rf
+import pygame
+from typing import NamedTuple, Self
+
+class InputSnapshot(NamedTuple):
+    """
+    État des entrées figé pour une frame (immuable).
+    Construit une seule fois par frame par Input.capture, à partir des événements reçus.
+    """
+    frame: int
+    keys: frozenset[int]                       # touches maintenues
+    keys_pressed: frozenset[int]               # touches enfoncées pendant la frame
+    keys_released: frozenset[int]              # touches relâchées pendant la frame
+    mouse_pos: tuple[int, int]
+    mouse_rel: tuple[int, int]                 # déplacement cumulé pendant la frame
+    mouse_buttons: frozenset[int]
+    mouse_pressed: frozenset[int]
+    mouse_released: frozenset[int]
+    wheel: tuple[int, int]
+    joy_axes: tuple[tuple[float, ...], ...]    # axes par manette (par instance_id)
+    joy_buttons: frozenset[tuple[int, int]]    # (instance_id, bouton) maintenus
+    joy_pressed: frozenset[tuple[int, int]]
+    joy_released: frozenset[tuple[int, int]]
+
+
+class Input(metaclass=rf.Singleton):
+    """
+    Collecte les entrées à partir des événements pygame et produit un InputSnapshot par frame.
+    Aucun sondage (pygame.key.get_pressed...) n'est fait par les entités : elles lisent le
+    snapshot courant, identique pour toutes pendant la frame (et rejouable).
+    """
+
+    def __init__(self):
+        self.keys: set[int] = set()
+        self.mouse_pos: tuple[int, int] = (0, 0)
+        self.mouse_buttons: set[int] = set()
+        self.joy_axes: dict[int, list[float]] = {}
+        self.joy_buttons: set[tuple[int, int]] = set()
+        self.frame: int = 0
+        self._clear_frame()
+        self.current: InputSnapshot = self._build_snapshot()
+
+    def _clear_frame(self) -> None:
+        """Réinitialise les fronts et les cumuls de la frame."""
+        self.keys_pressed: set[int] = set()
+        self.keys_released: set[int] = set()
+        self.mouse_rel: tuple[int, int] = (0, 0)
+        self.mouse_pressed: set[int] = set()
+        self.mouse_released: set[int] = set()
+        self.wheel: tuple[int, int] = (0, 0)
+        self.joy_pressed: set[tuple[int, int]] = set()
+        self.joy_released: set[tuple[int, int]] = set()
+
+    def process_event(self, event: pygame.Event) -> None:
+        """Met à jour l'état des entrées à partir d'un événement."""
+        event_type = event.type
+        if event_type == pygame.KEYDOWN:
+            if event.key not in self.keys:
+                self.keys.add(event.key)
+                self.keys_pressed.add(event.key)
+        elif event_type == pygame.KEYUP:
+            if event.key in self.keys:
+                self.keys.discard(event.key)
+                self.keys_released.add(event.key)
+        elif event_type == pygame.MOUSEMOTION:
+            self.mouse_pos = event.pos
+            self.mouse_rel = (self.mouse_rel[0] + event.rel[0], self.mouse_rel[1] + event.rel[1])
+        elif event_type == pygame.MOUSEBUTTONDOWN:
+            self.mouse_pos = event.pos
+            self.mouse_buttons.add(event.button)
+            self.mouse_pressed.add(event.button)
+        elif event_type == pygame.MOUSEBUTTONUP:
+            self.mouse_pos = event.pos
+            self.mouse_buttons.discard(event.button)
+            self.mouse_released.add(event.button)
+        elif event_type == pygame.MOUSEWHEEL:
+            self.wheel = (self.wheel[0] + event.x, self.wheel[1] + event.y)
+        elif event_type == pygame.JOYAXISMOTION:
+            axes = self.joy_axes.setdefault(event.instance_id, [])
+            if len(axes) <= event.axis:
+                axes.extend([0.0] * (event.axis + 1 - len(axes)))
+            axes[event.axis] = event.value
+        elif event_type == pygame.JOYBUTTONDOWN:
+            button = (event.instance_id, event.button)
+            self.joy_buttons.add(button)
+            self.joy_pressed.add(button)
+        elif event_type == pygame.JOYBUTTONUP:
+            button = (event.instance_id, event.button)
+            self.joy_buttons.discard(button)
+            self.joy_released.add(button)
+        elif event_type == pygame.WINDOWFOCUSLOST:
+            # Les relâchements ne seront pas reçus : tout est relâché maintenant
+            self.release_all()
+
+    def release_all(self) -> None:
+        """Relâche toutes les touches et tous les boutons maintenus."""
+        self.keys_released |= self.keys
+        self.mouse_released |= self.mouse_buttons
+        self.joy_released |= self.joy_buttons
+        self.keys.clear()
+        self.mouse_buttons.clear()
+        self.joy_buttons.clear()
+
+    def _build_snapshot(self) -> InputSnapshot:
+        return InputSnapshot(
+            frame=self.frame,
+            keys=frozenset(self.keys),
+            keys_pressed=frozenset(self.keys_pressed),
+            keys_released=frozenset(self.keys_released),
+            mouse_pos=self.mouse_pos,
+            mouse_rel=self.mouse_rel,
+            mouse_buttons=frozenset(self.mouse_buttons),
+            mouse_pressed=frozenset(self.mouse_pressed),
+            mouse_released=frozenset(self.mouse_released),
+            wheel=self.wheel,
+            joy_axes=tuple(tuple(self.joy_axes[joy]) for joy in sorted(self.joy_axes)),
+            joy_buttons=frozenset(self.joy_buttons),
+            joy_pressed=frozenset(self.joy_pressed),
+            joy_released=frozenset(self.joy_released),
+        )
+
+    def capture(self) -> InputSnapshot:
+        """Fige l'état de la frame dans un InputSnapshot, puis prépare la frame suivante."""
+        self.current = self._build_snapshot()
+        self.frame += 1
+        self._clear_frame()
+        return self.current
+
+    def get_snapshot(self) -> InputSnapshot:
+        """Retourne le dernier InputSnapshot capturé."""
+        return self.current
+
+
+class ActionState:
+    """
+    Actions résolues pour une frame : maintenues, enfoncées et relâchées pendant la frame,
+    et valeurs des axes (-1.0 à 1.0).
+    """
+    __slots__ = ("held", "pressed", "released", "axes")
+
+    def __init__(self, held: frozenset[str], pressed: frozenset[str], released: frozenset[str],
+                 axes: dict[str, float]):
+        self.held = held
+        self.pressed = pressed
+        self.released = released
+        self.axes = axes
+
+    def is_held(self, action: str) -> bool:
+        """Vérifie si une action est maintenue."""
+        return action in self.held
+
+    def is_pressed(self, action: str) -> bool:
+        """Vérifie si une action vient d'être déclenchée (front montant)."""
+        return action in self.pressed
+
+    def is_released(self, action: str) -> bool:
+        """Vérifie si une action vient d'être relâchée (front descendant)."""
+        return action in self.released
+
+    def get_axis(self, name: str) -> float:
+        """Retourne la valeur d'un axe (0.0 s'il n'existe pas)."""
+        return self.axes.get(name, 0.0)
+
+
+class ActionMap:
+    """
+    Association déclarative entre actions nommées et entrées physiques, par ex. :
+
+        ActionMap({"jump": [rf.K_SPACE, ActionMap.joy(0)]})
+
+    Une entrée est une touche (int), ActionMap.mouse(bouton) ou ActionMap.joy(bouton).
+    Les axes combinent deux actions (négative, positive) et, éventuellement, un axe de manette.
+    """
+
+    def __init__(self, bindings: dict[str, list] | None = None):
+        self.bindings: dict[str, list[tuple[str, int]]] = {}
+        self.axes: dict[str, tuple[str, str, int | None, float]] = {}
+        for action, inputs in (bindings or {}).items():
+            self.bind(action, *inputs)
+
+    @staticmethod
+    def key(key: int) -> tuple[str, int]:
+        return ("key", key)
+
+    @staticmethod
+    def mouse(button: int) -> tuple[str, int]:
+        return ("mouse", button)
+
+    @staticmethod
+    def joy(button: int) -> tuple[str, int]:
+        return ("joy", button)
+
+    def bind(self, action: str, *inputs) -> Self:
+        """Associe des entrées à une action (les touches peuvent être passées directement)."""
+        bound = self.bindings.setdefault(action, [])
+        for source in inputs:
+            source = self.key(source) if isinstance(source, int) else tuple(source)
+            if source not in bound:
+                bound.append(source)
+        return self
+
+    def unbind(self, action: str) -> Self:
+        """Retire toutes les entrées d'une action."""
+        self.bindings.pop(action, None)
+        return self
+
+    def bind_axis(self, name: str, negative: str, positive: str,
+                  joy_axis: int | None = None, deadzone: float = 0.2) -> Self:
+        """Définit un axe à partir de deux actions et, éventuellement, d'un axe de manette."""
+        self.axes[name] = (negative, positive, joy_axis, deadzone)
+        return self
+
+    @staticmethod
+    def _active(source: tuple[str, int], keys, mouse, joy) -> bool:
+        kind, code = source
+        if kind == "key":
+            return code in keys
+        if kind == "mouse":
+            return code in mouse
+        return any(button == code for _, button in joy)
+
+    def resolve(self, snapshot: InputSnapshot) -> ActionState:
+        """Résout les actions et les axes à partir d'un InputSnapshot."""
+        held, pressed, released = set(), set(), set()
+        for action, sources in self.bindings.items():
+            if any(self._active(s, snapshot.keys, snapshot.mouse_buttons, snapshot.joy_buttons) for s in sources):
+                held.add(action)
+            if any(self._active(s, snapshot.keys_pressed, snapshot.mouse_pressed, snapshot.joy_pressed) for s in sources):
+                pressed.add(action)
+            if any(self._active(s, snapshot.keys_released, snapshot.mouse_released, snapshot.joy_released) for s in sources):
+                released.add(action)
+
+        axes = {}
+        for name, (negative, positive, joy_axis, deadzone) in self.axes.items():
+            value = float((positive in held) - (negative in held))
+            if not value and joy_axis is not None:
+                for joy in snapshot.joy_axes:
+                    if joy_axis < len(joy) and abs(joy[joy_axis]) > deadzone:
+                        value = joy[joy_axis]
+                        break
+            axes[name] = value
+        return ActionState(frozenset(held), frozenset(pressed), frozenset(released), axes)
+
+    @classmethod
+    def default(cls) -> "ActionMap":
+        """Association par défaut d'un jeu de plateforme (flèches/WASD, espace, bouton A)."""
+        action_map = cls({
+            "move_left": [pygame.K_LEFT, pygame.K_a],
+            "move_right": [pygame.K_RIGHT, pygame.K_d],
+            "move_up": [pygame.K_UP, pygame.K_w],
+            "move_down": [pygame.K_DOWN, pygame.K_s],
+            "jump": [pygame.K_SPACE, cls.joy(0)],
+        })
+        action_map.bind_axis("move_x", "move_left", "move_right", joy_axis=0)
+        action_map.bind_axis("move_y", "move_up", "move_down", joy_axis=1)
+        return action_map
@@ -1,12 +1,27 @@
 import rootFramework as rf
 import pygame
+import time
 
 class Manager(rf.SceneManager):
     
     def __init__(self, screen: pygame.Surface, *initial_scenes: rf.Scene) -> None:
         super().__init__()
+        self.screen = screen
         self.running = False
         self.time_manager = rf.Time()
+        self.frame_pacer = rf.FramePacer()
+
+        # Entrées : un InputSnapshot figé par frame, résolu en actions par l'ActionMap
+        self.input = rf.Input()
+        self.action_map: rf.ActionMap = rf.ActionMap.default()
+        self.actions: rf.ActionState = self.action_map.resolve(self.input.get_snapshot())
+
+        # Types d'événements fusionnés en un seul par frame (voir set_event_coalescing)
+        self.coalesced_events: set[int] = set()
+
+        # Enregistrement et relecture des sessions (voir start_recording et replay)
+        self.recorder: rf.ReplayRecorder | None = None
+        self.replay_events: list[pygame.Event] | None = None
 
         if initial_scenes:
             self.init_scenes(screen, *initial_scenes)
@@ -21,6 +36,147 @@ class Manager(rf.SceneManager):
     def draw(self):
         super().draw()
 
+    def set_frame_pacing(self, mode: str, fps: int | None = None) -> None:
+        """Change la politique de cadencement (FramePacer.UNCAPPED, CAPPED, BUSY ou ADAPTIVE)."""
+        self.frame_pacer.set_mode(mode, fps)
+
+    def set_action_map(self, action_map: "rf.ActionMap") -> None:
+        """Remplace l'association actions/entrées."""
+        self.action_map = action_map
+
+    def set_event_coalescing(self, *event_types: int) -> None:
+        """
+        Ne transmet que le dernier événement de chaque type donné par frame
+        (ex. pygame.MOUSEMOTION, dont le déplacement relatif est cumulé).
+        """
+        self.coalesced_events = set(event_types)
+
+    def step(self, dt: float, render: bool = True) -> None:
+        """
+        Exécute une frame : événements, avance de l'horloge de jeu, mise à jour et rendu.
+
+        dt     : temps réel écoulé depuis la frame précédente (s)
+        render : si False, la frame n'est pas dessinée
+        """
+        if self.profiler.enabled:
+            self.profiled_step(dt, render)
+            return
+        self.handle_events(dt)
+        rf.ResourceManager().poll_changes(dt)
+        # Le temps de jeu (échelle, pause) est celui vu par les scènes et les minuteurs
+        game_dt = self.time_manager.update(dt)
+        self.update(game_dt)
+        if render:
+            self.draw()
+            pygame.display.flip()
+
+    def profiled_step(self, dt: float, render: bool = True) -> None:
+        """Exécute une frame comme step, en chronométrant chaque phase (voir Profiler)."""
+        profiler = self.profiler
+        profiler.begin_frame()
+        start = profiler.begin()
+        self.handle_events(dt)
+        profiler.end("events", start)
+        start = profiler.begin()
+        rf.ResourceManager().poll_changes(dt)
+        profiler.end("resources", start)
+        start = profiler.begin()
+        game_dt = self.time_manager.update(dt)
+        profiler.end("time", start)
+        start = profiler.begin()
+        self.update(game_dt)
+        profiler.end("update", start)
+        if render:
+            start = profiler.begin()
+            self.draw()
+            profiler.end("draw", start)
+            if profiler.overlay_visible:
+                profiler.draw_overlay(self.screen)
+            start = profiler.begin()
+            pygame.display.flip()
+            profiler.end("flip", start)
+        profiler.end_frame()
+
+    def handle_events(self, dt: float = 0.0) -> None:
+        """
+        Traite les événements de la frame (ceux du journal pendant une relecture),
+        puis fige les entrées et transmet les actions.
+        """
+        if self.replay_events is not None:
+            # Les entrées réelles sont ignorées pendant la relecture, sauf la fermeture
+            for event in pygame.event.get():
+                if event.type == rf.QUIT:
+                    self.running = False
+            events = self.replay_events
+        else:
+            events = pygame.event.get()
+        if self.recorder is not None:
+            self.recorder.record_frame(dt, events)
+        if self.coalesced_events:
+            events = rf.eventBus.coalesce_events(events, self.coalesced_events)
+        for event in events:
+            if event.type == rf.QUIT:
+                self.running = False
+            self.input.process_event(event)
+            self.process_event(event)
+        self.actions = self.action_map.resolve(self.input.capture())
+        self.process_actions(self.actions)
+
+    def start_recording(self, path: str, seed: int | None = None) -> "rf.ReplayRecorder":
+        """
+        Enregistre le dt et les événements de chaque frame dans un journal (voir replay).
+        Le module random est initialisé avec la graine enregistrée : appeler cette méthode
+        au même point de l'initialisation du jeu que replay.
+        """
+        self.stop_recording()
+        self.recorder = rf.ReplayRecorder(path, seed)
+        return self.recorder
+
+    def stop_recording(self) -> None:
+        """Termine l'enregistrement en cours."""
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
+    def replay(self, path: str, render: bool = False, realtime: bool = False) -> int:
+        """
+        Rejoue un journal enregistré avec start_recording : mêmes dt, mêmes événements, même graine.
+        Par défaut sans attente ni rendu (banc d'essai, profilage) ; avec realtime, les frames
+        sont cadencées comme lors de l'enregistrement. Retourne le nombre de frames rejouées.
+        """
+        if len(self.scenes) == 0:
+            raise ValueError("Manager can't run without scenes.")
+        player = rf.ReplayPlayer(path)
+        self.running = True
+        start = time.perf_counter()
+        elapsed = 0.0
+        try:
+            for dt, events in player:
+                self.replay_events = events
+                self.step(dt, render)
+                if not self.running:
+                    break
+                if realtime:
+                    elapsed += dt
+                    delay = elapsed - (time.perf_counter() - start)
+                    if delay > 0:
+                        time.sleep(delay)
+        finally:
+            self.replay_events = None
+            self.running = False
+            player.close()
+        return player.frame_count
+
+    def simulate(self, frames: int, dt: float | None = None, render: bool = False) -> None:
+        """
+        Simule un nombre de frames à pas fixe, aussi vite que possible
+        (tests d'endurance, entraînement d'IA). Le résultat est déterministe.
+        """
+        if len(self.scenes) == 0:
+            raise ValueError("Manager can't run without scenes.")
+        dt = 1.0 / rf.Constants.FPS if dt is None else dt
+        for _ in range(frames):
+            self.step(dt, render)
 
     def run(self) -> None:
         """Lance la boucle principale du gestionnaire de scènes."""
@@ -29,18 +185,12 @@ class Manager(rf.SceneManager):
         if self.running:
             raise RuntimeError("Manager is already running.")
         self.running = True
-        clock = pygame.time.Clock()  # Créer le clock une fois
+        pacer = self.frame_pacer
+        pacer.reset()
         while self.running:
-            dt = clock.tick(60) / 1000.0  # Calculer dt à chaque frame
-            for event in pygame.event.get():
-                if event.type == rf.QUIT:
-                    self.running = False
-                self.process_event(event)
-            # update
-            self.update(dt)
-            self.time_manager.update()
-            # render
-            self.draw()
-            pygame.display.flip()
+            dt = pacer.tick()
+            self.step(dt, pacer.should_render())
 
-        pygame.quit()
\ No newline at end of file
+        self.stop_recording()
+        rf.ResourceManager().flush()
+        pygame.quit()
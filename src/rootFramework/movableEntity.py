@@ -2,25 +2,86 @@ import pygame
 import rootFramework as rf
 
 class MovableEntity(rf.PhysicalEntity):
-    def __init__(self, move_force: float = 1500.0, jump_force: float = 600.0, *args, **kwargs):
+    __slots__ = ("move_force", "jump_force", "player_controlled", "path", "path_index", "arrive_radius")
+
+    def __init__(self, move_force: float = 1500.0, jump_force: float = 600.0,
+                 player_controlled: bool = False, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.move_force = move_force
         self.jump_force = jump_force
+        # Si True, l'entité est déplacée par les actions "move_x" et "jump" (voir ActionMap.default) ;
+        # à modifier avec set_player_controlled une fois l'entité dans une scène
+        self.player_controlled = player_controlled
 
-    def do_handle_event(self, event: pygame.Event) -> None:
-        # if event.type == pygame.KEYDOWN:
-        #     if event.key == pygame.K_SPACE:
-        #         self.jump(self.jump_force)
-        pass
+        # Chemin suivi (points du monde, par ex. fourni par un PathFinder)
+        self.path: list[tuple[float, float]] = []
+        self.path_index = 0
+        self.arrive_radius = 4.0
 
-    def update(self, dt: float):
-        # keys = pygame.key.get_pressed()
+    # --------------------
+    # Navigation
+    # --------------------
+    def follow_path(self, path: list[tuple[float, float]] | None, arrive_radius: float = 4.0):
+        """
+        Suit une liste de points du monde (ex. résultat de PathFinder.request_path).
+        Le centre de l'entité est dirigé vers chaque point et s'arrête sur le dernier ;
+        pour un déplacement vu de dessus, utiliser gravity=0.
+        """
+        self.path = list(path) if path else []
+        self.path_index = 0
+        self.arrive_radius = arrive_radius
+        return self
 
-        # if keys[pygame.K_LEFT]:
-        #     self.apply_force(-self.move_force, 0)
-        # if keys[pygame.K_RIGHT]:
-        #     self.apply_force(self.move_force, 0)
+    def clear_path(self):
+        """Abandonne le chemin en cours."""
+        self.path = []
+        self.path_index = 0
+        return self
 
-        super().update(dt)
+    def has_path(self) -> bool:
+        """Vérifie si un chemin est en cours de suivi."""
+        return self.path_index < len(self.path)
+
+    def steer_along_path(self) -> None:
+        """Applique une force qui oriente la vitesse vers le prochain point du chemin."""
+        while self.path_index < len(self.path):
+            offset = pygame.Vector2(self.path[self.path_index]) - pygame.Vector2(self.rect.center)
+            if offset.length() > self.arrive_radius:
+                steering = offset.normalize() * self.max_speed - self.velocity
+                if steering.length_squared():
+                    steering.scale_to_length(self.move_force)
+                    self.apply_force(steering.x, steering.y)
+                return
+            self.path_index += 1
+            if self.path_index == len(self.path):
+                # Arrivée : l'entité s'arrête sur le dernier point
+                self.velocity.xy = (0, 0)
+
+    # --------------------
+    # Contrôle par le joueur
+    # --------------------
+    def set_player_controlled(self, player_controlled: bool = True):
+        """Active ou désactive le contrôle par le joueur (la scène ne transmet les actions qu'aux entités contrôlées)."""
+        self.player_controlled = player_controlled
+        if self.parent_scene is not None:
+            self.parent_scene.refresh_action_entity(self)
+        return self
 
-        # pass
+    def handles_actions(self) -> bool:
+        """Seules les entités contrôlées par le joueur (ou qui redéfinissent do_process_actions) reçoivent les actions."""
+        return self.player_controlled or type(self).do_process_actions is not MovableEntity.do_process_actions
+
+    def do_process_actions(self, actions: "rf.ActionState") -> None:
+        """Déplace l'entité selon les actions de la frame si elle est contrôlée par le joueur."""
+        if not self.player_controlled:
+            return
+        move = actions.get_axis("move_x")
+        if move:
+            self.apply_force(self.move_force * move, 0)
+        if actions.is_pressed("jump"):
+            self.jump(self.jump_force)
+
+    def update(self, dt: float):
+        if self.path:
+            self.steer_along_path()
+        super().update(dt)
@@ -0,0 +1,195 @@
+import rootFramework as rf
+import numpy as np
+import pygame
+import random
+
+class ParticleEmitter(rf.Drawable):
+    """
+    Émetteur de particules vectorisé.
+    Position, vitesse, durée de vie et taille sont stockées dans des tableaux NumPy ;
+    la mise à jour et le retrait des particules mortes se font par opérations vectorisées.
+    Le rendu utilise un seul appel Surface.blits avec des variantes pré-calculées
+    du sprite, regroupées par paliers de taille et d'opacité.
+    """
+    __slots__ = (
+        "max_particles", "count", "positions", "velocities", "lives", "max_lives", "sizes",
+        "emission_rate", "emission_accumulator", "lifetime", "speed", "angle", "size",
+        "size_end", "fade", "gravity", "color", "texture", "size_buckets", "alpha_buckets",
+        "variants", "max_pixel_size", "rng", "emitting",
+    )
+
+    def __init__(self,
+                 max_particles: int = 10000,
+                 emission_rate: float = 0.0,                  # particules par seconde (0 = rafales uniquement)
+                 lifetime: tuple[float, float] = (0.5, 1.5),  # durée de vie min/max (s)
+                 speed: tuple[float, float] = (50.0, 150.0),  # vitesse initiale min/max (px/s)
+                 angle: tuple[float, float] = (0.0, 360.0),   # direction initiale min/max (degrés)
+                 size: tuple[float, float] = (2.0, 6.0),      # taille initiale min/max (px)
+                 size_end: float = 0.0,                       # facteur de taille en fin de vie
+                 fade: bool = True,                           # si True, l'opacité diminue avec l'âge
+                 gravity: tuple[float, float] = (0.0, 0.0),   # accélération (px/s²)
+                 color: tuple = (255, 255, 255),
+                 texture: pygame.Surface | None = None,       # par défaut, un disque de la couleur donnée
+                 size_buckets: int = 8,
+                 alpha_buckets: int = 16,
+                 seed: int | None = None,
+                 *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_particles = max_particles
+        self.count = 0
+        self.positions = np.zeros((max_particles, 2), dtype=np.float32)
+        self.velocities = np.zeros((max_particles, 2), dtype=np.float32)
+        self.lives = np.zeros(max_particles, dtype=np.float32)
+        self.max_lives = np.ones(max_particles, dtype=np.float32)
+        self.sizes = np.zeros(max_particles, dtype=np.float32)
+
+        self.emission_rate = emission_rate
+        self.emission_accumulator = 0.0
+        self.emitting = True
+        self.lifetime = lifetime
+        self.speed = speed
+        self.angle = angle
+        self.size = size
+        self.size_end = size_end
+        self.fade = fade
+        self.gravity = np.array(gravity, dtype=np.float32)
+        self.color = tuple(pygame.Color(color))
+        self.texture = texture
+        self.size_buckets = max(1, size_buckets)
+        self.alpha_buckets = max(1, alpha_buckets)
+        self.variants: np.ndarray | None = None
+        self.max_pixel_size = max(1.0, size[1] * max(1.0, size_end))
+        # Graine tirée du module random par défaut : reproductible si random est initialisé
+        self.rng = np.random.default_rng(random.getrandbits(32) if seed is None else seed)
+
+    # ----------------------
+    # Émission
+    # ----------------------
+    def burst(self, count: int) -> None:
+        """Émet immédiatement un nombre de particules (dans la limite de max_particles)."""
+        count = min(count, self.max_particles - self.count)
+        if count <= 0:
+            return
+        start, end = self.count, self.count + count
+        rng = self.rng
+
+        self.positions[start:end, 0] = rng.uniform(self.rect.left, self.rect.right, count)
+        self.positions[start:end, 1] = rng.uniform(self.rect.top, self.rect.bottom, count)
+        angles = np.radians(rng.uniform(self.angle[0], self.angle[1], count))
+        speeds = rng.uniform(self.speed[0], self.speed[1], count)
+        self.velocities[start:end, 0] = np.cos(angles) * speeds
+        self.velocities[start:end, 1] = np.sin(angles) * speeds
+        lives = rng.uniform(self.lifetime[0], self.lifetime[1], count)
+        self.lives[start:end] = lives
+        self.max_lives[start:end] = lives
+        self.sizes[start:end] = rng.uniform(self.size[0], self.size[1], count)
+        self.count = end
+
+    def start(self) -> None:
+        """Reprend l'émission continue."""
+        self.emitting = True
+
+    def stop(self) -> None:
+        """Arrête l'émission continue (les particules existantes finissent leur vie)."""
+        self.emitting = False
+
+    def clear(self) -> None:
+        """Supprime toutes les particules."""
+        self.count = 0
+
+    def get_particle_count(self) -> int:
+        """Retourne le nombre de particules vivantes."""
+        return self.count
+
+    # ----------------------
+    # Mise à jour
+    # ----------------------
+    def update(self, dt: float):
+        """Émet, déplace et vieillit les particules, puis compacte les particules mortes."""
+        if self.emitting and self.emission_rate > 0:
+            self.emission_accumulator += self.emission_rate * dt
+            emitted = int(self.emission_accumulator)
+            if emitted:
+                self.emission_accumulator -= emitted
+                self.burst(emitted)
+
+        n = self.count
+        if not n:
+            return
+        velocities = self.velocities[:n]
+        velocities += self.gravity * dt
+        self.positions[:n] += velocities * dt
+        lives = self.lives[:n]
+        lives -= dt
+
+        alive = lives > 0
+        alive_count = int(np.count_nonzero(alive))
+        if alive_count != n:
+            for array in (self.positions, self.velocities, self.lives, self.max_lives, self.sizes):
+                array[:alive_count] = array[:n][alive]
+            self.count = alive_count
+
+    # ----------------------
+    # Hibernation
+    # ----------------------
+    def do_hibernate(self) -> None:
+        """Libère les variantes pré-calculées (recalculées au prochain dessin)."""
+        self.variants = None
+
+    def get_memory_usage(self) -> int:
+        usage = super().get_memory_usage()
+        usage += sum(array.nbytes for array in (self.positions, self.velocities, self.lives, self.max_lives, self.sizes))
+        if self.variants is not None:
+            usage += sum(self.get_surface_bytes(variant) for variant in self.variants)
+        return usage
+
+    # ----------------------
+    # Rendu
+    # ----------------------
+    def bake_variants(self) -> None:
+        """Pré-calcule les variantes du sprite pour chaque palier de taille et d'opacité."""
+        texture = self.texture
+        if texture is None:
+            radius = max(1, int(np.ceil(self.max_pixel_size / 2)))
+            texture = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(texture, self.color, (radius, radius), radius)
+
+        variants = []
+        for size_index in range(self.size_buckets):
+            pixels = max(1, round(self.max_pixel_size * (size_index + 1) / self.size_buckets))
+            scaled = pygame.transform.smoothscale(texture.convert_alpha(), (pixels, pixels))
+            for alpha_index in range(self.alpha_buckets):
+                alpha = round(255 * (alpha_index + 1) / self.alpha_buckets)
+                variant = scaled.copy()
+                variant.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+                variants.append(variant)
+        self.variants = np.empty(len(variants), dtype=object)
+        self.variants[:] = variants
+
+    def draw(self, surface: pygame.Surface, camera: "rf.Camera | None" = None) -> None:
+        """Dessine toutes les particules en un appel Surface.blits (caméra optionnelle)."""
+        n = self.count
+        if not self.visible or not n:
+            return
+        if self.variants is None:
+            self.bake_variants()
+
+        age = 1.0 - self.lives[:n] / self.max_lives[:n]
+        sizes = self.sizes[:n] * (1.0 + (self.size_end - 1.0) * age)
+        size_index = np.clip(
+            np.ceil(sizes / self.max_pixel_size * self.size_buckets) - 1, 0, self.size_buckets - 1
+        ).astype(np.intp)
+        if self.fade:
+            alpha_index = np.clip(
+                np.ceil((1.0 - age) * self.alpha_buckets) - 1, 0, self.alpha_buckets - 1
+            ).astype(np.intp)
+        else:
+            alpha_index = self.alpha_buckets - 1
+        sprites = self.variants[size_index * self.alpha_buckets + alpha_index]
+
+        # Les particules sont centrées sur leur position
+        half = ((size_index + 1) * (self.max_pixel_size / self.size_buckets) / 2)[:, None]
+        positions = self.positions[:n] - half
+        if camera is not None:
+            positions = (positions - (camera.pos.x, camera.pos.y)) * camera.zoom
+        surface.blits(zip(sprites.tolist(), positions.tolist()), doreturn=False)
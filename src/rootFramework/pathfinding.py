@@ -0,0 +1,345 @@
+import rootFramework as rf
+import heapq
+import math
+import pygame
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Iterable
+
+Cell = tuple[int, int]
+
+_STRAIGHT = ((1, 0), (-1, 0), (0, 1), (0, -1))
+_DIAGONAL = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+_SQRT2 = math.sqrt(2)
+
+
+def _neighbours(walkable: bytes, width: int, height: int, x: int, y: int, diagonal: bool):
+    """Génère les cases voisines franchissables et le coût pour s'y rendre (sans couper les coins)."""
+    for dx, dy in _STRAIGHT:
+        nx, ny = x + dx, y + dy
+        if 0 <= nx < width and 0 <= ny < height and walkable[ny * width + nx]:
+            yield nx, ny, 1.0
+    if diagonal:
+        for dx, dy in _DIAGONAL:
+            nx, ny = x + dx, y + dy
+            if (0 <= nx < width and 0 <= ny < height and walkable[ny * width + nx]
+                    and walkable[y * width + nx] and walkable[ny * width + x]):
+                yield nx, ny, _SQRT2
+
+
+def find_path(walkable: bytes, width: int, height: int, start: Cell, goal: Cell,
+              diagonal: bool = True) -> list[Cell] | None:
+    """
+    Recherche A* sur une grille (fonction autonome pour pouvoir s'exécuter dans un autre processus).
+    Retourne la liste des cases de start à goal incluses, ou None s'il n'y a pas de chemin.
+    """
+    if not (0 <= start[0] < width and 0 <= start[1] < height):
+        return None
+    if not (0 <= goal[0] < width and 0 <= goal[1] < height):
+        return None
+    if not walkable[goal[1] * width + goal[0]]:
+        return None
+    if start == goal:
+        return [start]
+
+    gx, gy = goal
+
+    def heuristic(x: int, y: int) -> float:
+        dx, dy = abs(x - gx), abs(y - gy)
+        if diagonal:
+            return (dx + dy) + (_SQRT2 - 2) * min(dx, dy)
+        return dx + dy
+
+    open_heap = [(heuristic(*start), 0.0, start)]
+    came_from: dict[Cell, Cell] = {}
+    costs: dict[Cell, float] = {start: 0.0}
+    while open_heap:
+        _, cost, current = heapq.heappop(open_heap)
+        if current == goal:
+            path = [current]
+            while current in came_from:
+                current = came_from[current]
+                path.append(current)
+            path.reverse()
+            return path
+        if cost > costs[current]:
+            continue
+        for nx, ny, step in _neighbours(walkable, width, height, current[0], current[1], diagonal):
+            new_cost = cost + step
+            neighbour = (nx, ny)
+            if new_cost < costs.get(neighbour, math.inf):
+                costs[neighbour] = new_cost
+                came_from[neighbour] = current
+                heapq.heappush(open_heap, (new_cost + heuristic(nx, ny), new_cost, neighbour))
+    return None
+
+
+def compute_flow_field(walkable: bytes, width: int, height: int, goal: Cell,
+                       diagonal: bool = True) -> list[int]:
+    """
+    Calcule, pour chaque case, l'index de la case suivante vers goal (-1 si inaccessible).
+    Parcours de Dijkstra depuis la cible.
+    """
+    next_cell = [-1] * (width * height)
+    if not (0 <= goal[0] < width and 0 <= goal[1] < height) or not walkable[goal[1] * width + goal[0]]:
+        return next_cell
+    goal_index = goal[1] * width + goal[0]
+    next_cell[goal_index] = goal_index
+    costs = {goal_index: 0.0}
+    heap = [(0.0, goal[0], goal[1])]
+    while heap:
+        cost, x, y = heapq.heappop(heap)
+        index = y * width + x
+        if cost > costs[index]:
+            continue
+        for nx, ny, step in _neighbours(walkable, width, height, x, y, diagonal):
+            neighbour = ny * width + nx
+            new_cost = cost + step
+            if new_cost < costs.get(neighbour, math.inf):
+                costs[neighbour] = new_cost
+                next_cell[neighbour] = index
+                heapq.heappush(heap, (new_cost, nx, ny))
+    return next_cell
+
+
+class NavGrid:
+    """Grille de navigation : chaque case est franchissable ou bloquée."""
+
+    def __init__(self, width: int, height: int, cell_size: int = 32, origin: tuple[float, float] = (0, 0)):
+        self.width: int = width
+        self.height: int = height
+        self.cell_size: int = cell_size
+        self.origin = pygame.Vector2(origin)
+        self.walkable: bytearray = bytearray(b"\x01") * (width * height)
+        self.version: int = 0  # Incrémentée à chaque modification (invalide les caches)
+
+    @classmethod
+    def from_entities(cls, entities: Iterable["rf.Entity"], world_size: tuple[int, int],
+                      cell_size: int = 32, tags: tuple[str, ...] = ()) -> "NavGrid":
+        """Construit une grille dont les cases recouvertes par les entités (ayant les tags donnés) sont bloquées."""
+        grid = cls(math.ceil(world_size[0] / cell_size), math.ceil(world_size[1] / cell_size), cell_size)
+        for entity in entities:
+            if entity.has_tags(*tags):
+                grid.block_rect(entity.rect)
+        return grid
+
+    def world_to_cell(self, position) -> Cell:
+        """Convertit une position du monde en case."""
+        return (int((position[0] - self.origin.x) // self.cell_size),
+                int((position[1] - self.origin.y) // self.cell_size))
+
+    def cell_to_world(self, cell: Cell) -> tuple[float, float]:
+        """Retourne le centre d'une case dans le monde."""
+        return (self.origin.x + (cell[0] + 0.5) * self.cell_size,
+                self.origin.y + (cell[1] + 0.5) * self.cell_size)
+
+    def in_bounds(self, cell: Cell) -> bool:
+        """Vérifie si une case est dans la grille."""
+        return 0 <= cell[0] < self.width and 0 <= cell[1] < self.height
+
+    def is_walkable(self, cell: Cell) -> bool:
+        """Vérifie si une case est franchissable."""
+        return self.in_bounds(cell) and bool(self.walkable[cell[1] * self.width + cell[0]])
+
+    def set_walkable(self, cell: Cell, walkable: bool = True) -> None:
+        """Rend une case franchissable ou bloquée."""
+        if not self.in_bounds(cell):
+            return
+        index = cell[1] * self.width + cell[0]
+        value = 1 if walkable else 0
+        if self.walkable[index] != value:
+            self.walkable[index] = value
+            self.version += 1
+
+    def block_rect(self, rect, blocked: bool = True) -> None:
+        """Bloque (ou libère) toutes les cases recouvertes par un rectangle du monde."""
+        left, top = self.world_to_cell(rect.topleft)
+        right, bottom = self.world_to_cell((rect.right - 1e-6, rect.bottom - 1e-6))
+        for y in range(max(0, top), min(self.height, bottom + 1)):
+            for x in range(max(0, left), min(self.width, right + 1)):
+                self.set_walkable((x, y), not blocked)
+
+
+class FlowField:
+    """Champ de directions vers une cible commune, partagé par de nombreux agents."""
+
+    def __init__(self, grid: NavGrid, goal: Cell, next_cell: list[int]):
+        self.grid = grid
+        self.goal = goal
+        self.next_cell = next_cell
+
+    def get_next_cell(self, cell: Cell) -> Cell | None:
+        """Retourne la case suivante vers la cible (None si inaccessible)."""
+        if not self.grid.in_bounds(cell):
+            return None
+        index = self.next_cell[cell[1] * self.grid.width + cell[0]]
+        if index < 0:
+            return None
+        return index % self.grid.width, index // self.grid.width
+
+    def get_direction(self, position) -> pygame.Vector2:
+        """Retourne la direction normalisée à suivre depuis une position du monde."""
+        cell = self.grid.world_to_cell(position)
+        target = self.get_next_cell(cell)
+        if target is None or target == cell:
+            return pygame.Vector2(0, 0)
+        direction = pygame.Vector2(self.grid.cell_to_world(target)) - pygame.Vector2(position)
+        return direction.normalize() if direction.length_squared() else direction
+
+
+class PathRequest:
+    """Demande de chemin asynchrone ; le résultat est livré lors d'un PathFinder.poll()."""
+
+    def __init__(self, key: tuple, callback: Callable[[list[tuple[float, float]] | None], None] | None):
+        self.key = key
+        self.callback = callback
+        self.future: Future | None = None
+        self.cells: list[Cell] | None = None
+        self.done: bool = False
+        self.cancelled: bool = False
+        self.result: list[tuple[float, float]] | None = None
+
+    def is_done(self) -> bool:
+        """Vérifie si le résultat a été livré."""
+        return self.done
+
+    def cancel(self) -> None:
+        """Annule la demande (le rappel ne sera pas appelé)."""
+        self.cancelled = True
+        if self.future is not None:
+            self.future.cancel()
+
+
+class PathFinder:
+    """
+    Service de recherche de chemin sur une NavGrid.
+    Les chemins sont mis en cache par (case de départ, case d'arrivée, version de la grille),
+    les champs de flux par (case cible, version). Les recherches longues sont confiées à un
+    pool de processus et livrées lors d'un poll() ultérieur (à appeler une fois par frame).
+    """
+
+    def __init__(self, grid: NavGrid, diagonal: bool = True, cache_size: int = 512,
+                 async_threshold: int = 48, max_workers: int | None = None, use_processes: bool = True):
+        """
+        grid            : grille de navigation
+        diagonal        : autorise les déplacements en diagonale
+        cache_size      : nombre de chemins conservés en cache
+        async_threshold : distance (en cases) au-delà de laquelle la recherche part dans un autre processus
+        max_workers     : nombre de processus du pool
+        use_processes   : si False, toutes les recherches sont faites dans le processus courant
+        """
+        self.grid = grid
+        self.diagonal = diagonal
+        self.cache_size = cache_size
+        self.async_threshold = async_threshold
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self.path_cache: OrderedDict[tuple, list[Cell] | None] = OrderedDict()
+        self.flow_fields: dict[tuple[Cell, int], FlowField] = {}
+        self.pending: list[PathRequest] = []
+        self.executor: ProcessPoolExecutor | None = None
+
+    def _cache_get(self, key: tuple):
+        """Lit le cache de chemins (LRU)."""
+        if key in self.path_cache:
+            self.path_cache.move_to_end(key)
+            return True, self.path_cache[key]
+        return False, None
+
+    def _cache_put(self, key: tuple, cells: list[Cell] | None) -> None:
+        """Écrit dans le cache de chemins (LRU)."""
+        if key[2] != self.grid.version:
+            return
+        self.path_cache[key] = cells
+        self.path_cache.move_to_end(key)
+        while len(self.path_cache) > self.cache_size:
+            self.path_cache.popitem(last=False)
+
+    def _to_world(self, cells: list[Cell] | None) -> list[tuple[float, float]] | None:
+        """Convertit une liste de cases en points du monde (centres des cases)."""
+        if cells is None:
+            return None
+        return [self.grid.cell_to_world(cell) for cell in cells]
+
+    def find_path(self, start, goal) -> list[tuple[float, float]] | None:
+        """Calcule (de façon synchrone) un chemin entre deux positions du monde."""
+        key = (self.grid.world_to_cell(start), self.grid.world_to_cell(goal), self.grid.version)
+        found, cells = self._cache_get(key)
+        if not found:
+            cells = find_path(bytes(self.grid.walkable), self.grid.width, self.grid.height,
+                              key[0], key[1], self.diagonal)
+            self._cache_put(key, cells)
+        return self._to_world(cells)
+
+    def request_path(self, start, goal,
+                     callback: Callable[[list[tuple[float, float]] | None], None] | None = None) -> PathRequest:
+        """
+        Demande un chemin de façon asynchrone : le résultat (points du monde ou None)
+        est livré au rappel lors d'un prochain poll().
+        """
+        key = (self.grid.world_to_cell(start), self.grid.world_to_cell(goal), self.grid.version)
+        request = PathRequest(key, callback)
+        found, cells = self._cache_get(key)
+        if found:
+            request.cells = cells
+        else:
+            distance = abs(key[0][0] - key[1][0]) + abs(key[0][1] - key[1][1])
+            if self.use_processes and distance > self.async_threshold:
+                if self.executor is None:
+                    self.executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                request.future = self.executor.submit(
+                    find_path, bytes(self.grid.walkable), self.grid.width, self.grid.height,
+                    key[0], key[1], self.diagonal
+                )
+            else:
+                request.cells = find_path(bytes(self.grid.walkable), self.grid.width, self.grid.height,
+                                          key[0], key[1], self.diagonal)
+                self._cache_put(key, request.cells)
+        self.pending.append(request)
+        return request
+
+    def poll(self) -> None:
+        """Livre les résultats disponibles (à appeler une fois par frame)."""
+        if not self.pending:
+            return
+        still_pending = []
+        for request in self.pending:
+            if request.cancelled:
+                continue
+            if request.future is not None:
+                if not request.future.done():
+                    still_pending.append(request)
+                    continue
+                try:
+                    request.cells = request.future.result()
+                except Exception as e:
+                    # Échec du processus de recherche (grille invalide, pool interrompu...) : pas de chemin
+                    print(f"Erreur lors de la recherche de chemin {request.key[:2]}: {e!r}")
+                    request.cells = None
+                else:
+                    self._cache_put(request.key, request.cells)
+            request.result = self._to_world(request.cells)
+            request.done = True
+            if request.callback:
+                request.callback(request.result)
+        self.pending = still_pending
+
+    def get_flow_field(self, goal) -> FlowField:
+        """Retourne le champ de flux vers une position du monde (mis en cache par version de grille)."""
+        cell = self.grid.world_to_cell(goal)
+        key = (cell, self.grid.version)
+        field = self.flow_fields.get(key)
+        if field is None:
+            # Les champs d'une ancienne version de la grille sont périmés
+            self.flow_fields = {k: f for k, f in self.flow_fields.items() if k[1] == self.grid.version}
+            field = FlowField(self.grid, cell, compute_flow_field(
+                bytes(self.grid.walkable), self.grid.width, self.grid.height, cell, self.diagonal
+            ))
+            self.flow_fields[key] = field
+        return field
+
+    def shutdown(self) -> None:
+        """Arrête le pool de processus."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
@@ -2,6 +2,11 @@ import pygame
 import rootFramework as rf
 
 class PhysicalEntity(rf.Entity):
+    __slots__ = (
+        "velocity", "acceleration", "mass", "gravity_value",
+        "friction_ground", "friction_air", "max_speed", "on_ground",
+    )
+
     def __init__(
         self,
         mass: float = 1.0,
@@ -23,6 +28,13 @@ class PhysicalEntity(rf.Entity):
 
         self.on_ground = False
 
+    def reset(self) -> None:
+        """Réinitialise l'état physique de l'entité."""
+        super().reset()
+        self.velocity.xy = (0, 0)
+        self.acceleration.xy = (0, 0)
+        self.on_ground = False
+
     # --------------------
     # Physique de base
     # --------------------
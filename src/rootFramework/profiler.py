@@ -0,0 +1,174 @@
+import rootFramework as rf
+import pygame
+import json
+import time
+from collections import deque
+
+class ProfiledFrame:
+    """Mesures d'une frame : sections chronométrées et temps cumulés par classe d'entité."""
+    __slots__ = ("index", "start", "duration", "sections", "entity_times")
+
+    def __init__(self, index: int, start: float):
+        self.index = index
+        self.start = start
+        self.duration = 0.0
+        # [(nom, catégorie, début, durée)] en secondes (perf_counter)
+        self.sections: list[tuple[str, str, float, float]] = []
+        # { classe d'entité: (temps cumulé, nombre de mises à jour) }
+        self.entity_times: dict[str, list] = {}
+
+
+class Profiler(metaclass=rf.Singleton):
+    """
+    Profileur de frames, désactivé par défaut.
+    Enregistre dans un tampon circulaire la durée de chaque phase de Manager.step
+    (événements, ressources, Time.update, mise à jour, dessin, flip), de chaque scène,
+    et, sur demande, le temps cumulé par classe d'entité.
+    Les mesures s'affichent en surimpression et s'exportent au format Chrome trace
+    (chrome://tracing, Perfetto).
+    """
+
+    def __init__(self):
+        self.enabled: bool = False
+        self.profile_entities: bool = False
+        self.overlay_visible: bool = False
+        self.frames: deque[ProfiledFrame] = deque(maxlen=300)
+        self.current: ProfiledFrame | None = None
+        self.frame_index: int = 0
+
+    def enable(self, frames: int = 300, entities: bool = False) -> None:
+        """Active le profileur sur les `frames` dernières frames (et par classe d'entité si demandé)."""
+        if frames != self.frames.maxlen:
+            self.frames = deque(self.frames, maxlen=frames)
+        self.enabled = True
+        self.profile_entities = entities
+
+    def disable(self) -> None:
+        """Désactive le profileur (les mesures enregistrées sont conservées)."""
+        self.enabled = False
+        self.current = None
+
+    def is_enabled(self) -> bool:
+        return self.enabled
+
+    def show_overlay(self, visible: bool = True) -> None:
+        """Affiche ou masque la surimpression (voir draw_overlay)."""
+        self.overlay_visible = visible
+
+    def clear(self) -> None:
+        """Efface les mesures enregistrées."""
+        self.frames.clear()
+
+    # ----------------------
+    # Enregistrement
+    # ----------------------
+    def begin_frame(self) -> None:
+        self.current = ProfiledFrame(self.frame_index, time.perf_counter())
+        self.frame_index += 1
+
+    def end_frame(self) -> None:
+        frame = self.current
+        if frame is None:
+            return
+        frame.duration = time.perf_counter() - frame.start
+        self.frames.append(frame)
+        self.current = None
+
+    @staticmethod
+    def begin() -> float:
+        """Démarre une section ; retourne l'instant de début à passer à end."""
+        return time.perf_counter()
+
+    def end(self, name: str, start: float, category: str = "phase") -> None:
+        """Termine une section commencée avec begin."""
+        if self.current is not None:
+            self.current.sections.append((name, category, start, time.perf_counter() - start))
+
+    def add_entity_time(self, entity: "rf.Entity", duration: float) -> None:
+        """Ajoute la durée de mise à jour d'une entité au cumul de sa classe."""
+        if self.current is None:
+            return
+        name = type(entity).__name__
+        totals = self.current.entity_times.get(name)
+        if totals is None:
+            self.current.entity_times[name] = [duration, 1]
+        else:
+            totals[0] += duration
+            totals[1] += 1
+
+    # ----------------------
+    # Lecture
+    # ----------------------
+    def get_frames(self, count: int | None = None) -> list[ProfiledFrame]:
+        """Retourne les `count` dernières frames enregistrées (toutes par défaut)."""
+        frames = list(self.frames)
+        return frames if count is None else frames[-count:]
+
+    def get_averages(self, count: int = 60) -> dict[str, float]:
+        """Retourne la durée moyenne (ms) de chaque section et de la frame sur les dernières frames."""
+        frames = self.get_frames(count)
+        if not frames:
+            return {}
+        totals: dict[str, float] = {"frame": 0.0}
+        for frame in frames:
+            totals["frame"] += frame.duration
+            for name, _, _, duration in frame.sections:
+                totals[name] = totals.get(name, 0.0) + duration
+        return {name: total * 1000 / len(frames) for name, total in totals.items()}
+
+    def get_entity_averages(self, count: int = 60) -> dict[str, float]:
+        """Retourne le temps de mise à jour moyen par frame (ms) de chaque classe d'entité."""
+        frames = self.get_frames(count)
+        if not frames:
+            return {}
+        totals: dict[str, float] = {}
+        for frame in frames:
+            for name, (duration, _) in frame.entity_times.items():
+                totals[name] = totals.get(name, 0.0) + duration
+        averages = {name: total * 1000 / len(frames) for name, total in totals.items()}
+        return dict(sorted(averages.items(), key=lambda item: item[1], reverse=True))
+
+    # ----------------------
+    # Affichage et export
+    # ----------------------
+    def draw_overlay(self, surface: pygame.Surface, position: tuple[int, int] = (8, 8),
+                     count: int = 60, font_size: int = 16) -> None:
+        """Dessine les durées moyennes des sections (et des classes d'entités les plus coûteuses)."""
+        font = rf.ResourceManager().get_font(None, font_size)
+        lines = [f"{name}: {duration:.2f} ms" for name, duration in self.get_averages(count).items()]
+        lines += [f"  {name}: {duration:.2f} ms" for name, duration in list(self.get_entity_averages(count).items())[:5]]
+        x, y = position
+        for line in lines:
+            rendered = font.render(line, True, (255, 255, 0), (0, 0, 0))
+            surface.blit(rendered, (x, y))
+            y += rendered.get_height()
+
+    def export_chrome_trace(self, path: str, count: int | None = None) -> None:
+        """
+        Exporte les dernières frames au format Chrome trace (JSON).
+        Les sections sont des événements complets ; les temps par classe d'entité des compteurs.
+        """
+        frames = self.get_frames(count)
+        if not frames:
+            print("Aucune frame profilée à exporter.")
+            return
+        origin = frames[0].start
+        events = []
+        for frame in frames:
+            timestamp = (frame.start - origin) * 1e6
+            events.append({
+                "name": "frame", "cat": "frame", "ph": "X", "pid": 0, "tid": 0,
+                "ts": timestamp, "dur": frame.duration * 1e6, "args": {"index": frame.index},
+            })
+            for name, category, start, duration in frame.sections:
+                events.append({
+                    "name": name, "cat": category, "ph": "X", "pid": 0, "tid": 0,
+                    "ts": (start - origin) * 1e6, "dur": duration * 1e6,
+                })
+            if frame.entity_times:
+                events.append({
+                    "name": "entity updates (ms)", "ph": "C", "pid": 0, "tid": 0, "ts": timestamp,
+                    "args": {name: duration * 1000 for name, (duration, _) in frame.entity_times.items()},
+                })
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
@@ -0,0 +1,98 @@
+import rootFramework as rf
+import pygame
+import gzip
+import json
+import random
+import struct
+from typing import Iterator
+
+# Format (compressé gzip) : en-tête MAGIC + version + graine, puis par frame
+# dt (double) + longueur des événements (uint32) + événements en JSON compact
+MAGIC = b"RFRP"
+VERSION = 1
+HEADER = struct.Struct("<4sHQ")
+FRAME = struct.Struct("<dI")
+
+def encode_events(events: list[pygame.Event]) -> bytes:
+    """Encode des événements pygame (type et attributs sérialisables)."""
+    if not events:
+        return b""
+    return json.dumps(
+        [[event.type, event.dict] for event in events],
+        separators=(",", ":"),
+        default=lambda value: None,  # attributs non sérialisables (ex. fenêtre) ignorés
+    ).encode("utf-8")
+
+def decode_events(payload: bytes) -> list[pygame.Event]:
+    """Reconstruit des événements pygame encodés par encode_events."""
+    if not payload:
+        return []
+    events = []
+    for event_type, attributes in json.loads(payload):
+        for name, value in attributes.items():
+            if isinstance(value, list):
+                attributes[name] = tuple(value)
+        events.append(pygame.event.Event(event_type, attributes))
+    return events
+
+
+class ReplayRecorder:
+    """
+    Enregistre le dt et les événements de chaque frame dans un journal binaire compressé.
+    Le module random est initialisé avec la graine écrite dans l'en-tête.
+    """
+
+    def __init__(self, path: str, seed: int | None = None):
+        self.path = path
+        self.seed = random.getrandbits(63) if seed is None else seed
+        self.frame_count = 0
+        self.file = gzip.open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, self.seed))
+        random.seed(self.seed)
+
+    def record_frame(self, dt: float, events: list[pygame.Event]) -> None:
+        """Ajoute une frame au journal."""
+        payload = encode_events(events)
+        self.file.write(FRAME.pack(dt, len(payload)))
+        self.file.write(payload)
+        self.frame_count += 1
+
+    def close(self) -> None:
+        """Termine le journal."""
+        if not self.file.closed:
+            self.file.close()
+            print(f"Replay saved to '{self.path}' ({self.frame_count} frames).")
+
+
+class ReplayPlayer:
+    """
+    Relit un journal enregistré par ReplayRecorder, frame par frame.
+    Le module random est réinitialisé avec la graine de l'enregistrement.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.file = gzip.open(path, "rb")
+        magic, version, self.seed = HEADER.unpack(self.file.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"'{path}' is not a replay file.")
+        if version != VERSION:
+            raise ValueError(f"Unsupported replay version {version} in '{path}'.")
+        self.frame_count = 0
+        random.seed(self.seed)
+
+    def next_frame(self) -> tuple[float, list[pygame.Event]] | None:
+        """Retourne le dt et les événements de la frame suivante (None à la fin du journal)."""
+        header = self.file.read(FRAME.size)
+        if len(header) < FRAME.size:
+            return None
+        dt, length = FRAME.unpack(header)
+        self.frame_count += 1
+        return dt, decode_events(self.file.read(length))
+
+    def __iter__(self) -> Iterator[tuple[float, list[pygame.Event]]]:
+        while (frame := self.next_frame()) is not None:
+            yield frame
+
+    def close(self) -> None:
+        self.file.close()
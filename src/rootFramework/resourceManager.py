@@ -1,8 +1,71 @@
 import pygame
 from typing import Any
+import copy
+import json
 import os
+import sys
+import tempfile
+import threading
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
 from .utils import Singleton
 
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif")
+FONT_EXTENSIONS = (".ttf", ".otf")
+JSON_EXTENSIONS = (".json",)
+
+
+class PreloadJob:
+    """
+    Préchargement d'une liste de ressources : le décodage se fait sur des threads,
+    la conversion (qui nécessite l'affichage) sur le thread principal, par tranches.
+    """
+
+    def __init__(self, resource_manager: "ResourceManager", paths: list[str]):
+        self.resource_manager = resource_manager
+        self.total: int = len(paths)
+        self.loaded: int = 0
+        self.remaining: list[tuple[str, str, Future | None]] = []
+        for path in paths:
+            key = resource_manager.get_path(path)
+            kind = resource_manager.get_asset_kind(key)
+            future = None
+            if kind == "image" and key not in resource_manager.convert_image_cache:
+                future = resource_manager.get_loader().submit(pygame.image.load, key)
+            elif kind == "json":
+                future = resource_manager.get_loader().submit(resource_manager._read_json, key)
+            self.remaining.append((kind, key, future))
+
+    def update(self, time_budget: float = 0.004) -> bool:
+        """Intègre les ressources décodées dans les caches, dans la limite du budget (s). Retourne True si terminé."""
+        deadline = time.perf_counter() + time_budget
+        pending = []
+        for index, (kind, key, future) in enumerate(self.remaining):
+            if time.perf_counter() > deadline:
+                pending.extend(self.remaining[index:])
+                break
+            if future is not None and not future.done():
+                pending.append((kind, key, future))
+                continue
+            try:
+                self.resource_manager._finish_asset(kind, key, future.result() if future else None)
+            except (pygame.error, OSError, ValueError) as e:
+                print(f"Erreur lors du préchargement de '{key}': {e}")
+            self.loaded += 1
+        self.remaining = pending
+        return self.is_done()
+
+    def is_done(self) -> bool:
+        """Vérifie si toutes les ressources sont chargées."""
+        return not self.remaining
+
+    def get_progress(self) -> float:
+        """Retourne l'avancement du préchargement (0.0 à 1.0)."""
+        return 1.0 if self.total == 0 else self.loaded / self.total
+
+
 class ResourceManager(metaclass=Singleton):
     """Manager pour gérer les ressources du jeu."""
 
@@ -10,8 +73,30 @@ class ResourceManager(metaclass=Singleton):
         self.shared_variables: dict[str, Any] = {}
         self.convert_image_cache: dict[str, pygame.Surface] = {}
         self.convert_alpha_image_cache: dict[str, pygame.Surface] = {}
+        self.font_cache: dict[tuple[str | None, int], pygame.font.Font] = {}
+        self.default_font_size: int = 24
+        self.json_cache: dict[str, tuple[float, Any]] = {}
         self.resource_path: str = "."
 
+        # Écritures JSON en attente : { chemin: contenu sérialisé }
+        self.pending_writes: dict[str, str] = {}
+        self.writes_in_progress: dict[str, str] = {}
+        self.write_condition = threading.Condition()
+        self.writer_thread: threading.Thread | None = None
+
+        # Rechargement à chaud (mode développement)
+        self.hot_reload: bool = False
+        self.hot_reload_interval: float = 0.5
+        self.hot_reload_batch: int = 32
+        self.hot_reload_elapsed: float = 0.0
+        self.watched_files: dict[str, float] = {}  # { chemin: mtime }
+        self.watch_order: list[str] = []
+        self.watch_cursor: int = 0
+        self.reload_listeners: dict[str, list] = {}
+
+        # Threads de décodage pour le préchargement
+        self.loader: ThreadPoolExecutor | None = None
+
     def normalize_path(self, path: str) -> str:
         """Normalise le chemin pour éviter les problèmes de plateforme."""
         return os.path.normpath(path)
@@ -28,32 +113,38 @@ class ResourceManager(metaclass=Singleton):
         """Retourne le chemin complet du path à partir du chemin de base."""
         return os.path.join(self.resource_path, self.normalize_path(path))
 
-    #TODO: Implémenter autres que pour les images
+    #TODO: Implémenter le chargement des fichiers audio
     def load_from_dir(self, path: str):
-        """Charge toutes les ressources d'un répertoire donné."""
+        """Charge toutes les ressources d'un répertoire donné (images et polices)."""
         for root, dirs, files in os.walk(path):
             files = [f for f in files if not f[0] == "."]
             dirs[:] = [d for d in dirs if not d[0] == "."]
 
             for file in files:
                 file_path = os.path.join(root, file)
-                if file.lower().endswith((".png", ".jpg", ".jpeg", ".gif")):
+                if file.lower().endswith(IMAGE_EXTENSIONS):
                     self.load_image(file_path)
 
                 elif file.lower().endswith((".mp3", ".wav", ".ogg")):
                     print(f"Audio files loading not implemented: {file_path}")
 
-                elif file.lower().endswith((".ttf", ".otf")):
-                    print(f"Font files loading not implemented: {file_path}")
-                    
+                elif file.lower().endswith(FONT_EXTENSIONS):
+                    self.load_font(file_path)
 
     def load_image(self, path: str):
         """Charge une image depuis un chemin donné."""
         key = self.get_path(path)
         if key in self.convert_image_cache:
             return
-        self.convert_image_cache[key] = pygame.image.load(key).convert()
-        self.convert_alpha_image_cache[key] = pygame.image.load(key).convert_alpha()
+        self._decode_image(key)
+        self._watch(key)
+
+    def _decode_image(self, key: str, image: pygame.Surface | None = None) -> None:
+        """Décode une image (si elle ne l'est pas déjà) et remplit les deux caches de conversion."""
+        if image is None:
+            image = pygame.image.load(key)
+        self.convert_image_cache[key] = image.convert()
+        self.convert_alpha_image_cache[key] = image.convert_alpha()
 
     def get_image(self, path: str, convert_alpha: bool = True) -> pygame.Surface:
         """Retourne une image chargée depuis le cache ou la charge si elle n'est pas en cache."""
@@ -64,15 +155,269 @@ class ResourceManager(metaclass=Singleton):
             else self.convert_image_cache.get(key)
         )
 
-    #TODO: Implement load_json method
-    def load_json(self, path: str): 
-        """Charge un fichier JSON depuis un chemin donné."""
-        pass
+    def load_font(self, path: str | None, size: int | None = None) -> None:
+        """Charge une police (None = police par défaut de pygame) pour une taille donnée."""
+        self.get_font(path, size)
+
+    def get_font_key(self, path: str | None, size: int | None = None) -> tuple[str | None, int]:
+        """Retourne la clé de cache (chemin complet, taille) d'une police."""
+        return (None if path is None else self.get_path(path), self.default_font_size if size is None else size)
+
+    def get_font(self, path: str | None, size: int | None = None) -> pygame.font.Font:
+        """Retourne une police depuis le cache, indexée par (chemin, taille), en la chargeant si besoin."""
+        key = self.get_font_key(path, size)
+        font = self.font_cache.get(key)
+        if font is None:
+            font = pygame.font.Font(*key)
+            self.font_cache[key] = font
+            if key[0] is not None:
+                self._watch(key[0])
+        return font
+
+    def load_json(self, path: str) -> Any:
+        """
+        Charge un fichier JSON depuis un chemin donné.
+        Le résultat est mis en cache selon la date de modification du fichier ;
+        une sauvegarde en attente sur ce chemin est prioritaire sur le disque.
+        Chaque appel retourne une copie : la modifier n'altère pas le cache.
+        """
+        key = self.get_path(path)
+        with self.write_condition:
+            pending = self.pending_writes.get(key, self.writes_in_progress.get(key))
+        if pending is not None:
+            return json.loads(pending)
+
+        mtime = os.path.getmtime(key)
+        cached = self.json_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return copy.deepcopy(cached[1])
+        mtime, data = self._read_json(key)
+        self.json_cache[key] = (mtime, data)
+        self._watch(key, mtime)
+        return copy.deepcopy(data)
+
+    def _read_json(self, key: str) -> tuple[float, Any]:
+        """Lit un fichier JSON et retourne (mtime, données)."""
+        mtime = os.path.getmtime(key)
+        with open(key, "r", encoding="utf-8") as file:
+            return mtime, json.load(file)
+
+    def save_json(self, path: str, data: Any, blocking: bool = False) -> None:
+        """
+        Sauvegarde des données dans un fichier JSON.
+        Les données sont sérialisées immédiatement puis écrites de façon atomique
+        par un thread d'arrière-plan ; les sauvegardes successives d'un même
+        fichier sont fusionnées (seule la dernière est écrite).
+        """
+        key = self.get_path(path)
+        content = json.dumps(data, ensure_ascii=False, indent=4)
+        self.json_cache.pop(key, None)
+        if blocking:
+            with self.write_condition:
+                self.pending_writes.pop(key, None)
+                self.write_condition.wait_for(lambda: key not in self.writes_in_progress)
+            self._write_file(key, content)
+            return
+
+        with self.write_condition:
+            self.pending_writes[key] = content
+            if self.writer_thread is None or not self.writer_thread.is_alive():
+                self.writer_thread = threading.Thread(
+                    target=self._writer_loop, name="rootFramework-json-writer", daemon=True
+                )
+                self.writer_thread.start()
+            self.write_condition.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Attend que toutes les sauvegardes en attente soient écrites. Retourne False si le délai expire."""
+        with self.write_condition:
+            return self.write_condition.wait_for(
+                lambda: not self.pending_writes and not self.writes_in_progress, timeout
+            )
+
+    def _writer_loop(self) -> None:
+        """Boucle du thread d'écriture des fichiers JSON."""
+        while True:
+            with self.write_condition:
+                self.write_condition.wait_for(lambda: self.pending_writes)
+                key, content = self.pending_writes.popitem()
+                self.writes_in_progress[key] = content
+            try:
+                self._write_file(key, content)
+            except OSError as e:
+                print(f"Erreur lors de la sauvegarde de '{key}': {e}")
+            finally:
+                with self.write_condition:
+                    del self.writes_in_progress[key]
+                    self.write_condition.notify_all()
+
+    def _write_file(self, key: str, content: str) -> None:
+        """Écrit un fichier de façon atomique (fichier temporaire puis renommage)."""
+        directory = os.path.dirname(key) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                file.write(content)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, key)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    # ----------------------
+    # Préchargement
+    # ----------------------
+    def get_asset_kind(self, path: str) -> str | None:
+        """Retourne le type de ressource d'après l'extension ("image", "font", "json" ou None)."""
+        extension = os.path.splitext(path)[1].lower()
+        if extension in IMAGE_EXTENSIONS:
+            return "image"
+        if extension in FONT_EXTENSIONS:
+            return "font"
+        if extension in JSON_EXTENSIONS:
+            return "json"
+        return None
+
+    def get_loader(self) -> ThreadPoolExecutor:
+        """Retourne le pool de threads de décodage (créé à la demande)."""
+        if self.loader is None:
+            self.loader = ThreadPoolExecutor(max_workers=2, thread_name_prefix="rootFramework-loader")
+        return self.loader
+
+    def preload(self, paths: list[str]) -> PreloadJob:
+        """Lance le préchargement en arrière-plan d'une liste de ressources ; appeler job.update() à chaque frame."""
+        return PreloadJob(self, list(paths))
+
+    def load_assets(self, paths: list[str]) -> None:
+        """Charge immédiatement une liste de ressources."""
+        for path in paths:
+            key = self.get_path(path)
+            self._finish_asset(self.get_asset_kind(key), key, None)
+
+    def _finish_asset(self, kind: str | None, key: str, result: Any) -> None:
+        """Intègre une ressource (éventuellement déjà décodée) dans les caches."""
+        if kind == "image":
+            if key not in self.convert_image_cache:
+                self._decode_image(key, result)
+                self._watch(key)
+        elif kind == "font":
+            self.load_font(key)
+        elif kind == "json":
+            mtime, data = result if result is not None else self._read_json(key)
+            self.json_cache[key] = (mtime, data)
+            self._watch(key, mtime)
+
+    # ----------------------
+    # Rechargement à chaud
+    # ----------------------
+    def enable_hot_reload(self, interval: float = 0.5, files_per_check: int = 32) -> None:
+        """
+        Active le rechargement à chaud des ressources chargées (mode développement).
+
+        interval        : délai (s) entre deux vérifications
+        files_per_check : nombre maximal de fichiers vérifiés à chaque passage
+        """
+        self.hot_reload = True
+        self.hot_reload_interval = interval
+        self.hot_reload_batch = max(1, files_per_check)
+        self.hot_reload_elapsed = 0.0
+
+    def disable_hot_reload(self) -> None:
+        """Désactive le rechargement à chaud."""
+        self.hot_reload = False
+
+    def add_reload_listener(self, path: str, callback: Callable[[str], None]) -> None:
+        """
+        Enregistre une fonction appelée avec le chemin complet lorsqu'un fichier est rechargé.
+        Les méthodes liées sont référencées faiblement.
+        """
+        key = self.get_path(path)
+        ref = weakref.WeakMethod(callback) if hasattr(callback, "__self__") else (lambda: callback)
+        self.reload_listeners.setdefault(key, []).append(ref)
+
+    def remove_reload_listener(self, path: str, callback: Callable[[str], None]) -> None:
+        """Retire une fonction de rechargement."""
+        key = self.get_path(path)
+        listeners = self.reload_listeners.get(key)
+        if listeners:
+            listeners[:] = [ref for ref in listeners if ref() not in (None, callback)]
+
+    def poll_changes(self, dt: float) -> None:
+        """
+        Vérifie, à faible cadence, si des fichiers chargés ont été modifiés sur le disque.
+        Seul un lot de fichiers est vérifié à chaque passage pour borner le coût par frame.
+        """
+        if not self.hot_reload or not self.watch_order:
+            return
+        self.hot_reload_elapsed += dt
+        if self.hot_reload_elapsed < self.hot_reload_interval:
+            return
+        self.hot_reload_elapsed = 0.0
+
+        for _ in range(min(self.hot_reload_batch, len(self.watch_order))):
+            self.watch_cursor %= len(self.watch_order)
+            key = self.watch_order[self.watch_cursor]
+            self.watch_cursor += 1
+            try:
+                mtime = os.path.getmtime(key)
+            except OSError:
+                continue
+            if mtime != self.watched_files[key]:
+                self.watched_files[key] = mtime
+                self.reload_file(key)
+
+    def reload_file(self, key: str) -> None:
+        """Recharge un fichier modifié dans les caches puis notifie ses dépendants."""
+        try:
+            if key in self.convert_image_cache:
+                self._decode_image(key)
+            for font_key in [k for k in self.font_cache if k[0] == key]:
+                self.font_cache[font_key] = pygame.font.Font(key, font_key[1])
+            self._clear_glyphs(key)
+            self.json_cache.pop(key, None)
+        except (pygame.error, OSError) as e:
+            print(f"Erreur lors du rechargement de '{key}': {e}")
+            return
+
+        print(f"Ressource rechargée : {key}")
+        listeners = self.reload_listeners.get(key)
+        if not listeners:
+            return
+        listeners[:] = [ref for ref in listeners if ref() is not None]
+        for ref in list(listeners):
+            callback = ref()
+            if callback is not None:
+                callback(key)
+
+    def _watch(self, key: str, mtime: float | None = None) -> None:
+        """Mémorise la date de modification d'un fichier chargé."""
+        if key in self.watched_files:
+            return
+        try:
+            self.watched_files[key] = os.path.getmtime(key) if mtime is None else mtime
+        except OSError:
+            return
+        self.watch_order.append(key)
+
+    def clear_cache(self) -> None:
+        """Vide les caches d'images, de polices et de JSON (les fichiers ne sont plus suivis)."""
+        self.convert_image_cache.clear()
+        self.convert_alpha_image_cache.clear()
+        self.font_cache.clear()
+        self._clear_glyphs()
+        self.json_cache.clear()
+        self.watched_files.clear()
+        self.watch_order.clear()
+        self.watch_cursor = 0
 
-    #TODO: Implement save_json method
-    def save_json(self, path: str, data: dict) -> None:
-        """Sauvegarde un dictionnaire dans un fichier JSON."""
-        pass
+    def _clear_glyphs(self, path: str | None = None) -> None:
+        """Vide les glyphes pré-rendus des polices (si le module text a été chargé)."""
+        text = sys.modules.get(f"{__package__}.text")
+        if text is not None:
+            text.GlyphCache().clear(path)
 
     def set_shared_variable(self, name: str, value) -> bool:
         """Définit une variable partagée."""
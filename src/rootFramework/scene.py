@@ -1,9 +1,7 @@
 import pygame
+import rootFramework as rf
+import time
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
-
-if TYPE_CHECKING:
-    import rootFramework as rf
 
 class Scene(ABC):
     """Classe de base pour une scène dans le framework."""
@@ -15,9 +13,47 @@ class Scene(ABC):
         self.screen: pygame.Surface = None
         self.manager: "rf.SceneManager | None" = None
         self.index: int = 0
+        self.time_scale: float = 1.0 # Échelle du dt des entités de la scène (multipliée à celle de Time)
         self.world_entities: list[rf.Entity] = [] # Liste des entités du monde -> affetcté par la caméra
         self.hud_entities: list[rf.Entity] = [] # Liste des entités HUD -> non affecté par la caméra
 
+        # Position de chaque entité dans sa liste (appartenance et retrait en O(1))
+        self.world_indices: dict[rf.Entity, int] = {}
+        self.hud_indices: dict[rf.Entity, int] = {}
+
+        # Bus d'événements : seuls les abonnés d'un type (ou d'une touche/d'un bouton) sont appelés
+        self.event_bus: rf.EventBus = rf.EventBus()
+
+        # Entités qui surchargent do_process_actions, appelées une fois par frame
+        self.action_entities: dict[rf.Entity, None] = {}
+
+        # Hibernation : surfaces des entités libérées tant que la scène n'est ni active ni visible
+        self.hibernated: bool = False
+
+        # Ressources à précharger avant d'entrer dans la scène (images, polices, JSON)
+        self.asset_manifest: list[str] = []
+
+        # Niveau de détail des mises à jour (voir set_update_lod)
+        self.lod_camera: "rf.Camera | None" = None
+        self.lod_near: float = 0.0
+        self.lod_far: float = 0.0
+        self.lod_interval: int = 4
+        self.lod_far_interval: int | None = None
+        self.frame_index: int = 0
+        self.next_update_phase: int = 0
+
+        # Monde ECS optionnel, créé à la demande (voir get_ecs_world)
+        self.ecs_world: "rf.World | None" = None
+
+        # Ajouts/retraits demandés pendant la mise à jour, appliqués en fin de do_update
+        self.updating: bool = False
+        self.pending_operations: list[tuple[str, rf.Entity]] = []
+
+        # Index inversé des tags : { tag: entités portant ce tag }
+        self.tag_index: dict[str, set[rf.Entity]] = {}
+        self.tag_versions: dict[str, int] = {}
+        self.tag_query_cache: dict[frozenset[str], tuple[tuple[int, ...], tuple[rf.Entity, ...]]] = {}
+
     def __str__(self):
         return f"Scene(name={self.name}, visible={self.visible}, active={self.active})"
     
@@ -38,7 +74,11 @@ class Scene(ABC):
         return self.visible
     
     def set_visible(self, visible: bool) -> None:
-        """Définit la visibilité de la scène."""
+        """Définit la visibilité de la scène (la réveille si elle hiberne)."""
+        if visible and self.hibernated:
+            self.wake()
+        if visible != self.visible and self.manager is not None:
+            self.manager.invalidate_scene_states()
         self.visible = visible
     
     def is_active(self) -> bool:
@@ -46,9 +86,63 @@ class Scene(ABC):
         return self.active
     
     def set_active(self, active: bool) -> None:
-        """Définit l'état actif de la scène."""
+        """Définit l'état actif de la scène (la réveille si elle hiberne)."""
+        if active and self.hibernated:
+            self.wake()
+        if active != self.active and self.manager is not None:
+            self.manager.invalidate_scene_states()
         self.active = active
 
+    def hibernate(self) -> bool:
+        """
+        Met la scène en hibernation : l'état des entités (positions, tags, vitesses...) est conservé,
+        mais les surfaces reconstructibles sont libérées et récupérées depuis le ResourceManager au réveil.
+        Seule une scène ni active ni visible peut hiberner.
+        """
+        if self.hibernated:
+            return True
+        if self.active or self.visible:
+            print(f"Impossible de mettre en hibernation la scène '{self.name}' : elle est active ou visible.")
+            return False
+        for entity in self.world_entities:
+            entity.do_hibernate()
+        for entity in self.hud_entities:
+            entity.do_hibernate()
+        self.hibernated = True
+        return True
+
+    def wake(self) -> None:
+        """Réveille la scène : reconstruit les surfaces libérées par hibernate."""
+        if not self.hibernated:
+            return
+        self.hibernated = False
+        for entity in self.world_entities:
+            entity.do_wake()
+        for entity in self.hud_entities:
+            entity.do_wake()
+
+    def is_hibernated(self) -> bool:
+        """Vérifie si la scène est en hibernation."""
+        return self.hibernated
+
+    def get_memory_usage(self) -> int:
+        """Retourne la mémoire (en octets) des surfaces et tableaux propres aux entités de la scène."""
+        usage = sum(entity.get_memory_usage() for entity in self.world_entities)
+        usage += sum(entity.get_memory_usage() for entity in self.hud_entities)
+        return usage
+
+    def set_time_scale(self, scale: float) -> None:
+        """
+        Définit l'échelle de temps de la scène.
+        Seul le dt des mises à jour de la scène et de ses entités est affecté :
+        minuteurs, coroutines et tweens suivent l'horloge globale de Time (voir Time.set_time_scale).
+        """
+        self.time_scale = max(0.0, scale)
+
+    def get_time_scale(self) -> float:
+        """Retourne l'échelle de temps de la scène."""
+        return self.time_scale
+
     def set_manager(self, manager: "rf.SceneManager") -> None:
         """Assigne le gestionnaire de scène à cette scène."""
         self.manager = manager
@@ -63,50 +157,254 @@ class Scene(ABC):
         return self.index
 
     def add_world_entity(self, *entities: "rf.Entity"):
-        """Ajoute des entités au monde de la scène."""
+        """Ajoute des entités au monde de la scène (différé si la scène est en cours de mise à jour)."""
         for entity in entities:
-            if entity not in self.world_entities:
-                self.world_entities.append(entity)
-                entity.set_parent_scene(self)
+            if self.updating:
+                self.pending_operations.append(("add_world", entity))
+            else:
+                self._insert_entity(self.world_entities, self.world_indices, entity)
 
     def remove_world_entity(self, *entities: "rf.Entity"):
-        """Retire des entités du monde de la scène."""
+        """Retire des entités du monde de la scène (différé si la scène est en cours de mise à jour)."""
         for entity in entities:
-            if entity in self.world_entities:
-                self.world_entities.remove(entity)
-                entity.set_parent_scene(None)
+            if self.updating:
+                self.pending_operations.append(("remove_world", entity))
+            else:
+                self._delete_entity(self.world_entities, self.world_indices, entity)
 
     def add_hud_entity(self, *entities: "rf.Entity"):
-        """Ajoute des entités au HUD de la scène."""
+        """Ajoute des entités au HUD de la scène (différé si la scène est en cours de mise à jour)."""
         for entity in entities:
-            if entity not in self.hud_entities:
-                self.hud_entities.append(entity)
-                entity.set_parent_scene(self)
+            if self.updating:
+                self.pending_operations.append(("add_hud", entity))
+            else:
+                self._insert_entity(self.hud_entities, self.hud_indices, entity)
 
     def remove_hud_entity(self, *entities: "rf.Entity"):
-        """Retire des entités du HUD de la scène."""
+        """Retire des entités du HUD de la scène (différé si la scène est en cours de mise à jour)."""
         for entity in entities:
-            if entity in self.hud_entities:
-                self.hud_entities.remove(entity)
-                entity.set_parent_scene(None)
+            if self.updating:
+                self.pending_operations.append(("remove_hud", entity))
+            else:
+                self._delete_entity(self.hud_entities, self.hud_indices, entity)
+
+    def get_ecs_world(self) -> "rf.World":
+        """Retourne le monde ECS de la scène (créé avec les systèmes intégrés au premier appel)."""
+        if self.ecs_world is None:
+            self.ecs_world = rf.ecs.default_world()
+        return self.ecs_world
+
+    def get_asset_manifest(self) -> list[str]:
+        """Retourne les ressources à précharger avant d'entrer dans la scène. Peut être surchargé."""
+        return self.asset_manifest
+
+    def set_update_lod(self,
+                       camera: "rf.Camera | None",
+                       near: float = 200.0,
+                       far: float = 800.0,
+                       interval: int = 4,
+                       far_interval: int | None = None) -> None:
+        """
+        Active la mise à jour par niveau de détail des entités du monde en mode UPDATE_AUTO.
+
+        camera       : caméra de référence (None désactive le niveau de détail)
+        near         : distance (px) à la zone visible en deçà de laquelle l'entité est mise à jour à chaque frame
+        far          : distance au-delà de laquelle l'entité est gelée (ou ralentie avec far_interval)
+        interval     : une mise à jour toutes les interval frames entre near et far
+        far_interval : si défini, les entités lointaines sont mises à jour toutes les far_interval frames au lieu d'être gelées
+        """
+        self.lod_camera = camera
+        self.lod_near = near
+        self.lod_far = max(near, far)
+        self.lod_interval = max(1, interval)
+        self.lod_far_interval = None if far_interval is None else max(1, far_interval)
+
+    def _update_world_entities(self, dt: float, profiler: "rf.Profiler | None" = None) -> None:
+        """
+        Met à jour les entités du monde en appliquant leur politique de mise à jour.
+        Si un profileur est donné, la durée de chaque mise à jour est cumulée par classe d'entité.
+        """
+        frame = self.frame_index
+        camera = self.lod_camera
+        if camera is not None:
+            area = camera.get_visible_area()
+            near_area = area.inflate(self.lod_near * 2, self.lod_near * 2)
+            far_area = area.inflate(self.lod_far * 2, self.lod_far * 2)
+
+        for entity in self.world_entities:
+            mode = entity.update_mode
+            interval = entity.update_interval
+            if mode == "auto":
+                if camera is None or near_area.colliderect(entity.rect):
+                    mode = "always"
+                elif far_area.colliderect(entity.rect):
+                    mode, interval = "throttled", self.lod_interval
+                elif self.lod_far_interval is not None:
+                    mode, interval = "throttled", self.lod_far_interval
+                else:
+                    mode = "frozen"
+
+            if mode == "always":
+                entity_dt = dt + entity.skipped_dt if entity.skipped_dt else dt
+            elif mode == "throttled":
+                entity.skipped_dt += dt
+                if (frame + entity.update_phase) % interval:
+                    continue
+                entity_dt = entity.skipped_dt
+            else:
+                # Gelée : le temps accumulé en mode ralenti ne doit pas être rattrapé au dégel
+                entity.skipped_dt = 0.0
+                continue
+            entity.skipped_dt = 0.0
+
+            if profiler is None:
+                entity.update(entity_dt)
+            else:
+                start = time.perf_counter()
+                entity.update(entity_dt)
+                profiler.add_entity_time(entity, time.perf_counter() - start)
+
+    def has_entity(self, entity: "rf.Entity") -> bool:
+        """Vérifie si une entité appartient à la scène (monde ou HUD)."""
+        return entity in self.world_indices or entity in self.hud_indices
+
+    def apply_pending_operations(self) -> None:
+        """Applique les ajouts et retraits d'entités différés, dans l'ordre des demandes."""
+        while self.pending_operations:
+            operations = self.pending_operations
+            self.pending_operations = []
+            for operation, entity in operations:
+                if operation == "add_world":
+                    self._insert_entity(self.world_entities, self.world_indices, entity)
+                elif operation == "remove_world":
+                    self._delete_entity(self.world_entities, self.world_indices, entity)
+                elif operation == "add_hud":
+                    self._insert_entity(self.hud_entities, self.hud_indices, entity)
+                elif operation == "remove_hud":
+                    self._delete_entity(self.hud_entities, self.hud_indices, entity)
+                elif operation == "refresh_actions":
+                    self.refresh_action_entity(entity)
+                else:
+                    raise ValueError(f"Unknown pending operation '{operation}' in scene '{self.name}'.")
+
+    def _insert_entity(self, entities: list["rf.Entity"], indices: dict["rf.Entity", int], entity: "rf.Entity") -> None:
+        """Ajoute une entité en fin de liste en mémorisant sa position."""
+        if entity in indices:
+            return
+        indices[entity] = len(entities)
+        entities.append(entity)
+        entity.update_phase = self.next_update_phase
+        self.next_update_phase += 1
+        entity.acquire_uid()
+        entity.set_parent_scene(self)
+        self.index_tags(entity, entity.tags)
+        if entity.handles_actions():
+            self.action_entities[entity] = None
+
+    def _delete_entity(self, entities: list["rf.Entity"], indices: dict["rf.Entity", int], entity: "rf.Entity") -> None:
+        """Retire une entité en O(1) en la remplaçant par la dernière de la liste (l'ordre n'est pas conservé)."""
+        index = indices.pop(entity, None)
+        if index is None:
+            return
+        last = entities.pop()
+        if last is not entity:
+            entities[index] = last
+            indices[last] = index
+            # L'entité déplacée change de rang : les requêtes sur ses tags sont à retrier
+            for tag in last.tags:
+                self.tag_versions[tag] = self.tag_versions.get(tag, 0) + 1
+        self.unindex_tags(entity, entity.tags)
+        self.action_entities.pop(entity, None)
+        entity.set_parent_scene(None)
+        self.event_bus.unsubscribe_all(entity)
+        if entity.pool is not None:
+            entity.pool.release(entity)
+        else:
+            entity.release_uid()
+
+    def index_tags(self, entity: "rf.Entity", tags) -> None:
+        """Ajoute une entité à l'index des tags donnés."""
+        for tag in tags:
+            self.tag_index.setdefault(tag, set()).add(entity)
+            self.tag_versions[tag] = self.tag_versions.get(tag, 0) + 1
+
+    def unindex_tags(self, entity: "rf.Entity", tags) -> None:
+        """Retire une entité de l'index des tags donnés."""
+        for tag in tags:
+            entities = self.tag_index.get(tag)
+            if entities is None or entity not in entities:
+                continue
+            entities.discard(entity)
+            if not entities:
+                del self.tag_index[tag]
+            self.tag_versions[tag] = self.tag_versions.get(tag, 0) + 1
 
     def get_by_tags(self, *tags: str) -> list["rf.Entity"]:
         """Retourne une liste d'entités ayant tous les tags spécifiés."""
-        return [entity for entity in self.world_entities + self.hud_entities if entity.has_tags(*tags)]
+        return list(self.get_view_by_tags(*tags))
+
+    def get_view_by_tags(self, *tags: str) -> tuple["rf.Entity", ...]:
+        """
+        Retourne un tuple (partagé, à ne pas conserver) des entités ayant tous les tags spécifiés,
+        dans l'ordre de la scène (monde puis HUD).
+        Le résultat est mis en cache et n'est recalculé que si l'un des tags a changé.
+        """
+        if not tags:
+            return tuple(self.world_entities) + tuple(self.hud_entities)
+        key = frozenset(tags)
+        versions = tuple(self.tag_versions.get(tag, 0) for tag in key)
+        cached = self.tag_query_cache.get(key)
+        if cached is not None and cached[0] == versions:
+            return cached[1]
+
+        sets = sorted((self.tag_index.get(tag, ()) for tag in key), key=len)
+        if not sets[0]:
+            result = ()
+        else:
+            # L'ordre des ensembles dépend des hash des entités : le résultat est trié par rang dans la scène
+            matches = [entity for entity in sets[0] if all(entity in others for others in sets[1:])]
+            matches.sort(key=self._store_order)
+            result = tuple(matches)
+        self.tag_query_cache[key] = (versions, result)
+        return result
+
+    def _store_order(self, entity: "rf.Entity") -> tuple[int, int]:
+        """Clé de tri d'une entité selon sa position dans la scène (monde puis HUD)."""
+        index = self.world_indices.get(entity)
+        if index is not None:
+            return (0, index)
+        return (1, self.hud_indices.get(entity, len(self.hud_indices)))
 
     def get_by_uid(self, uid: int) -> "rf.Entity | None":
-        """Retourne une entité par son UID."""
-        for entity in self.world_entities + self.hud_entities:
-            if entity.uid == uid:
-                return entity
+        """Retourne une entité de la scène par son UID (None si l'UID est périmé)."""
+        entity = rf.Entity.get_entity(uid)
+        if entity is not None and entity.parent_scene is self:
+            return entity
         return None
     
     def do_update(self, dt: float) -> None:
-        """Met à jour la scène."""
-        for entity in self.world_entities + self.hud_entities:
-            entity.update(dt)
+        """Met à jour la scène. Les ajouts/retraits d'entités sont appliqués à la fin."""
+        profiler = rf.Profiler()
+        profiler = profiler if profiler.enabled and profiler.profile_entities else None
+        self.updating = True
+        try:
+            if self.ecs_world is not None:
+                self.ecs_world.update(dt)
+            self._update_world_entities(dt, profiler)
+            if profiler is None:
+                for entity in self.hud_entities:
+                    entity.update(dt)
+            else:
+                for entity in self.hud_entities:
+                    start = time.perf_counter()
+                    entity.update(dt)
+                    profiler.add_entity_time(entity, time.perf_counter() - start)
 
-        self.update(dt)
+            self.update(dt)
+        finally:
+            self.frame_index += 1
+            self.updating = False
+            self.apply_pending_operations()
 
     @abstractmethod
     def update(self, dt: float) -> None:
@@ -118,6 +416,51 @@ class Scene(ABC):
         """Dessine la scène sur la surface donnée. À implémenter dans les sous-classes."""
         pass
 
+    def process_event(self, event: pygame.event.Event) -> None:
+        """Transmet un événement aux abonnés du bus, puis à handle_event."""
+        self.event_bus.dispatch(event)
+        self.handle_event(event)
+
+    def process_actions(self, actions: "rf.ActionState") -> None:
+        """
+        Transmet les actions résolues de la frame aux entités qui les utilisent.
+        Comme dans do_update, les ajouts/retraits d'entités demandés sont appliqués à la fin.
+        """
+        updating = self.updating
+        self.updating = True
+        try:
+            for entity in self.action_entities:
+                entity.do_process_actions(actions)
+        finally:
+            self.updating = updating
+            if not updating:
+                self.apply_pending_operations()
+
+    def refresh_action_entity(self, entity: "rf.Entity") -> None:
+        """Met à jour l'inscription d'une entité aux actions après un changement de handles_actions()."""
+        if self.updating:
+            self.pending_operations.append(("refresh_actions", entity))
+        elif entity.handles_actions() and self.has_entity(entity):
+            self.action_entities[entity] = None
+        else:
+            self.action_entities.pop(entity, None)
+
+    def reset_actions(self) -> None:
+        """Réinitialise les actions des entités (ex. lorsque la scène perd les entrées)."""
+        updating = self.updating
+        self.updating = True
+        try:
+            for entity in self.action_entities:
+                entity.do_reset_actions()
+        finally:
+            self.updating = updating
+            if not updating:
+                self.apply_pending_operations()
+
+    def subscribe(self, event_type: int, callback, code: int | None = None) -> None:
+        """Abonne une fonction de la scène à un type d'événement (voir EventBus.subscribe)."""
+        self.event_bus.subscribe(event_type, callback, code, owner=self)
+
     def handle_event(self, event: pygame.event.Event) -> None:
         """Gère les événements. Peut être surchargé dans les sous-classes."""
         pass
@@ -129,6 +472,7 @@ class Scene(ABC):
 
     def on_exit(self) -> None:
         """Action à effectuer lorsque la scène est désactivée."""
+        self.reset_actions()
         self.set_active(False)
         self.set_visible(False)
 
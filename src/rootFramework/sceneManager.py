@@ -1,26 +1,40 @@
 import pygame
+import rootFramework as rf
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
-
-if TYPE_CHECKING:
-    import rootFramework as rf
 
 
 class SceneManager(ABC):
     """Classe de base pour la gestion des scènes dans le framework."""
 
     def __init__(self):
+        self.screen: pygame.Surface | None = None
+        self.profiler: rf.Profiler = rf.Profiler()
         self.scenes: list["rf.Scene"] = []
 
+        # Index des scènes par nom, et listes mises en cache des scènes actives/visibles
+        self.scene_index: dict[str, "rf.Scene"] = {}
+        self.active_scenes: list["rf.Scene"] = []
+        self.visible_scenes: list["rf.Scene"] = []
+        self.scene_states_dirty: bool = True
+
+        # Si True, une scène quittée par transition hiberne (voir Scene.hibernate)
+        self.auto_hibernate: bool = False
+
+        # Transition en cours (voir transition_to_scene)
+        self.transition: "rf.Transition | None" = None
+        self.transition_target: str | None = None
+        self.transition_job: "rf.resourceManager.PreloadJob | None" = None
+        self.transition_elapsed: float = 0.0
+        self.transition_swapped: bool = False
+        self.outgoing_snapshot: pygame.Surface | None = None
+        self.incoming_snapshot: pygame.Surface | None = None
+
     def init_scenes(self, screen: pygame.Surface, *initial_scenes: "rf.Scene") -> None:
         """Initialise les scènes avec le gestionnaire."""
         self.screen = screen
-            
-        for index, scene in enumerate(initial_scenes):
-            scene.set_manager(self)
-            scene.set_index(index)
-            scene.do_when_added()
-            self.scenes.append(scene)
+
+        for scene in initial_scenes:
+            self.add_scene(scene)
         
         # Activer la première scène par défaut
         if self.scenes:
@@ -40,81 +54,213 @@ class SceneManager(ABC):
     
     def get_index_of_scene(self, name: str) -> int:
         """Retourne l'index de la scène par son nom."""
-        if not self.has_scene(name):
+        scene = self.scene_index.get(name)
+        if scene is None:
             raise ValueError(f"Scene '{name}' not found in SceneManager.")
-        for s in self.scenes:
-            if s.name == name:
-                return s.get_index()
+        return scene.get_index()
+
+    def invalidate_scene_states(self) -> None:
+        """Signale un changement d'état (actif/visible) ou d'ordre des scènes."""
+        self.scene_states_dirty = True
     
     def update_scene_states(self):
-        """Met à jour les états des scènes visibles et actives."""
-        self.active_scenes = [s for s in reversed(self.scenes) if s.is_active]
-        self.visible_scenes = [s for s in reversed(self.scenes) if s.is_visible]
+        """Met à jour les états des scènes visibles et actives (de la plus basse à la scène courante)."""
+        self.active_scenes = [s for s in reversed(self.scenes) if s.is_active()]
+        self.visible_scenes = [s for s in reversed(self.scenes) if s.is_visible()]
+        self.scene_states_dirty = False
 
     def add_scene(self, scene: "rf.Scene") -> None:
-        """Ajoute une scène à la liste des scènes."""
-        pass
+        """Ajoute une scène à la fin de la liste des scènes."""
+        if scene.name in self.scene_index:
+            raise ValueError(f"Scene '{scene.name}' already exists in SceneManager.")
+        scene.set_manager(self)
+        scene.set_index(len(self.scenes))
+        self.scenes.append(scene)
+        self.scene_index[scene.name] = scene
+        scene.do_when_added()
+        self.invalidate_scene_states()
 
     def remove_scene(self, scene: "rf.Scene") -> None:
-        """Supprime une scène de la liste des scènes."""
-        pass
+        """Supprime une scène de la liste des scènes (elle est désactivée si besoin)."""
+        if self.scene_index.get(scene.name) is not scene:
+            raise ValueError(f"Scene '{scene.name}' not found in SceneManager.")
+        if scene.is_active() or scene.is_visible():
+            scene.on_exit()
+        index = scene.get_index()
+        del self.scenes[index]
+        del self.scene_index[scene.name]
+        for following in self.scenes[index:]:
+            following.set_index(following.get_index() - 1)
+        scene.manager = None
+        self.invalidate_scene_states()
 
     def has_scene(self, name: str) -> bool:
         """Vérifie si une scène est présente dans la liste des scènes."""
-        return any(name == scene.name for scene in self.scenes)
+        return name in self.scene_index
     
     def get_scene(self, name: str) -> "rf.Scene":
         """Retourne une scène par son nom."""
-        if not self.has_scene(name):
-            return None
-        for scene in self.scenes:
-            if scene.name == name:
-                return scene
-        return None
+        return self.scene_index.get(name)
     
     def set_scene(self, name: str, index: int = 0) -> None:
         """Définit la scène par son nom et son index."""
-        if not self.has_scene(name):
+        scene = self.scene_index.get(name)
+        if scene is None:
             raise ValueError(f"Scene '{name}' not found in SceneManager.")
         if index < 0 or index >= len(self.scenes):
             raise IndexError("Index out of range for scenes list.")
-        self.scenes[index] = self.get_scene(name)
+        replaced = self.scenes[index]
+        self.scenes[index] = scene
         self.scenes[index].set_index(index)
+        if replaced is not scene and replaced not in self.scenes:
+            del self.scene_index[replaced.name]
+        self.invalidate_scene_states()
 
-    def transition_to_scene(self, name: str, transition=None) -> None:
-        """Transition vers une scène par son nom."""
-        if not self.has_scene(name):
+    def transition_to_scene(self, name: str, transition: "rf.Transition | None" = None) -> None:
+        """
+        Transition vers une scène par son nom.
+        Sans effet, les ressources déclarées par la scène sont chargées puis l'échange est immédiat.
+        Avec un effet, les ressources sont préchargées en arrière-plan pendant que l'effet
+        compose des instantanés des deux scènes ; l'échange n'a lieu qu'une fois le chargement terminé.
+        Une demande faite pendant une transition est ignorée (la transition en cours n'est pas interrompue).
+        """
+        scene = self.scene_index.get(name)
+        if scene is None:
             raise ValueError(f"Scene '{name}' not found in SceneManager.")
-        
+        if self.is_transitioning():
+            print(f"Transition vers '{name}' ignorée : une transition vers '{self.transition_target}' est en cours.")
+            return
+
+        manifest = scene.get_asset_manifest()
+        if transition is None:
+            rf.ResourceManager().load_assets(manifest)
+            self._swap_to_scene(name)
+            return
+
+        self.transition = transition
+        self.transition_target = name
+        self.transition_job = rf.ResourceManager().preload(manifest)
+        self.transition_elapsed = 0.0
+        self.transition_swapped = False
+        self.outgoing_snapshot = self.screen.copy()
+        self.incoming_snapshot = None
+
+    def is_transitioning(self) -> bool:
+        """Vérifie si une transition est en cours."""
+        return self.transition is not None
+
+    def _swap_to_scene(self, name: str) -> None:
+        """Échange la scène courante avec la scène cible."""
         # Désactiver l'ancienne scène courante
-        self.get_current_scene().on_exit()
-        
-        current_index = 0 
+        previous_scene = self.get_current_scene()
+        previous_scene.on_exit()
+
+        current_index = 0
         target_index = self.get_index_of_scene(name)
-        
+
         # Échanger les scènes dans la liste
         self.scenes[current_index], self.scenes[target_index] = \
             self.scenes[target_index], self.scenes[current_index]
         self.scenes[current_index].set_index(current_index)
         self.scenes[target_index].set_index(target_index)
+        self.invalidate_scene_states()
 
         # Activer la nouvelle scène courante
         self.get_current_scene().on_enter()
 
+        if self.auto_hibernate and previous_scene is not self.get_current_scene():
+            previous_scene.hibernate()
+
         print(f"Transitioning to scene '{name}' at index {target_index} with {self.get_current_scene()}.")
 
+    def hibernate_inactive_scenes(self) -> int:
+        """Met en hibernation toutes les scènes ni actives ni visibles. Retourne le nombre de scènes concernées."""
+        count = 0
+        for scene in self.scenes:
+            if not scene.is_active() and not scene.is_visible() and not scene.is_hibernated():
+                count += scene.hibernate()
+        return count
+
+    def get_memory_report(self) -> dict[str, tuple[int, bool]]:
+        """Retourne, pour chaque scène, la mémoire de ses entités (en octets) et son état d'hibernation."""
+        return {scene.name: (scene.get_memory_usage(), scene.is_hibernated()) for scene in self.scenes}
+
+    def update_transition(self, dt: float) -> None:
+        """Fait avancer la transition en cours : chargement, échange des scènes puis fin de l'effet."""
+        transition = self.transition
+        loaded = self.transition_job.update()
+        self.transition_elapsed += dt
+        swap_time = transition.swap_point * transition.duration
+
+        if not self.transition_swapped:
+            if not loaded:
+                # L'effet attend la fin du chargement au point d'échange
+                self.transition_elapsed = min(self.transition_elapsed, swap_time)
+                return
+            if self.transition_elapsed >= swap_time:
+                self._swap_to_scene(self.transition_target)
+                self.draw_scenes()
+                self.incoming_snapshot = self.screen.copy()
+                self.transition_swapped = True
+
+        if self.transition_swapped and self.transition_elapsed >= transition.duration:
+            self.transition = None
+            self.transition_target = None
+            self.transition_job = None
+            self.outgoing_snapshot = None
+            self.incoming_snapshot = None
+
+    def get_transition_progress(self) -> float:
+        """Retourne l'avancement de la transition en cours (0.0 à 1.0)."""
+        if self.transition is None:
+            return 1.0
+        if self.transition.duration == 0:
+            return 1.0 if self.transition_swapped else 0.0
+        return min(1.0, self.transition_elapsed / self.transition.duration)
+
     def process_event(self, event: pygame.Event) -> None:
         """Traite les événements pour toutes les scènes."""
-        self.scenes[0].handle_event(event)
+        self.scenes[0].process_event(event)
     
+    def process_actions(self, actions: "rf.ActionState") -> None:
+        """Transmet les actions de la frame à la scène courante (sauf pendant une transition)."""
+        if self.scenes and self.transition is None:
+            self.scenes[0].process_actions(actions)
+
     def update(self, dt: float) -> None:
-        """Met à jour toutes les scènes actives."""
-        for scene in self.scenes:
-            if scene.is_active():
-                scene.do_update(dt)
+        """Met à jour toutes les scènes actives (figées pendant une transition)."""
+        if self.transition is not None:
+            # La transition avance en temps réel, même si le jeu est en pause
+            self.update_transition(rf.Time().unscaled_dt)
+            return
+        if self.scene_states_dirty:
+            self.update_scene_states()
+        if self.profiler.enabled:
+            for scene in self.active_scenes:
+                start = self.profiler.begin()
+                scene.do_update(dt * scene.time_scale)
+                self.profiler.end(f"update {scene.name}", start, "scene")
+            return
+        for scene in self.active_scenes:
+            scene.do_update(dt * scene.time_scale)
 
     def draw(self) -> None:
-        """Dessine toutes les scènes visibles."""
-        for scene in self.scenes:
-            if scene.is_visible():
-                scene.draw()
\ No newline at end of file
+        """Dessine toutes les scènes visibles, ou l'effet de transition en cours."""
+        if self.transition is not None:
+            self.transition.draw(self.screen, self.outgoing_snapshot, self.incoming_snapshot,
+                                 self.get_transition_progress())
+            return
+        self.draw_scenes()
+
+    def draw_scenes(self) -> None:
+        """Dessine toutes les scènes visibles, la scène courante en dernier (au-dessus)."""
+        if self.scene_states_dirty:
+            self.update_scene_states()
+        if self.profiler.enabled:
+            for scene in self.visible_scenes:
+                start = self.profiler.begin()
+                scene.draw()
+                self.profiler.end(f"draw {scene.name}", start, "scene")
+            return
+        for scene in self.visible_scenes:
+            scene.draw()
\ No newline at end of file
@@ -1,14 +1,18 @@
 import rootFramework as rf
 import pygame
+import os
 from typing import Self
 
 class Sprite(rf.Drawable):
     """Classe de base pour les sprites."""
-    
+    __slots__ = ("original_surface", "source_path", "released")
+
     def __init__(self, size: tuple[int, int] | None = None, path=None, visible: bool = True, convert_alpha: bool = True):
         super().__init__(convert_alpha=convert_alpha)
 
         self.original_surface: pygame.Surface = None
+        self.source_path: str | None = None # Image du ResourceManager, si chargée depuis un fichier
+        self.released: bool = False # Surfaces libérées par do_hibernate, reconstruites par do_wake
 
         if path is not None:
             self.from_path(path)
@@ -16,16 +20,25 @@ class Sprite(rf.Drawable):
             self.set_size(self.original_surface.get_size())
 
     def from_path(self, path: str) -> Self:
-        """Charge une image depuis un chemin donné."""
+        """Charge une image depuis un chemin donné (via le cache du ResourceManager)."""
+        if self.released:
+            self.do_wake()
+        resource_manager = rf.ResourceManager()
+        path = os.path.abspath(path)
         try:
-            self.original_surface = pygame.image.load(path).convert_alpha()
+            resource_manager.load_image(path)
+            self.original_surface = resource_manager.get_image(path)
+            self.source_path = path
             size = self.original_surface.get_size()
             self.set_size(size)
+            if resource_manager.hot_reload:
+                resource_manager.add_reload_listener(path, self._on_image_reloaded)
         except pygame.error as e:
             print(f"Erreur lors du chargement de l'image '{path}': {e}")
             # Créer une surface par défaut en cas d'erreur
             self.original_surface = pygame.Surface((50, 50))
             self.original_surface.fill((255, 0, 255))  # Magenta comme indicateur d'erreur
+            self.source_path = None
             self.set_size((50, 50))
         return self
 
@@ -34,7 +47,13 @@ class Sprite(rf.Drawable):
         if size == self.rect.size:
             return self
         self.rect.size = size
-        
+        self.build_surface()
+        return self
+
+    def build_surface(self) -> None:
+        """Crée la surface du sprite à la taille du rect depuis l'image source."""
+        if self.released:
+            return  # En hibernation : do_wake reconstruira la surface à la taille du rect
         self.surface = pygame.Surface(
             (int(self.rect.width), int(self.rect.height)), self.surface_flags
         )
@@ -44,13 +63,53 @@ class Sprite(rf.Drawable):
         self.surface.blit(
             pygame.transform.scale(self.original_surface, self.rect.size), (0, 0)
         )
-        return self
 
     def from_surface(self, surface: pygame.Surface) -> Self:
         """Charge un sprite à partir d'une surface."""
         if surface is None:
             return self
+        if self.released:
+            self.do_wake()
         self.original_surface = surface
+        self.source_path = None
         size = self.original_surface.get_size()
         self.set_size(size)
-        return self
\ No newline at end of file
+        return self
+
+    def do_hibernate(self) -> None:
+        """Libère la surface si l'image source peut être récupérée depuis le ResourceManager."""
+        if self.source_path is None or self.released:
+            return
+        self.original_surface = None
+        self.surface = None
+        self.released = True
+
+    def do_wake(self) -> None:
+        """Reconstruit la surface depuis le cache du ResourceManager (rechargée si évincée)."""
+        if not self.released:
+            return
+        self.released = False
+        resource_manager = rf.ResourceManager()
+        resource_manager.load_image(self.source_path)
+        self.original_surface = resource_manager.get_image(self.source_path)
+        self.build_surface()
+
+    def get_memory_usage(self) -> int:
+        usage = super().get_memory_usage()
+        if self.source_path is None and self.original_surface is not self.surface:
+            # Image source propre au sprite (hors cache du ResourceManager)
+            usage += self.get_surface_bytes(self.original_surface)
+        return usage
+
+    def _on_image_reloaded(self, path: str) -> None:
+        """Remplace l'image source en place après un rechargement à chaud."""
+        if self.released:
+            return  # En hibernation : do_wake reconstruira la surface depuis l'image rechargée
+        surface = rf.ResourceManager().get_image(path)
+        if surface is None:
+            return
+        self.original_surface = surface
+        self.surface.fill((0, 0, 0, 0 if self.convert_alpha else 255))
+        self.surface.blit(
+            pygame.transform.scale(self.original_surface, self.rect.size), (0, 0)
+        )
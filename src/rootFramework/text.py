@@ -0,0 +1,162 @@
+import rootFramework as rf
+import pygame
+from collections import OrderedDict
+from typing import Self
+
+class GlyphCache(metaclass=rf.Singleton):
+    """
+    Cache de glyphes pré-rendus, indexé par la clé de police du ResourceManager (chemin, taille)
+    puis par (couleur, anticrénelage). Seules les max_variants dernières variantes de couleur
+    d'une police sont conservées (LRU) ; les glyphes d'une police sont vidés à son rechargement.
+    """
+
+    def __init__(self, max_variants: int = 8):
+        self.max_variants: int = max_variants
+        self.glyphs: dict[tuple[str | None, int], OrderedDict[tuple, dict[str, pygame.Surface]]] = {}
+
+    def get_glyphs(self, font_key: tuple[str | None, int], color: tuple, antialias: bool) -> dict[str, pygame.Surface]:
+        """Retourne le dictionnaire caractère -> surface pour une police et une couleur."""
+        variants = self.glyphs.get(font_key)
+        if variants is None:
+            variants = self.glyphs[font_key] = OrderedDict()
+        key = (color, antialias)
+        glyphs = variants.get(key)
+        if glyphs is None:
+            glyphs = variants[key] = {}
+            if len(variants) > self.max_variants:
+                variants.popitem(last=False)
+        else:
+            variants.move_to_end(key)
+        return glyphs
+
+    def render(self, font_key: tuple[str | None, int], font: pygame.font.Font, text: str, color: tuple,
+               antialias: bool, target: pygame.Surface | None = None) -> pygame.Surface:
+        """Assemble un texte à partir des glyphes en cache (réutilise target si la taille correspond)."""
+        glyphs = self.get_glyphs(font_key, color, antialias)
+        surfaces = []
+        width = 0
+        for char in text:
+            glyph = glyphs.get(char)
+            if glyph is None:
+                glyph = glyphs[char] = font.render(char, antialias, color)
+            surfaces.append((glyph, (width, 0)))
+            width += glyph.get_width()
+
+        size = (max(1, width), font.get_height())
+        if target is None or target.get_size() != size:
+            target = pygame.Surface(size, pygame.SRCALPHA)
+        else:
+            target.fill((0, 0, 0, 0))
+        target.blits(surfaces, doreturn=False)
+        return target
+
+    def clear(self, path: str | None = None) -> None:
+        """Vide le cache de glyphes, ou seulement celui des polices d'un fichier (chemin complet)."""
+        if path is None:
+            self.glyphs.clear()
+            return
+        for font_key in [key for key in self.glyphs if key[0] == path]:
+            del self.glyphs[font_key]
+
+
+class Text(rf.Drawable):
+    """
+    Entité dessinable affichant du texte.
+    Le texte n'est re-rendu que lorsque la chaîne, la couleur ou la police change.
+    En mode glyphes, le texte est assemblé depuis des glyphes pré-rendus
+    (adapté aux compteurs qui changent à chaque frame).
+    """
+    __slots__ = ("text", "font_path", "font_size", "font_key", "font", "color", "antialias", "use_glyphs", "dirty")
+
+    def __init__(self,
+                 text: str = "",
+                 font_path: str | None = None,
+                 font_size: int | None = None,
+                 color: tuple = (255, 255, 255),
+                 antialias: bool = True,
+                 use_glyphs: bool = False,
+                 *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.text: str = text
+        self.font_path: str | None = font_path
+        self.font_size: int | None = font_size
+        self.font_key: tuple[str | None, int] = rf.ResourceManager().get_font_key(font_path, font_size)
+        self.font: pygame.font.Font = rf.ResourceManager().get_font(font_path, font_size)
+        self._follow_font(None, font_path)
+        self.color: tuple = tuple(pygame.Color(color))
+        self.antialias: bool = antialias
+        self.use_glyphs: bool = use_glyphs
+        self.dirty: bool = True
+        self.render()
+
+    def set_text(self, text) -> Self:
+        """Change le texte affiché (re-rendu seulement s'il a changé)."""
+        text = str(text)
+        if text != self.text:
+            self.text = text
+            self.dirty = True
+        return self
+
+    def set_color(self, color) -> Self:
+        """Change la couleur du texte."""
+        color = tuple(pygame.Color(color))
+        if color != self.color:
+            self.color = color
+            self.dirty = True
+        return self
+
+    def set_font(self, path: str | None = None, size: int | None = None) -> Self:
+        """Change la police du texte."""
+        font = rf.ResourceManager().get_font(path, size)
+        if font is not self.font:
+            self._follow_font(self.font_path, path)
+            self.font_path = path
+            self.font_size = size
+            self.font_key = rf.ResourceManager().get_font_key(path, size)
+            self.font = font
+            self.dirty = True
+        return self
+
+    def _follow_font(self, previous_path: str | None, path: str | None) -> None:
+        """Suit les rechargements à chaud de la nouvelle police (et plus ceux de l'ancienne)."""
+        resource_manager = rf.ResourceManager()
+        if previous_path is not None:
+            resource_manager.remove_reload_listener(previous_path, self._on_font_reloaded)
+        if path is not None and resource_manager.hot_reload:
+            resource_manager.add_reload_listener(path, self._on_font_reloaded)
+
+    def _on_font_reloaded(self, path: str) -> None:
+        """Recharge la police après un rechargement à chaud."""
+        if self.font_path is None or rf.ResourceManager().get_path(self.font_path) != path:
+            return
+        self.font = rf.ResourceManager().get_font(self.font_path, self.font_size)
+        self.dirty = True
+
+    def render(self) -> Self:
+        """Re-rend la surface du texte si nécessaire."""
+        if not self.dirty:
+            return self
+        if self.use_glyphs:
+            self.surface = GlyphCache().render(self.font_key, self.font, self.text, self.color, self.antialias, self.surface)
+        else:
+            self.surface = self.font.render(self.text, self.antialias, self.color)
+        self.rect.size = self.surface.get_size()
+        self.dirty = False
+        return self
+
+    def do_hibernate(self) -> None:
+        """Libère la surface rendue (re-rendue au réveil)."""
+        self.surface = None
+        self.dirty = True
+
+    def do_wake(self) -> None:
+        self.render()
+
+    def update(self, dt: float):
+        """Met à jour le rendu du texte."""
+        self.render()
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Dessine le texte sur la surface donnée."""
+        self.render()
+        super().draw(surface)
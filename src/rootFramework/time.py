@@ -1,98 +1,318 @@
 import rootFramework as rf
 import pygame
+import heapq
+from typing import Callable, Generator
 
 class Timer:
     """Classe pour gérer un minuteur dans le jeu"""
 
-    def __init__(self, name: str, duration: int = 1000, 
-                 loop: bool = False, end_callback = None, reusable: bool = False):
-        """Initialise un minuteur avec 
-            un nom, 
-            une durée (ms), 
+    def __init__(self, name: str, duration: int = 1000,
+                 loop: bool = False, end_callback = None, reusable: bool = False,
+                 unscaled: bool = False):
+        """Initialise un minuteur avec
+            un nom,
+            une durée (ms),
             un booléen si le minuteur se relance,
             une fonction appelée quand le timer se termine,
-            un booléen pour savoir si le minuteur est réutilisable."""
+            un booléen pour savoir si le minuteur est réutilisable,
+            un booléen pour suivre le temps réel plutôt que le temps de jeu (pause, échelle)."""
         self.name: str = name
         self.duration: int = duration
         self.loop: bool = loop
         self.end_callback = end_callback
         self.reusable: bool = reusable
+        self.unscaled: bool = unscaled
 
         self.start_time = None
         self.stopped = True
-        self.elapsed_progress: float = 0.0
+        self.finished = False
+        self.stopped_progress: float = 0.0
+        self.schedule_entry: list | None = None  # Entrée dans l'échéancier de Time
 
     def start(self):
         """Démarre le minuteur."""
-        if self.start_time is None:
-            Time().add_timer(self)
-
-        self.start_time = pygame.time.get_ticks()
+        time = Time()
+        self.start_time = time.get_time(self.unscaled)
         self.stopped = False
-        self.elapsed_progress = 0.0
+        self.finished = False
+        time.add_timer(self)
+        time.schedule_timer(self, self.start_time + max(1, self.duration))
 
-    def update(self):
-        """Met à jour le minuteur."""
-        if self.stopped:
-            return False
-        
-        current_time = pygame.time.get_ticks()
-        if self.elapsed_progress < 1:
-            self.elapsed_progress = (current_time - self.start_time) / self.duration
-            if self.elapsed_progress >= 1:
-                self.end()
-                return True
-        elif self.loop:
-            self.start()
-        return False
-    
     def stop(self):
         """Arrête le minuteur."""
+        if self.stopped:
+            return
+        self.stopped_progress = self.elapsed_progress
         self.stopped = True
+        Time().unschedule_timer(self)
 
     def end(self):
         """Appelle la fonction de fin du minuteur."""
-        self.elapsed_progress = 1.0
         if not self.loop:
             self.stopped = True
+            self.finished = True
+            Time().unschedule_timer(self)
         if self.end_callback:
             self.end_callback()
 
+    @property
+    def elapsed_progress(self) -> float:
+        """Avancement du timer, calculé à la demande."""
+        if self.finished:
+            return 1.0
+        if self.stopped or self.start_time is None:
+            return self.stopped_progress
+        return (Time().get_time(self.unscaled) - self.start_time) / max(1, self.duration)
+
     def is_finished(self) -> bool:
         """Vérifie si le minuteur est terminé."""
         if self.start_time is None:
             return False
         # Un timer est fini s'il n'est pas en boucle et que le temps est écoulé
-        return not self.loop and self.elapsed_progress >= 1.0
+        return not self.loop and self.finished
 
     def get_progress(self) -> float:
         """Retourne le pourcentage d'avancement du timer (0.0 à 1.0)."""
         return min(self.elapsed_progress, 1.0)
-    
+
     def get_remaining_time(self) -> int:
         """Retourne le temps restant en millisecondes."""
         if self.is_finished():
             return 0
-        return max(0, self.duration - int(self.elapsed_progress * self.duration))
+        return max(0, self.duration - int(self.get_progress() * self.duration))
+
+class WaitFrames:
+    """Instruction de coroutine : attend un nombre de frames."""
+
+    def __init__(self, frames: int = 1):
+        self.frames: int = max(1, frames)
+
+class WaitUntil:
+    """Instruction de coroutine : attend qu'une condition soit vraie (évaluée une fois par frame)."""
+
+    def __init__(self, condition: Callable[[], bool]):
+        self.condition = condition
+
+class Coroutine:
+    """
+    Coroutine planifiée par Time à partir d'un générateur.
+    Le générateur peut céder :
+        None            -> reprise à la frame suivante
+        un nombre       -> attente en secondes (temps de jeu, ou réel si unscaled) ;
+                           0 ou moins équivaut à None
+        WaitFrames(n)   -> attente de n frames
+        WaitUntil(f)    -> attente jusqu'à ce que f() soit vrai
+        une Coroutine   -> attente de la fin de cette coroutine
+    """
+
+    def __init__(self, generator: Generator, unscaled: bool = False):
+        self.generator: Generator = generator
+        self.unscaled: bool = unscaled
+        self.finished: bool = False
+        self.schedule_entry: list | None = None
+        self.waiters: list["Coroutine"] = []
+
+    def stop(self) -> None:
+        """Arrête la coroutine."""
+        Time().stop_coroutine(self)
+
+    def is_finished(self) -> bool:
+        """Vérifie si la coroutine est terminée."""
+        return self.finished
 
 class Time(metaclass=rf.Singleton):
-    """Classe pour gérer le temps dans le jeu."""
+    """
+    Classe pour gérer le temps dans le jeu.
+    Time possède une horloge virtuelle avancée par le dt du gestionnaire,
+    avec une échelle de temps globale et une pause. Les minuteurs sont rangés
+    dans un tas trié par échéance : seuls ceux arrivés à échéance sont traités.
+    """
 
     def __init__(self):
-        self.timers = {}
+        self.timers: dict[str, Timer] = {}
+        self.schedule: list[list] = []       # Tas de [échéance, séquence, timer] (temps de jeu)
+        self.real_schedule: list[list] = []  # Idem pour les minuteurs en temps réel
+        self.frame_schedule: list[list] = [] # Tas de [frame, séquence, coroutine]
+        self.conditions: list[tuple[Callable[[], bool], Coroutine]] = []
+        self.tweens: rf.TweenEngine | None = None  # Créé au premier tween (NumPy chargé à la demande)
+        self.sequence: int = 0
+
+        self.current_time: float = 0.0  # Temps de jeu (ms), affecté par l'échelle et la pause
+        self.real_time: float = 0.0     # Temps réel écoulé (ms)
+        self.time_scale: float = 1.0
+        self.paused: bool = False
+        self.dt: float = 0.0             # Dernier dt de jeu (s)
+        self.unscaled_dt: float = 0.0    # Dernier dt réel (s)
+        self.frame_count: int = 0
+        self.last_ticks: int | None = None
+
+    def get_time(self, unscaled: bool = False) -> float:
+        """Retourne le temps de jeu courant (ms), ou le temps réel si unscaled."""
+        return self.real_time if unscaled else self.current_time
+
+    def set_time_scale(self, scale: float) -> None:
+        """Définit l'échelle de temps globale (1.0 = normal, 0.5 = ralenti, 20.0 = accéléré)."""
+        self.time_scale = max(0.0, scale)
+
+    def get_time_scale(self) -> float:
+        """Retourne l'échelle de temps globale."""
+        return self.time_scale
 
-    def add_timer(self, timer):
+    def pause(self) -> None:
+        """Met le temps de jeu en pause."""
+        self.paused = True
+
+    def resume(self) -> None:
+        """Reprend le temps de jeu."""
+        self.paused = False
+
+    def is_paused(self) -> bool:
+        """Vérifie si le temps de jeu est en pause."""
+        return self.paused
+
+    def add_timer(self, timer: Timer):
         """Ajoute un minuteur à la liste des minuteurs."""
         self.timers[timer.name] = timer
 
-    def update(self):
-        """Met à jour tous les minuteurs."""
-        for timer in list(self.timers.values()):
-            timer.update()
-
-        # Retirer les timers finis qui ne sont pas réutilisables
-        removed_timers = [name for name, timer in self.timers.items() 
-                         if timer.is_finished() and not timer.reusable]
-        
-        for name in removed_timers:
-            self.timers.pop(name)
\ No newline at end of file
+    def schedule_timer(self, timer: Timer, deadline: float) -> None:
+        """Planifie la fin d'un minuteur à une échéance donnée (ms)."""
+        self.unschedule_timer(timer)
+        self._push(self.real_schedule if timer.unscaled else self.schedule, deadline, timer)
+
+    def unschedule_timer(self, timer: Timer) -> None:
+        """Annule l'échéance d'un minuteur (suppression paresseuse dans le tas)."""
+        if timer.schedule_entry is not None:
+            timer.schedule_entry[2] = None
+            timer.schedule_entry = None
+
+    def tween(self, target, attribute: str, end: float, duration: float,
+              easing: str = "linear", start: float | None = None, delay: float = 0.0,
+              on_complete: Callable[[], None] | None = None) -> "rf.Tween":
+        """Anime un attribut numérique vers une valeur finale (durée en secondes de jeu)."""
+        if self.tweens is None:
+            self.tweens = rf.TweenEngine()
+        return self.tweens.add(target, attribute, end, duration, easing, start, delay, on_complete)
+
+    def start_coroutine(self, generator: Generator, unscaled: bool = False) -> Coroutine:
+        """Démarre une coroutine : elle s'exécute immédiatement jusqu'à sa première attente."""
+        coroutine = Coroutine(generator, unscaled)
+        self._resume(coroutine)
+        return coroutine
+
+    def stop_coroutine(self, coroutine: Coroutine) -> None:
+        """Arrête une coroutine et réveille celles qui l'attendent."""
+        if coroutine.finished:
+            return
+        if coroutine.schedule_entry is not None:
+            coroutine.schedule_entry[2] = None
+            coroutine.schedule_entry = None
+        coroutine.generator.close()
+        self._finish(coroutine)
+
+    def _push(self, schedule: list[list], key: float, item) -> None:
+        """Ajoute une entrée dans un échéancier."""
+        entry = [key, self.sequence, item]
+        self.sequence += 1
+        item.schedule_entry = entry
+        heapq.heappush(schedule, entry)
+
+    def _resume(self, coroutine: Coroutine) -> None:
+        """Reprend une coroutine jusqu'à sa prochaine attente."""
+        coroutine.schedule_entry = None
+        try:
+            instruction = coroutine.generator.send(None)
+        except StopIteration:
+            self._finish(coroutine)
+            return
+
+        if instruction is None:
+            self._push(self.frame_schedule, self.frame_count + 1, coroutine)
+        elif isinstance(instruction, (int, float)):
+            if coroutine.unscaled:
+                schedule, now = self.real_schedule, self.real_time
+            else:
+                schedule, now = self.schedule, self.current_time
+            deadline = now + instruction * 1000.0
+            if deadline <= now:
+                # Attente nulle ou négative : reprise à la frame suivante (pas dans le passage en cours)
+                self._push(self.frame_schedule, self.frame_count + 1, coroutine)
+            else:
+                self._push(schedule, deadline, coroutine)
+        elif isinstance(instruction, WaitFrames):
+            self._push(self.frame_schedule, self.frame_count + instruction.frames, coroutine)
+        elif isinstance(instruction, WaitUntil):
+            self.conditions.append((instruction.condition, coroutine))
+        elif isinstance(instruction, Coroutine):
+            if instruction.finished:
+                self._push(self.frame_schedule, self.frame_count + 1, coroutine)
+            else:
+                instruction.waiters.append(coroutine)
+        else:
+            coroutine.generator.close()
+            self._finish(coroutine)
+            raise TypeError(f"Unsupported coroutine instruction: {instruction!r}")
+
+    def _finish(self, coroutine: Coroutine) -> None:
+        """Marque une coroutine comme terminée et reprogramme celles qui l'attendent."""
+        coroutine.finished = True
+        for waiter in coroutine.waiters:
+            if not waiter.finished:
+                self._push(self.frame_schedule, self.frame_count, waiter)
+        coroutine.waiters.clear()
+
+    def update(self, dt: float | None = None) -> float:
+        """
+        Avance l'horloge et met à jour les minuteurs arrivés à échéance.
+
+        dt : temps réel écoulé (s) ; s'il est None, il est mesuré avec pygame.time.get_ticks()
+        Retourne le dt de jeu (mis à l'échelle, nul en pause).
+        """
+        if dt is None:
+            ticks = pygame.time.get_ticks()
+            dt = 0.0 if self.last_ticks is None else (ticks - self.last_ticks) / 1000.0
+            self.last_ticks = ticks
+
+        self.unscaled_dt = dt
+        self.dt = 0.0 if self.paused else dt * self.time_scale
+        self.real_time += dt * 1000.0
+        self.current_time += self.dt * 1000.0
+        self.frame_count += 1
+
+        self._process(self.real_schedule, self.real_time)
+        self._process(self.schedule, self.current_time)
+        self._process(self.frame_schedule, self.frame_count)
+
+        if self.conditions:
+            waiting = self.conditions
+            self.conditions = []
+            for condition, coroutine in waiting:
+                if coroutine.finished:
+                    continue
+                if condition():
+                    self._resume(coroutine)
+                else:
+                    self.conditions.append((condition, coroutine))
+
+        if self.tweens is not None:
+            self.tweens.update(self.dt)
+        return self.dt
+
+    def _process(self, schedule: list[list], now: float) -> None:
+        """Traite les minuteurs et coroutines d'un échéancier arrivés à échéance."""
+        while schedule and schedule[0][0] <= now:
+            deadline, _, timer = heapq.heappop(schedule)
+            if timer is None:
+                continue
+            if isinstance(timer, Coroutine):
+                self._resume(timer)
+                continue
+            timer.schedule_entry = None
+            if timer.loop:
+                # Relance sans dérive à partir de l'échéance théorique
+                timer.start_time = deadline
+                self.schedule_timer(timer, deadline + max(1, timer.duration))
+            timer.end()
+
+            # Retirer les timers finis qui ne sont pas réutilisables
+            if timer.is_finished() and not timer.reusable and self.timers.get(timer.name) is timer:
+                del self.timers[timer.name]
@@ -0,0 +1,59 @@
+import pygame
+import rootFramework as rf
+
+class Transition:
+    """
+    Effet de transition entre deux scènes, composé à partir d'instantanés
+    de la scène sortante et de la scène entrante.
+    """
+
+    # Avancement auquel l'échange des scènes a lieu : l'effet y reste bloqué
+    # tant que les ressources de la scène entrante ne sont pas chargées.
+    swap_point: float = 0.5
+
+    def __init__(self, duration: float = 0.5):
+        self.duration: float = max(0.0, duration)
+
+    def draw(self, screen: pygame.Surface, outgoing: pygame.Surface,
+             incoming: pygame.Surface | None, progress: float) -> None:
+        """Compose l'image de la transition pour un avancement donné (0.0 à 1.0)."""
+        screen.blit(outgoing if incoming is None or progress < self.swap_point else incoming, (0, 0))
+
+
+class FadeTransition(Transition):
+    """Fondu vers une couleur, puis depuis cette couleur vers la nouvelle scène."""
+
+    swap_point = 0.5
+
+    def __init__(self, duration: float = 0.5, color: tuple = (0, 0, 0)):
+        super().__init__(duration)
+        self.color = color
+        self.overlay: pygame.Surface | None = None
+
+    def draw(self, screen, outgoing, incoming, progress) -> None:
+        if self.overlay is None or self.overlay.get_size() != screen.get_size():
+            self.overlay = pygame.Surface(screen.get_size())
+            self.overlay.fill(self.color)
+        if incoming is None or progress < self.swap_point:
+            screen.blit(outgoing, (0, 0))
+            alpha = progress / self.swap_point
+        else:
+            screen.blit(incoming, (0, 0))
+            alpha = (1.0 - progress) / (1.0 - self.swap_point)
+        self.overlay.set_alpha(round(255 * min(1.0, max(0.0, alpha))))
+        screen.blit(self.overlay, (0, 0))
+
+
+class CrossFadeTransition(Transition):
+    """Fondu enchaîné : la scène sortante s'efface au-dessus de la scène entrante."""
+
+    swap_point = 0.0
+
+    def draw(self, screen, outgoing, incoming, progress) -> None:
+        if incoming is None:
+            screen.blit(outgoing, (0, 0))
+            return
+        screen.blit(incoming, (0, 0))
+        outgoing.set_alpha(round(255 * (1.0 - progress)))
+        screen.blit(outgoing, (0, 0))
+        outgoing.set_alpha(None)
@@ -0,0 +1,192 @@
+import numpy as np
+from typing import Any, Callable
+
+def _in_out_quad(t: np.ndarray) -> np.ndarray:
+    return np.where(t < 0.5, 2 * t * t, 1 - (-2 * t + 2) ** 2 / 2)
+
+def _in_out_cubic(t: np.ndarray) -> np.ndarray:
+    return np.where(t < 0.5, 4 * t ** 3, 1 - (-2 * t + 2) ** 3 / 2)
+
+def _out_back(t: np.ndarray) -> np.ndarray:
+    c1 = 1.70158
+    return 1 + (c1 + 1) * (t - 1) ** 3 + c1 * (t - 1) ** 2
+
+# Fonctions d'interpolation vectorisées (t dans [0, 1])
+EASINGS: dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "linear": lambda t: t,
+    "in_quad": lambda t: t * t,
+    "out_quad": lambda t: t * (2 - t),
+    "in_out_quad": _in_out_quad,
+    "in_cubic": lambda t: t ** 3,
+    "out_cubic": lambda t: 1 - (1 - t) ** 3,
+    "in_out_cubic": _in_out_cubic,
+    "in_sine": lambda t: 1 - np.cos(t * np.pi / 2),
+    "out_sine": lambda t: np.sin(t * np.pi / 2),
+    "in_out_sine": lambda t: -(np.cos(np.pi * t) - 1) / 2,
+    "out_back": _out_back,
+}
+EASING_NAMES: list[str] = list(EASINGS)
+EASING_FUNCTIONS: list[Callable[[np.ndarray], np.ndarray]] = list(EASINGS.values())
+
+
+class Tween:
+    """Poignée vers une interpolation gérée par un TweenEngine."""
+
+    __slots__ = ("engine", "slot", "generation")
+
+    def __init__(self, engine: "TweenEngine", slot: int, generation: int):
+        self.engine = engine
+        self.slot = slot
+        self.generation = generation
+
+    def is_active(self) -> bool:
+        """Vérifie si l'interpolation est toujours en cours."""
+        return self.engine.generations[self.slot] == self.generation
+
+    def is_finished(self) -> bool:
+        """Vérifie si l'interpolation est terminée (ou annulée)."""
+        return not self.is_active()
+
+    def cancel(self) -> None:
+        """Annule l'interpolation sans appliquer la valeur finale."""
+        if self.is_active():
+            self.engine.release(self.slot)
+
+
+class TweenEngine:
+    """
+    Moteur d'interpolation de propriétés numériques.
+    Les pistes actives sont stockées dans des tableaux NumPy : l'avancement et les
+    valeurs de toutes les interpolations sont calculés en une passe vectorisée,
+    puis réécrites en bloc. Les emplacements des interpolations terminées sont recyclés.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = 0
+        self.count = 0  # Nombre d'emplacements utilisés (actifs ou libres)
+        self.active_count = 0
+        self.free_slots: list[int] = []
+
+        self.start = np.empty(0)
+        self.delta = np.empty(0)
+        self.duration = np.empty(0)
+        self.elapsed = np.empty(0)
+        self.easing = np.empty(0, dtype=np.int16)
+        self.active = np.empty(0, dtype=bool)
+
+        self.owners: list[Any] = []
+        self.attributes: list[str | None] = []
+        self.callbacks: list[Callable[[], None] | None] = []
+        self.generations: list[int] = []
+        self._grow(capacity)
+
+    def _grow(self, capacity: int) -> None:
+        """Agrandit les tableaux de stockage."""
+        extra = capacity - self.capacity
+        self.start = np.concatenate((self.start, np.zeros(extra)))
+        self.delta = np.concatenate((self.delta, np.zeros(extra)))
+        self.duration = np.concatenate((self.duration, np.ones(extra)))
+        self.elapsed = np.concatenate((self.elapsed, np.zeros(extra)))
+        self.easing = np.concatenate((self.easing, np.zeros(extra, dtype=np.int16)))
+        self.active = np.concatenate((self.active, np.zeros(extra, dtype=bool)))
+        self.owners.extend([None] * extra)
+        self.attributes.extend([None] * extra)
+        self.callbacks.extend([None] * extra)
+        self.generations.extend([0] * extra)
+        self.capacity = capacity
+
+    def add(self,
+            target: Any,
+            attribute: str,
+            end: float,
+            duration: float,
+            easing: str = "linear",
+            start: float | None = None,
+            delay: float = 0.0,
+            on_complete: Callable[[], None] | None = None) -> Tween:
+        """
+        Ajoute une interpolation.
+
+        target      : objet à animer
+        attribute   : nom de l'attribut, éventuellement pointé ("rect.x", "pos.y")
+        end         : valeur finale
+        duration    : durée (s)
+        easing      : nom de la fonction d'interpolation (voir EASINGS)
+        start       : valeur de départ (par défaut, la valeur courante)
+        delay       : délai avant le début (s)
+        on_complete : fonction appelée à la fin
+        """
+        if easing not in EASINGS:
+            raise ValueError(f"Unknown easing '{easing}'.")
+        *path, name = attribute.split(".")
+        owner = target
+        for part in path:
+            owner = getattr(owner, part)
+        if start is None:
+            start = getattr(owner, name)
+
+        if self.free_slots:
+            slot = self.free_slots.pop()
+        else:
+            if self.count == self.capacity:
+                self._grow(max(64, self.capacity * 2))
+            slot = self.count
+            self.count += 1
+
+        self.start[slot] = start
+        self.delta[slot] = end - start
+        self.duration[slot] = max(duration, 1e-9)
+        self.elapsed[slot] = -delay
+        self.easing[slot] = EASING_NAMES.index(easing)
+        self.active[slot] = True
+        self.owners[slot] = owner
+        self.attributes[slot] = name
+        self.callbacks[slot] = on_complete
+        self.active_count += 1
+        return Tween(self, slot, self.generations[slot])
+
+    def release(self, slot: int) -> None:
+        """Libère un emplacement pour qu'il soit réutilisé."""
+        self.active[slot] = False
+        self.owners[slot] = None
+        self.callbacks[slot] = None
+        self.generations[slot] += 1
+        self.free_slots.append(slot)
+        self.active_count -= 1
+
+    def clear(self) -> None:
+        """Annule toutes les interpolations."""
+        for slot in np.flatnonzero(self.active[:self.count]).tolist():
+            self.release(slot)
+
+    def update(self, dt: float) -> None:
+        """Fait avancer toutes les interpolations actives en une passe vectorisée."""
+        if not self.active_count:
+            return
+        n = self.count
+        active = self.active[:n]
+        elapsed = self.elapsed[:n]
+        np.add(elapsed, dt, out=elapsed, where=active)
+
+        running = active & (elapsed >= 0)
+        indices = np.flatnonzero(running)
+        if not len(indices):
+            return
+        progress = np.minimum(elapsed[indices] / self.duration[indices], 1.0)
+        eased = np.empty_like(progress)
+        easing = self.easing[indices]
+        for easing_id in np.unique(easing).tolist():
+            mask = easing == easing_id
+            eased[mask] = EASING_FUNCTIONS[easing_id](progress[mask])
+        values = self.start[indices] + self.delta[indices] * eased
+
+        owners = self.owners
+        attributes = self.attributes
+        for slot, value in zip(indices.tolist(), values.tolist()):
+            setattr(owners[slot], attributes[slot], value)
+
+        for slot in indices[progress >= 1.0].tolist():
+            callback = self.callbacks[slot]
+            self.release(slot)
+            if callback:
+                callback()